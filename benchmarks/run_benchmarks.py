@@ -0,0 +1,354 @@
+'''
+    This file is part of PM4Py (More Info: https://pm4py.fit.fraunhofer.de).
+
+    PM4Py is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    PM4Py is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
+'''
+import argparse
+from copy import copy
+import gc
+import inspect
+import json
+import os
+import platform
+import random
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+
+# the progress bars would pollute the output of the benchmarks (honored by recent versions of tqdm)
+os.environ.setdefault("TQDM_DISABLE", "1")
+
+# number of traces of the synthetic logs, per scale
+SCALES = {"small": 100, "medium": 1000, "large": 10000}
+
+# probability that a trace of the synthetic logs is altered (removal/swap/insertion of an event)
+NOISE_PROBABILITY = 0.2
+
+# the benchmarks that are too expensive for the largest logs are executed only on the listed scales
+ALIGNMENT_SCALES = {"small"}
+
+
+def generate_log(no_traces, seed=0):
+    """
+    Generates a synthetic log, playing out a random process tree, and adds some noise to it
+
+    Parameters
+    --------------
+    no_traces
+        Number of traces of the log
+    seed
+        Seed of the random number generators (the same seed gives the same log)
+
+    Returns
+    --------------
+    log
+        Event log
+    tree
+        Process tree used to generate the log
+    """
+    import numpy as np
+    from pm4py.algo.simulation.tree_generator import simulator as tree_gen
+    from pm4py.algo.simulation.playout import simulator as playout
+    from pm4py.objects.conversion.process_tree import converter as pt_converter
+    from pm4py.objects.log.log import Trace
+    from pm4py.algo.simulation.tree_generator.variants.ptandloggenerator import Parameters as TreeParameters
+
+    random.seed(seed)
+    np.random.seed(seed)
+
+    tree = tree_gen.apply(variant=tree_gen.Variants.PTANDLOGGENERATOR,
+                          parameters={TreeParameters.MODE: 15, TreeParameters.MIN: 10, TreeParameters.MAX: 20})
+    net, im, fm = pt_converter.apply(tree)
+    log = playout.apply(net, im, final_marking=fm, variant=playout.Variants.BASIC_PLAYOUT,
+                        parameters={playout.Variants.BASIC_PLAYOUT.value.Parameters.NO_TRACES: no_traces})
+
+    for index, trace in enumerate(log):
+        if len(trace) > 1 and random.random() < NOISE_PROBABILITY:
+            events = list(trace)
+            i = random.randrange(len(events) - 1)
+            action = random.randrange(3)
+            if action == 0:
+                del events[i]
+            elif action == 1:
+                events[i], events[i + 1] = events[i + 1], events[i]
+            else:
+                events.insert(i, copy(events[random.randrange(len(events))]))
+            log[index] = Trace(events, attributes=trace.attributes)
+
+    return log, tree
+
+
+class Benchmark(object):
+    """
+    Benchmark of an entry point: the setup function prepares the input (from the synthetic log of a given scale)
+    and is not timed, the target function is the timed part
+    """
+
+    def __init__(self, name, setup, target, scales=None):
+        self.name = name
+        self.setup = setup
+        self.target = target
+        self.scales = scales
+
+
+def __setup_xes_file(context):
+    return context["xes_path"]
+
+
+def __setup_log(context):
+    return context["log"]
+
+
+def __setup_dataframe(context):
+    import pm4py
+    return pm4py.convert_to_dataframe(context["log"])
+
+
+def __setup_log_and_model(context):
+    import pm4py
+    net, im, fm = pm4py.convert_to_petri_net(context["tree"])
+    return context["log"], net, im, fm
+
+
+def __import_xes(variant_name):
+    def target(path):
+        from pm4py.objects.log.importer.xes import importer as xes_importer
+        variant = getattr(xes_importer.Variants, variant_name)
+        return xes_importer.apply(path, variant=variant, parameters={"show_progress_bar": False})
+
+    return target
+
+
+def __discover(function_name):
+    def target(log):
+        import pm4py
+        return getattr(pm4py, function_name)(log)
+
+    return target
+
+
+def __conformance(function_name):
+    def target(args):
+        import pm4py
+        return getattr(pm4py, function_name)(*args)
+
+    return target
+
+
+def __pandas_dfg(df):
+    from pm4py.algo.discovery.dfg.adapters.pandas import df_statistics
+    return df_statistics.get_dfg_graph(df, measure="frequency")
+
+
+def get_benchmarks():
+    """
+    Gets the list of the benchmarks of the suite
+
+    Returns
+    --------------
+    benchmarks
+        List of benchmarks
+    """
+    from pm4py.objects.log.importer.xes import importer as xes_importer
+
+    benchmarks = []
+    for variant in xes_importer.Variants:
+        benchmarks.append(Benchmark("import_xes_" + variant.name.lower(), __setup_xes_file, __import_xes(variant.name)))
+    for function_name in ["discover_dfg", "discover_petri_net_alpha", "discover_petri_net_inductive",
+                          "discover_petri_net_heuristics", "discover_process_tree_inductive"]:
+        benchmarks.append(Benchmark(function_name, __setup_log, __discover(function_name)))
+    benchmarks.append(Benchmark("discover_dfg_pandas", __setup_dataframe, __pandas_dfg))
+    benchmarks.append(Benchmark("conformance_diagnostics_token_based_replay", __setup_log_and_model,
+                                __conformance("conformance_diagnostics_token_based_replay")))
+    benchmarks.append(Benchmark("conformance_diagnostics_alignments", __setup_log_and_model,
+                                __conformance("conformance_diagnostics_alignments"), scales=ALIGNMENT_SCALES))
+    return benchmarks
+
+
+def run_benchmark(benchmark, context, repeat=3):
+    """
+    Executes a benchmark, measuring the execution time (repeat times) and the peak of the allocated memory
+    (in a further, separate, execution, since tracing the allocations slows down the code)
+
+    Parameters
+    --------------
+    benchmark
+        Benchmark
+    context
+        Inputs of the given scale (synthetic log, process tree, path of the XES file)
+    repeat
+        Number of timed executions
+
+    Returns
+    --------------
+    result
+        Dictionary containing the measurements
+    """
+    argument = benchmark.setup(context)
+    times = []
+    for i in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        benchmark.target(argument)
+        times.append(time.perf_counter() - start)
+
+    gc.collect()
+    tracemalloc.start()
+    benchmark.target(argument)
+    peak_memory = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    return {"time_min": min(times), "time_median": statistics.median(times), "time_max": max(times),
+            "peak_memory": peak_memory, "repeat": repeat}
+
+
+def get_environment():
+    """
+    Describes the environment in which the benchmarks are executed
+    """
+    import pm4py
+    import numpy
+    import pandas
+
+    return {"python": platform.python_version(), "platform": platform.platform(), "processor": platform.processor(),
+            "pm4py": pm4py.__version__, "numpy": numpy.__version__, "pandas": pandas.__version__}
+
+
+def run(scales, repeat=3, only=None, seed=0):
+    """
+    Runs the benchmark suite
+
+    Parameters
+    --------------
+    scales
+        Scales (keys of SCALES) to consider
+    repeat
+        Number of timed executions of each benchmark
+    only
+        (If provided) substring that the names of the executed benchmarks should contain
+    seed
+        Seed used to generate the synthetic logs
+
+    Returns
+    --------------
+    report
+        Machine-readable report of the execution
+    """
+    from pm4py.objects.log.exporter.xes import exporter as xes_exporter
+
+    report = {"environment": get_environment(), "seed": seed, "repeat": repeat, "results": []}
+    temp_dir = tempfile.mkdtemp()
+    try:
+        for scale in scales:
+            log, tree = generate_log(SCALES[scale], seed=seed)
+            xes_path = os.path.join(temp_dir, "log_" + scale + ".xes")
+            xes_exporter.apply(log, xes_path, parameters={"show_progress_bar": False})
+            context = {"log": log, "tree": tree, "xes_path": xes_path}
+            for benchmark in get_benchmarks():
+                if only is not None and only not in benchmark.name:
+                    continue
+                if benchmark.scales is not None and scale not in benchmark.scales:
+                    continue
+                result = run_benchmark(benchmark, context, repeat=repeat)
+                result["benchmark"] = benchmark.name
+                result["scale"] = scale
+                result["no_traces"] = len(log)
+                result["no_events"] = sum(len(trace) for trace in log)
+                report["results"].append(result)
+                print("%-45s %-7s median %10.4fs  peak memory %10.2f MB" % (
+                    benchmark.name, scale, result["time_median"], result["peak_memory"] / (1024 * 1024)),
+                      flush=True)
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+    return report
+
+
+def compare(report, baseline, time_tolerance=0.2, memory_tolerance=0.2):
+    """
+    Compares the results of an execution with the ones of a baseline
+
+    Parameters
+    --------------
+    report
+        Report of the current execution
+    baseline
+        Report of the baseline execution
+    time_tolerance
+        Tolerated relative increase of the median execution time
+    memory_tolerance
+        Tolerated relative increase of the peak memory
+
+    Returns
+    --------------
+    regressions
+        List of the measurements that exceed the tolerance (benchmark, scale, measure, baseline value, current value)
+    """
+    baseline_results = {(x["benchmark"], x["scale"]): x for x in baseline["results"]}
+    regressions = []
+    for result in report["results"]:
+        key = (result["benchmark"], result["scale"])
+        if key not in baseline_results:
+            continue
+        for measure, tolerance in [("time_median", time_tolerance), ("peak_memory", memory_tolerance)]:
+            before = baseline_results[key][measure]
+            after = result[measure]
+            if before > 0 and after > before * (1.0 + tolerance):
+                regressions.append((key[0], key[1], measure, before, after))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark suite of the discovery and conformance checking hot paths")
+    parser.add_argument("--scales", default="small,medium", help="comma-separated scales among: " + ", ".join(SCALES))
+    parser.add_argument("--repeat", type=int, default=3, help="number of timed executions of each benchmark")
+    parser.add_argument("--only", default=None, help="executes only the benchmarks containing the given string")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the synthetic logs")
+    parser.add_argument("--output", default=None, help="path of the JSON file in which the results are saved")
+    parser.add_argument("--baseline", default=None, help="path of a JSON file with the results to compare with")
+    parser.add_argument("--time-tolerance", type=float, default=0.2, help="tolerated relative increase of the time")
+    parser.add_argument("--memory-tolerance", type=float, default=0.2,
+                        help="tolerated relative increase of the peak memory")
+    args = parser.parse_args(argv)
+
+    scales = [x.strip() for x in args.scales.split(",") if x.strip()]
+    for scale in scales:
+        if scale not in SCALES:
+            parser.error("unknown scale: " + scale)
+
+    report = run(scales, repeat=args.repeat, only=args.only, seed=args.seed)
+
+    if args.output is not None:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+
+    if args.baseline is not None:
+        with open(args.baseline, "r") as f:
+            baseline = json.load(f)
+        regressions = compare(report, baseline, time_tolerance=args.time_tolerance,
+                              memory_tolerance=args.memory_tolerance)
+        for benchmark, scale, measure, before, after in regressions:
+            print("REGRESSION %s (%s) %s: %.4f -> %.4f (%+.1f%%)" % (benchmark, scale, measure, before, after,
+                                                                    100.0 * (after - before) / before))
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    current_dir = os.path.dirname(os.path.abspath(inspect.getfile(inspect.currentframe())))
+    sys.path.insert(0, os.path.dirname(current_dir))
+    sys.exit(main())
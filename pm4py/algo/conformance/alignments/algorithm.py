@@ -15,6 +15,9 @@
     along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
 '''
 from copy import copy
+import importlib
+import pickle
+from concurrent.futures import ProcessPoolExecutor, as_completed
 
 from pm4py.algo.conformance.alignments import variants
 from pm4py.objects.petri import align_utils
@@ -24,7 +27,7 @@ from pm4py.util.xes_constants import DEFAULT_NAME_KEY, DEFAULT_TRACEID_KEY
 from pm4py.objects.petri import check_soundness
 from pm4py.objects.log.log import Trace
 import time
-from pm4py.util import exec_utils
+from pm4py.util import exec_utils, instrumentation
 from enum import Enum
 import sys
 from pm4py.util.constants import PARAMETER_CONSTANT_ACTIVITY_KEY, PARAMETER_CONSTANT_CASEID_KEY
@@ -37,6 +40,7 @@ class Variants(Enum):
     VERSION_DIJKSTRA_NO_HEURISTICS = variants.dijkstra_no_heuristics
     VERSION_DIJKSTRA_LESS_MEMORY = variants.dijkstra_less_memory
     VERSION_STATE_EQUATION_LESS_MEMORY = variants.state_equation_less_memory
+    VERSION_DIJKSTRA_PREFIX_TRIE = variants.dijkstra_prefix_trie
 
 
 class Parameters(Enum):
@@ -54,12 +58,15 @@ class Parameters(Enum):
     ACTIVITY_KEY = PARAMETER_CONSTANT_ACTIVITY_KEY
     VARIANTS_IDX = "variants_idx"
     SHOW_PROGRESS_BAR = "show_progress_bar"
+    CORES = "cores"
+    CHUNK_SIZE = "chunk_size"
 
 
 DEFAULT_VARIANT = Variants.VERSION_STATE_EQUATION_A_STAR
 VERSION_STATE_EQUATION_A_STAR = Variants.VERSION_STATE_EQUATION_A_STAR
 VERSION_DIJKSTRA_NO_HEURISTICS = Variants.VERSION_DIJKSTRA_NO_HEURISTICS
 VERSION_DIJKSTRA_LESS_MEMORY = Variants.VERSION_DIJKSTRA_LESS_MEMORY
+VERSION_DIJKSTRA_PREFIX_TRIE = Variants.VERSION_DIJKSTRA_PREFIX_TRIE
 
 VERSIONS = {Variants.VERSION_DIJKSTRA_NO_HEURISTICS, Variants.VERSION_DIJKSTRA_NO_HEURISTICS,
             Variants.VERSION_DIJKSTRA_LESS_MEMORY}
@@ -130,7 +137,11 @@ def apply_log(log, petri_net, initial_marking, final_marking, parameters=None, v
     variant
         selected variant of the algorithm, possible values: {\'Variants.VERSION_STATE_EQUATION_A_STAR, Variants.VERSION_DIJKSTRA_NO_HEURISTICS \'}
     parameters
-        :class:`dict` parameters of the algorithm,
+        :class:`dict` parameters of the algorithm, including:
+            Parameters.PARAM_MAX_ALIGN_TIME -> global time budget (in seconds) for the alignment of the log
+            Parameters.PARAM_MAX_ALIGN_TIME_TRACE -> time budget (in seconds) for the alignment of a single trace
+            Parameters.CORES -> number of processes among which the variants are distributed (default: 1, serial)
+            Parameters.CHUNK_SIZE -> number of variants aligned by a process in a single task (when CORES > 1)
 
     Returns
     -----------
@@ -175,14 +186,34 @@ def apply_log(log, petri_net, initial_marking, final_marking, parameters=None, v
         from tqdm.auto import tqdm
         progress = tqdm(total=len(one_tr_per_var), desc="aligning log, completed variants :: ")
 
-    all_alignments = []
-    for trace in one_tr_per_var:
-        this_max_align_time = min(max_align_time_case, (max_align_time - (time.time() - start_time)) * 0.5)
-        parameters[Parameters.PARAM_MAX_ALIGN_TIME_TRACE] = this_max_align_time
-        all_alignments.append(apply_trace(trace, petri_net, initial_marking, final_marking, parameters=copy(parameters),
-                                          variant=variant))
+    cores = exec_utils.get_param_value(Parameters.CORES, parameters, 1)
+
+    if cores > 1 and len(one_tr_per_var) > 1:
+        all_alignments = __align_variants_multiprocessing(one_tr_per_var, petri_net, initial_marking, final_marking,
+                                                          start_time, cores, progress=progress,
+                                                          parameters=parameters, variant=variant)
+    elif hasattr(exec_utils.get_variant(variant), "apply_multiple_traces"):
+        # the variant aligns all the variants of the log at once (sharing the search work among them), in the
+        # remaining time (set on a copy, so the parameters of the caller are not changed)
+        variant_parameters = copy(parameters)
+        variant_parameters[Parameters.PARAM_MAX_ALIGN_TIME] = max_align_time - (time.time() - start_time)
+        all_alignments = exec_utils.get_variant(variant).apply_multiple_traces(one_tr_per_var, petri_net,
+                                                                               initial_marking, final_marking,
+                                                                               parameters=variant_parameters)
         if progress is not None:
-            progress.update()
+            progress.update(len(one_tr_per_var))
+    else:
+        all_alignments = []
+        for trace in one_tr_per_var:
+            this_max_align_time = min(max_align_time_case, (max_align_time - (time.time() - start_time)) * 0.5)
+            parameters[Parameters.PARAM_MAX_ALIGN_TIME_TRACE] = this_max_align_time
+            all_alignments.append(apply_trace(trace, petri_net, initial_marking, final_marking,
+                                              parameters=copy(parameters), variant=variant))
+            if progress is not None:
+                progress.update()
+
+    if instrumentation.is_enabled():
+        __emit_alignment_counters(one_tr_per_var, all_alignments, variants_idxs, parameters=parameters)
 
     al_idx = {}
     for index_variant, variant in enumerate(variants_idxs):
@@ -213,6 +244,137 @@ def apply_log(log, petri_net, initial_marking, final_marking, parameters=None, v
     return alignments
 
 
+def __emit_alignment_counters(one_tr_per_var, all_alignments, variants_idxs, parameters=None):
+    """
+    Emits (to the instrumentation callbacks) the search counters of the alignment of each variant,
+    tagged with the case identifier of a trace of the variant and the number of cases of the variant
+    """
+    if parameters is None:
+        parameters = {}
+
+    case_id_key = exec_utils.get_param_value(Parameters.CASE_ID_KEY, parameters, DEFAULT_TRACEID_KEY)
+    for index, variant in enumerate(variants_idxs):
+        align = all_alignments[index]
+        tags = {"case": one_tr_per_var[index].attributes.get(case_id_key), "cases": len(variants_idxs[variant])}
+        if align is None:
+            instrumentation.emit_counter("alignments.timeouts", 1, **tags)
+            continue
+        for counter in ["visited_states", "queued_states", "traversed_arcs", "lp_solved"]:
+            if counter in align:
+                instrumentation.emit_counter("alignments." + counter, align[counter], **tags)
+
+
+# alignment problem (net, markings, parameters, variant) shared by the tasks executed in a worker process
+_worker_problem = None
+
+
+def __initialize_worker(serialized_problem):
+    """
+    Initializes a worker process of the pool, deserializing the alignment problem only once
+    (instead of shipping the Petri net along with every task)
+
+    Parameters
+    --------------
+    serialized_problem
+        Pickled tuple (petri_net, initial_marking, final_marking, parameters, name of the variant module)
+    """
+    global _worker_problem
+    petri_net, initial_marking, final_marking, parameters, variant_name = pickle.loads(serialized_problem)
+    _worker_problem = (petri_net, initial_marking, final_marking, parameters, importlib.import_module(variant_name))
+
+
+def __align_chunk(traces, start_time):
+    """
+    Aligns a chunk of traces (one per variant) inside a worker process
+
+    Parameters
+    --------------
+    traces
+        Traces of the chunk
+    start_time
+        Starting time of the alignment of the log (used to respect the global time budget)
+
+    Returns
+    --------------
+    alignments
+        List of alignments (one for each trace of the chunk)
+    """
+    petri_net, initial_marking, final_marking, parameters, variant = _worker_problem
+    max_align_time = exec_utils.get_param_value(Parameters.PARAM_MAX_ALIGN_TIME, parameters, sys.maxsize)
+    max_align_time_case = exec_utils.get_param_value(Parameters.PARAM_MAX_ALIGN_TIME_TRACE, parameters,
+                                                     sys.maxsize)
+
+    ret = []
+    for trace in traces:
+        this_max_align_time = min(max_align_time_case, (max_align_time - (time.time() - start_time)) * 0.5)
+        trace_parameters = copy(parameters)
+        trace_parameters[Parameters.PARAM_MAX_ALIGN_TIME_TRACE] = this_max_align_time
+        ret.append(apply_trace(trace, petri_net, initial_marking, final_marking, parameters=trace_parameters,
+                               variant=variant))
+    return ret
+
+
+def __align_variants_multiprocessing(one_tr_per_var, petri_net, initial_marking, final_marking, start_time, cores,
+                                     progress=None, parameters=None, variant=DEFAULT_VARIANT):
+    """
+    Aligns the traces (one per variant) distributing the workload over a pool of processes.
+    The alignment problem is sent once to each worker; the tasks contain only the traces.
+
+    Parameters
+    --------------
+    one_tr_per_var
+        List of traces (one for each variant of the log)
+    petri_net
+        Petri net
+    initial_marking
+        Initial marking
+    final_marking
+        Final marking
+    start_time
+        Starting time of the alignment of the log
+    cores
+        Number of worker processes
+    progress
+        (if provided) progress bar
+    parameters
+        Parameters of the algorithm, including:
+        - Parameters.CHUNK_SIZE => number of variants aligned in a single task
+    variant
+        Variant of the alignments algorithm
+
+    Returns
+    --------------
+    all_alignments
+        List of alignments, in the same order as the provided traces
+    """
+    if parameters is None:
+        parameters = {}
+
+    cores = min(cores, len(one_tr_per_var))
+    chunk_size = exec_utils.get_param_value(Parameters.CHUNK_SIZE, parameters,
+                                            max(1, len(one_tr_per_var) // (4 * cores)))
+
+    # the indexes of the variants are not needed by the workers
+    worker_parameters = {x: y for x, y in parameters.items() if exec_utils.unroll(x) != Parameters.VARIANTS_IDX.value}
+    # the variant is sent by module name, since modules cannot be pickled
+    serialized_problem = pickle.dumps((petri_net, initial_marking, final_marking, worker_parameters,
+                                       exec_utils.get_variant(variant).__name__))
+
+    chunks = [one_tr_per_var[i:i + chunk_size] for i in range(0, len(one_tr_per_var), chunk_size)]
+    chunks_alignments = [None] * len(chunks)
+
+    with ProcessPoolExecutor(max_workers=cores, initializer=__initialize_worker,
+                             initargs=(serialized_problem,)) as executor:
+        futures = {executor.submit(__align_chunk, chunk, start_time): index for index, chunk in enumerate(chunks)}
+        for future in as_completed(futures):
+            index = futures[future]
+            chunks_alignments[index] = future.result()
+            if progress is not None:
+                progress.update(len(chunks[index]))
+
+    return [al for chunk_alignments in chunks_alignments for al in chunk_alignments]
+
+
 def get_diagnostics_dataframe(log, align_output, parameters=None):
     """
     Gets the diagnostics results of alignments (of a log) in a dataframe
@@ -15,5 +15,5 @@
     along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
 '''
 from pm4py.algo.conformance.alignments.variants import state_equation_a_star, tweaked_state_equation_a_star, dijkstra_no_heuristics, \
-    dijkstra_less_memory, state_equation_less_memory
+    dijkstra_less_memory, state_equation_less_memory, dijkstra_prefix_trie
 
@@ -0,0 +1,367 @@
+'''
+    This file is part of PM4Py (More Info: https://pm4py.fit.fraunhofer.de).
+
+    PM4Py is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    PM4Py is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
+'''
+import heapq
+import sys
+import time
+from enum import Enum
+
+from pm4py.objects.log import log as log_implementation
+from pm4py.objects.petri import align_utils as utils
+from pm4py.objects.petri import compiled_net
+from pm4py.objects.trie.definition import Trie
+from pm4py.util import exec_utils
+from pm4py.util import variants_util
+from pm4py.util.constants import PARAMETER_CONSTANT_ACTIVITY_KEY
+from pm4py.util.xes_constants import DEFAULT_NAME_KEY
+
+SKIP = utils.SKIP
+
+
+class Parameters(Enum):
+    PARAM_MODEL_COST_FUNCTION = 'model_cost_function'
+    PARAM_SYNC_COST_FUNCTION = 'sync_cost_function'
+    PARAM_ALIGNMENT_RESULT_IS_SYNC_PROD_AWARE = 'ret_tuple_as_trans_desc'
+    PARAM_MAX_ALIGN_TIME_TRACE = "max_align_time_trace"
+    PARAM_MAX_ALIGN_TIME = "max_align_time"
+    PARAMETER_VARIANT_DELIMITER = "variant_delimiter"
+    ACTIVITY_KEY = PARAMETER_CONSTANT_ACTIVITY_KEY
+    VARIANTS_IDX = "variants_idx"
+
+
+def get_best_worst_cost(petri_net, initial_marking, final_marking, parameters=None):
+    """
+    Gets the best worst cost of an alignment
+
+    Parameters
+    -----------
+    petri_net
+        Petri net
+    initial_marking
+        Initial marking
+    final_marking
+        Final marking
+
+    Returns
+    -----------
+    best_worst_cost
+        Best worst cost of alignment
+    """
+    if parameters is None:
+        parameters = {}
+    trace = log_implementation.Trace()
+
+    best_worst = apply(trace, petri_net, initial_marking, final_marking, parameters=parameters)
+
+    if best_worst['cost'] > 0:
+        return best_worst['cost'] // utils.STD_MODEL_LOG_MOVE_COST
+    return 0
+
+
+def apply(trace, petri_net, initial_marking, final_marking, parameters=None):
+    """
+    Aligns a single trace (the trie contains a single branch)
+
+    Parameters
+    ----------
+    trace
+        Trace
+    petri_net
+        Petri net
+    initial_marking
+        Initial marking
+    final_marking
+        Final marking
+    parameters
+        Parameters of the algorithm (see apply_multiple_traces)
+
+    Returns
+    -------
+    dictionary: `dict` with keys **alignment**, **cost**, **visited_states**, **queued_states** and **traversed_arcs**
+    """
+    return apply_multiple_traces([trace], petri_net, initial_marking, final_marking, parameters=parameters)[0]
+
+
+def apply_from_variant(variant, petri_net, initial_marking, final_marking, parameters=None):
+    """
+    Apply the alignments from the specification of a single variant
+
+    Parameters
+    -------------
+    variant
+        Variant (as string delimited by the "variant_delimiter" parameter)
+    petri_net
+        Petri net
+    initial_marking
+        Initial marking
+    final_marking
+        Final marking
+    parameters
+        Parameters of the algorithm (same as 'apply' method, plus 'variant_delimiter' that is , by default)
+
+    Returns
+    ------------
+    dictionary: `dict` with keys **alignment**, **cost**, **visited_states**, **queued_states** and **traversed_arcs**
+    """
+    if parameters is None:
+        parameters = {}
+    trace = variants_util.variant_to_trace(variant, parameters=parameters)
+
+    return apply(trace, petri_net, initial_marking, final_marking, parameters=parameters)
+
+
+def apply_from_variants_dictionary(var_dictio, petri_net, initial_marking, final_marking, parameters=None):
+    return apply_from_variants_list([[x] for x in var_dictio], petri_net, initial_marking, final_marking,
+                                    parameters=parameters)
+
+
+def apply_from_variants_list(var_list, petri_net, initial_marking, final_marking, parameters=None):
+    """
+    Apply the alignments from the specification of a list of variants in the log
+    (all the variants are aligned in a single search over their prefix trie)
+
+    Parameters
+    -------------
+    var_list
+        List of variants (for each item, the first entry is the variant itself, the second entry may be the number of cases)
+    petri_net
+        Petri net
+    initial_marking
+        Initial marking
+    final_marking
+        Final marking
+    parameters
+        Parameters of the algorithm (same as 'apply' method, plus 'variant_delimiter' that is , by default)
+
+    Returns
+    --------------
+    dictio_alignments
+        Dictionary that assigns to each variant its alignment
+    """
+    if parameters is None:
+        parameters = {}
+    traces = [variants_util.variant_to_trace(varitem[0], parameters=parameters) for varitem in var_list]
+    alignments = apply_multiple_traces(traces, petri_net, initial_marking, final_marking, parameters=parameters)
+    return {varitem[0]: alignments[i] for i, varitem in enumerate(var_list)}
+
+
+def apply_from_variants_list_petri_string(var_list, petri_net_string, parameters=None):
+    if parameters is None:
+        parameters = {}
+
+    from pm4py.objects.petri.importer.variants import pnml as petri_importer
+
+    petri_net, initial_marking, final_marking = petri_importer.import_petri_from_string(petri_net_string)
+
+    res = apply_from_variants_list(var_list, petri_net, initial_marking, final_marking, parameters=parameters)
+    return res
+
+
+def build_trie(traces, activity_key=DEFAULT_NAME_KEY):
+    """
+    Builds the prefix trie of a list of traces
+
+    Parameters
+    -------------
+    traces
+        List of traces
+    activity_key
+        Attribute to use as activity
+
+    Returns
+    -------------
+    root
+        Root of the trie
+    leaves
+        List (one item per trace) of the nodes of the trie at which the traces end
+    """
+    root = Trie()
+    leaves = []
+    for trace in traces:
+        node = root
+        for event in trace:
+            activity = event[activity_key]
+            child = None
+            for c in node.children:
+                if c.label == activity:
+                    child = c
+                    break
+            if child is None:
+                child = Trie(label=activity, parent=node, depth=node.depth + 1)
+                node.children.append(child)
+            node = child
+        node.final = True
+        leaves.append(node)
+    return root, leaves
+
+
+def apply_multiple_traces(traces, petri_net, initial_marking, final_marking, parameters=None):
+    """
+    Aligns a list of traces with a single uniform-cost search over the product of the Petri net and the prefix trie
+    of the traces. The states reached while aligning a prefix are shared by all the traces starting with such prefix,
+    so the search work for the common prefixes is done only once.
+
+    The search stops when an optimal alignment is found for every trace; the states whose trie node does not lead
+    anymore to a trace still to align are not expanded.
+
+    Parameters
+    ----------
+    traces
+        List of traces
+    petri_net
+        Petri net
+    initial_marking
+        Initial marking
+    final_marking
+        Final marking
+    parameters
+        Parameters of the algorithm, including:
+            Parameters.PARAM_MODEL_COST_FUNCTION -> mapping of each transition in the model to the cost of a move-on-model
+            Parameters.PARAM_SYNC_COST_FUNCTION -> mapping of each visible transition in the model to the cost of a
+            synchronous move
+            Parameters.PARAM_ALIGNMENT_RESULT_IS_SYNC_PROD_AWARE -> returns the names of the transitions in the moves
+            Parameters.PARAM_MAX_ALIGN_TIME -> time budget (in seconds) for the search
+            Parameters.ACTIVITY_KEY -> attribute to use as activity
+
+    Returns
+    -------
+    alignments
+        List (one item per trace) of dictionaries with keys **alignment**, **cost**, **visited_states**,
+        **queued_states** and **traversed_arcs** (the counters refer to the shared search, at the moment in which the
+        alignment of the trace is found). The item is None if the time budget is exceeded.
+    """
+    if parameters is None:
+        parameters = {}
+
+    activity_key = exec_utils.get_param_value(Parameters.ACTIVITY_KEY, parameters, DEFAULT_NAME_KEY)
+    model_cost_function = exec_utils.get_param_value(Parameters.PARAM_MODEL_COST_FUNCTION, parameters, None)
+    sync_cost_function = exec_utils.get_param_value(Parameters.PARAM_SYNC_COST_FUNCTION, parameters, None)
+    ret_tuple_as_trans_desc = exec_utils.get_param_value(Parameters.PARAM_ALIGNMENT_RESULT_IS_SYNC_PROD_AWARE,
+                                                         parameters, False)
+    max_align_time = min(exec_utils.get_param_value(Parameters.PARAM_MAX_ALIGN_TIME, parameters, sys.maxsize),
+                         exec_utils.get_param_value(Parameters.PARAM_MAX_ALIGN_TIME_TRACE, parameters, sys.maxsize) *
+                         max(len(traces), 1))
+
+    if model_cost_function is None:
+        model_cost_function = {t: utils.STD_MODEL_LOG_MOVE_COST if t.label is not None else utils.STD_TAU_COST for t
+                               in petri_net.transitions}
+    if sync_cost_function is None:
+        sync_cost_function = {t: utils.STD_SYNC_COST for t in petri_net.transitions if t.label is not None}
+
+    net = compiled_net.construct(petri_net)
+    root, leaves = build_trie(traces, activity_key=activity_key)
+
+    return __search(net, net.encode_marking(initial_marking), net.encode_marking(final_marking), root, leaves,
+                    [model_cost_function[t] for t in net.transitions],
+                    [sync_cost_function.get(t, utils.STD_SYNC_COST) for t in net.transitions],
+                    ret_tuple_as_trans_desc=ret_tuple_as_trans_desc, max_align_time=max_align_time)
+
+
+def __search(net, ini, fin, root, leaves, model_costs, sync_costs, ret_tuple_as_trans_desc=False,
+             max_align_time=sys.maxsize):
+    start_time = time.time()
+
+    transitions_per_label = {}
+    for t, label in enumerate(net.labels):
+        if label is not None:
+            transitions_per_label.setdefault(label, []).append(t)
+
+    # number of trie nodes, in the subtree of each node, at which a trace still to align ends
+    pending = {}
+    for leaf in set(leaves):
+        node = leaf
+        while node is not None:
+            pending[node] = pending.get(node, 0) + 1
+            node = node.parent
+
+    results = {}
+    closed = set()
+    # the predecessor of each reached state, along with the move (transition index, trie node) leading to it
+    predecessors = {(ini, root): None}
+    best_g = {(ini, root): 0}
+    counter = 0
+    open_set = [(0, counter, ini, root)]
+    visited = 0
+    queued = 0
+    traversed = 0
+
+    while open_set and pending.get(root, 0) > 0:
+        if (time.time() - start_time) > max_align_time:
+            break
+
+        g, _, marking, node = heapq.heappop(open_set)
+        state = (marking, node)
+        if state in closed or pending.get(node, 0) == 0:
+            continue
+        closed.add(state)
+        visited += 1
+
+        if node.final and node not in results and marking == fin:
+            results[node] = __reconstruct_alignment(net, state, g, predecessors, visited, queued, traversed,
+                                                    ret_tuple_as_trans_desc=ret_tuple_as_trans_desc)
+            ancestor = node
+            while ancestor is not None:
+                pending[ancestor] -= 1
+                ancestor = ancestor.parent
+            if pending.get(node, 0) == 0:
+                continue
+
+        successors = []
+        # moves on model
+        for t in net.enabled_transitions(marking):
+            successors.append((net.execute(t, marking), node, model_costs[t], (t, None)))
+        for child in node.children:
+            if pending.get(child, 0) == 0:
+                continue
+            # move on log
+            successors.append((marking, child, utils.STD_MODEL_LOG_MOVE_COST, (None, child)))
+            # synchronous moves
+            for t in transitions_per_label.get(child.label, []):
+                if net.is_enabled(t, marking):
+                    successors.append((net.execute(t, marking), child, sync_costs[t], (t, child)))
+
+        for new_marking, new_node, cost, move in successors:
+            traversed += 1
+            new_state = (new_marking, new_node)
+            if new_state in closed:
+                continue
+            new_g = g + cost
+            if new_state in best_g and best_g[new_state] <= new_g:
+                continue
+            best_g[new_state] = new_g
+            predecessors[new_state] = (state, move)
+            counter += 1
+            queued += 1
+            heapq.heappush(open_set, (new_g, counter, new_marking, new_node))
+
+    return [results[leaf] if leaf in results else None for leaf in leaves]
+
+
+def __reconstruct_alignment(net, state, cost, predecessors, visited, queued, traversed, ret_tuple_as_trans_desc=False):
+    alignment = []
+    while predecessors[state] is not None:
+        state, (t, child) = predecessors[state]
+        model_name = net.transitions[t].name if t is not None else SKIP
+        model_label = net.labels[t] if t is not None else SKIP
+        log_name = "t_" + child.label + "_" + str(child.depth - 1) if child is not None else SKIP
+        log_label = child.label if child is not None else SKIP
+        if ret_tuple_as_trans_desc:
+            alignment.append(((log_name, model_name), (log_label, model_label)))
+        else:
+            alignment.append((log_label, model_label))
+    alignment.reverse()
+    return {'alignment': alignment, 'cost': cost, 'visited_states': visited, 'queued_states': queued,
+            'traversed_arcs': traversed, 'lp_solved': 0}
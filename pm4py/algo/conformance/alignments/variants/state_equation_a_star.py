@@ -34,13 +34,12 @@ import time
 from copy import copy
 from enum import Enum
 
-import numpy as np
-
 from pm4py import util as pm4pyutil
 from pm4py.objects.log import log as log_implementation
 from pm4py.objects.petri import align_utils as utils
+from pm4py.objects.petri.heuristic_engine import StateEquationHeuristic
 from pm4py.objects.petri.incidence_matrix import construct as inc_mat_construct
-from pm4py.objects.petri.synchronous_product import construct_cost_aware, construct
+from pm4py.objects.petri.synchronous_product import construct_cost_aware, construct, construct_template
 from pm4py.objects.petri.utils import construct_trace_net_cost_aware, decorate_places_preset_trans, \
     decorate_transitions_prepostset
 from pm4py.util import exec_utils
@@ -152,6 +151,16 @@ def apply(trace, petri_net, initial_marking, final_marking, parameters=None):
         parameters[Parameters.PARAM_MODEL_COST_FUNCTION] = model_cost_function
         parameters[Parameters.PARAM_SYNC_COST_FUNCTION] = sync_cost_function
 
+    sync_cost_function = exec_utils.get_param_value(Parameters.PARAM_SYNC_COST_FUNCTION, parameters, None)
+
+    if trace_net_constr_function is None and trace_net_cost_aware_constr_function is construct_trace_net_cost_aware \
+            and sync_cost_function is not None:
+        # the synchronous product is an overlay of the trace on the template of the model (built once per model)
+        template = construct_template(petri_net, initial_marking, final_marking, model_cost_function,
+                                      sync_cost_function, utils.SKIP)
+        return apply_overlay(template.overlay([e[activity_key] for e in trace], trace_cost_function),
+                             parameters=parameters)
+
     if trace_net_constr_function is not None:
         # keep the possibility to pass TRACE_NET_CONSTR_FUNCTION in this old version
         trace_net, trace_im, trace_fm = trace_net_constr_function(trace, activity_key=activity_key)
@@ -376,6 +385,36 @@ def apply_trace_net(petri_net, initial_marking, final_marking, trace_net, trace_
                            max_align_time_trace=max_align_time_trace)
 
 
+def apply_overlay(overlay, parameters=None):
+    """
+    Performs the basic alignment search on top of the synchronous product, expressed as overlay of a trace on the
+    template of the model (see pm4py.objects.petri.synchronous_product.construct_template)
+
+    Parameters
+    ----------
+    overlay: :class:`pm4py.objects.petri.synchronous_product.SynchronousProductOverlay` synchronous product
+    parameters: :class:`dict` (optional) dictionary containing one of the following:
+        Parameters.PARAM_ALIGNMENT_RESULT_IS_SYNC_PROD_AWARE: :class:`bool` (parameter) returns the names of the
+        transitions in the moves
+        Parameters.PARAM_MAX_ALIGN_TIME_TRACE: :class:`float` (parameter) maximum time for the alignment
+
+    Returns
+    -------
+    dictionary : :class:`dict` with keys **alignment**, **cost**, **visited_states**, **queued_states**
+    and **traversed_arcs**
+    """
+    if parameters is None:
+        parameters = {}
+
+    ret_tuple_as_trans_desc = exec_utils.get_param_value(Parameters.PARAM_ALIGNMENT_RESULT_IS_SYNC_PROD_AWARE,
+                                                         parameters, False)
+    max_align_time_trace = exec_utils.get_param_value(Parameters.PARAM_MAX_ALIGN_TIME_TRACE, parameters,
+                                                      sys.maxsize)
+
+    return __search_overlay(overlay, ret_tuple_as_trans_desc=ret_tuple_as_trans_desc,
+                            max_align_time_trace=max_align_time_trace)
+
+
 def apply_sync_prod(sync_prod, initial_marking, final_marking, cost_function, skip, ret_tuple_as_trans_desc=False,
                     max_align_time_trace=sys.maxsize):
     """
@@ -410,35 +449,16 @@ def __search(sync_net, ini, fin, cost_function, skip, ret_tuple_as_trans_desc=Fa
 
     closed = set()
 
-    a_matrix = np.asmatrix(incidence_matrix.a_matrix).astype(np.float64)
-    g_matrix = -np.eye(len(sync_net.transitions))
-    h_cvx = np.matrix(np.zeros(len(sync_net.transitions))).transpose()
-    cost_vec = [x * 1.0 for x in cost_vec]
-
-    use_cvxopt = False
-    if lp_solver.DEFAULT_LP_SOLVER_VARIANT == lp_solver.CVXOPT_SOLVER_CUSTOM_ALIGN or lp_solver.DEFAULT_LP_SOLVER_VARIANT == lp_solver.CVXOPT_SOLVER_CUSTOM_ALIGN_ILP:
-        use_cvxopt = True
+    # the LP problem is built once, and solved for the markings whose heuristics must be computed exactly
+    heuristic = StateEquationHeuristic(incidence_matrix.a_matrix, fin_vec, cost_vec)
 
-    if use_cvxopt:
-        # not available in the latest version of PM4Py
-        from cvxopt import matrix
-
-        a_matrix = matrix(a_matrix)
-        g_matrix = matrix(g_matrix)
-        h_cvx = matrix(h_cvx)
-        cost_vec = matrix(cost_vec)
-
-    h, x = utils.__compute_exact_heuristic_new_version(sync_net, a_matrix, h_cvx, g_matrix, cost_vec, incidence_matrix,
-                                                       ini,
-                                                       fin_vec, lp_solver.DEFAULT_LP_SOLVER_VARIANT,
-                                                       use_cvxopt=use_cvxopt)
+    h, x = heuristic.solve(ini_vec)
     ini_state = utils.SearchTuple(0 + h, 0, h, ini, None, None, x, True)
     open_set = [ini_state]
     heapq.heapify(open_set)
     visited = 0
     queued = 0
     traversed = 0
-    lp_solved = 1
 
     trans_empty_preset = set(t for t in sync_net.transitions if len(t.in_arcs) == 0)
 
@@ -460,11 +480,7 @@ def __search(sync_net, ini, fin, cost_function, skip, ret_tuple_as_trans_desc=Fa
                 current_marking = curr.m
                 continue
 
-            h, x = utils.__compute_exact_heuristic_new_version(sync_net, a_matrix, h_cvx, g_matrix, cost_vec,
-                                                               incidence_matrix, curr.m,
-                                                               fin_vec, lp_solver.DEFAULT_LP_SOLVER_VARIANT,
-                                                               use_cvxopt=use_cvxopt)
-            lp_solved += 1
+            h, x = heuristic.solve(incidence_matrix.encode_marking(curr.m))
 
             # 11/10/19: shall not a state for which we compute the exact heuristics be
             # by nature a trusted solution?
@@ -487,9 +503,11 @@ def __search(sync_net, ini, fin, cost_function, skip, ret_tuple_as_trans_desc=Fa
         # (underestimation of the remaining cost) is 0. Low-hanging fruits
         if curr.h < 0.01:
             if current_marking == fin:
-                return utils.__reconstruct_alignment(curr, visited, queued, traversed,
-                                                     ret_tuple_as_trans_desc=ret_tuple_as_trans_desc,
-                                                     lp_solved=lp_solved)
+                ret = utils.__reconstruct_alignment(curr, visited, queued, traversed,
+                                                    ret_tuple_as_trans_desc=ret_tuple_as_trans_desc,
+                                                    lp_solved=heuristic.lp_solved)
+                ret.update(heuristic.get_statistics())
+                return ret
 
         closed.add(current_marking)
         visited += 1
@@ -519,3 +537,90 @@ def __search(sync_net, ini, fin, cost_function, skip, ret_tuple_as_trans_desc=Fa
 
             tp = utils.SearchTuple(new_f, g, h, new_marking, curr, t, x, trustable)
             heapq.heappush(open_set, tp)
+
+
+def __search_overlay(overlay, ret_tuple_as_trans_desc=False, max_align_time_trace=sys.maxsize):
+    start_time = time.time()
+
+    cost_vec = overlay.cost_vec
+    closed = set()
+
+    heuristic = StateEquationHeuristic(overlay.a_matrix, overlay.fin_vec, cost_vec)
+
+    h, x = heuristic.solve(overlay.encode_state(overlay.ini))
+    ini_state = utils.SearchTuple(0 + h, 0, h, overlay.ini, None, None, x, True)
+    open_set = [ini_state]
+    heapq.heapify(open_set)
+    visited = 0
+    queued = 0
+    traversed = 0
+
+    while not len(open_set) == 0:
+        if (time.time() - start_time) > max_align_time_trace:
+            return None
+
+        curr = heapq.heappop(open_set)
+
+        current_state = curr.m
+
+        while not curr.trust:
+            if (time.time() - start_time) > max_align_time_trace:
+                return None
+
+            already_closed = current_state in closed
+            if already_closed:
+                curr = heapq.heappop(open_set)
+                current_state = curr.m
+                continue
+
+            h, x = heuristic.solve(overlay.encode_state(curr.m))
+
+            tp = utils.SearchTuple(curr.g + h, curr.g, h, curr.m, curr.p, curr.t, x, True)
+            curr = heapq.heappushpop(open_set, tp)
+            current_state = curr.m
+
+        if curr.h > lp_solver.MAX_ALLOWED_HEURISTICS:
+            continue
+
+        already_closed = current_state in closed
+        if already_closed:
+            continue
+
+        if curr.h < 0.01:
+            if current_state == overlay.fin:
+                ret = __reconstruct_alignment_overlay(overlay, curr, visited, queued, traversed,
+                                                      ret_tuple_as_trans_desc=ret_tuple_as_trans_desc)
+                ret.update(heuristic.get_statistics())
+                return ret
+
+        closed.add(current_state)
+        visited += 1
+
+        for col, new_state, cost in overlay.successors(current_state):
+            traversed += 1
+
+            if new_state in closed:
+                continue
+            g = curr.g + cost
+
+            queued += 1
+            x = curr.x.copy()
+            x[col] -= 1
+            h = max(0, curr.h - cost_vec[col])
+            trustable = utils.__trust_solution(x)
+            new_f = g + h
+
+            tp = utils.SearchTuple(new_f, g, h, new_state, curr, col, x, trustable)
+            heapq.heappush(open_set, tp)
+
+
+def __reconstruct_alignment_overlay(overlay, state, visited, queued, traversed, ret_tuple_as_trans_desc=False):
+    alignment = []
+    parent = state
+    while parent.p is not None:
+        name, label = overlay.get_move(parent.t)
+        alignment.append((name, label) if ret_tuple_as_trans_desc else label)
+        parent = parent.p
+    alignment.reverse()
+    return {'alignment': alignment, 'cost': state.g, 'visited_states': visited, 'queued_states': queued,
+            'traversed_arcs': traversed}
@@ -58,7 +58,7 @@ def apply(obj, model, variant=DEFAULT_VARIANT, parameters=None):
     if parameters is None:
         parameters = {}
 
-    if type(obj) is Trace:
+    if isinstance(obj, Trace):
         return exec_utils.get_variant(variant).apply_trace(log_conversion.apply(obj, parameters=parameters), model,
                                                            parameters=parameters)
     else:
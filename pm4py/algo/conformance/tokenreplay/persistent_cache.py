@@ -0,0 +1,185 @@
+'''
+    This file is part of PM4Py (More Info: https://pm4py.fit.fraunhofer.de).
+
+    PM4Py is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    PM4Py is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
+'''
+import hashlib
+import json
+import sqlite3
+import time
+from contextlib import closing
+
+DEFAULT_MAX_SIZE = 100000
+
+# keys of the replay result that contain objects of the Petri net (stored by name)
+_TRANSITION_LIST_KEYS = ["activated_transitions", "transitions_with_problems"]
+_TRANSITION_SET_KEYS = ["enabled_transitions_in_marking"]
+_REACHED_MARKING_KEY = "reached_marking"
+
+
+def get_model_fingerprint(net, initial_marking, final_marking, options=None):
+    """
+    Computes a stable fingerprint of an accepting Petri net, that does not depend on the identity
+    of the objects (so the same model, imported twice, gets the same fingerprint)
+
+    Parameters
+    -------------
+    net
+        Petri net
+    initial_marking
+        Initial marking
+    final_marking
+        Final marking
+    options
+        (Optional) dictionary of further options that influence the replay result
+
+    Returns
+    -------------
+    fingerprint
+        Fingerprint of the model (or None if the places/transitions of the net do not have unique names)
+    """
+    place_names = [str(p.name) for p in net.places]
+    trans_names = [str(t.name) for t in net.transitions]
+    if len(set(place_names)) < len(place_names) or len(set(trans_names)) < len(trans_names):
+        return None
+
+    description = {
+        "places": sorted(place_names),
+        "transitions": sorted([str(t.name), str(t.label)] for t in net.transitions),
+        "arcs": sorted([str(a.source.name), str(a.target.name), a.weight] for a in net.arcs),
+        "im": sorted([str(p.name), n] for p, n in initial_marking.items()),
+        "fm": sorted([str(p.name), n] for p, n in final_marking.items()),
+        "options": sorted([str(k), str(v)] for k, v in options.items()) if options is not None else []
+    }
+    return hashlib.sha256(json.dumps(description).encode("utf-8")).hexdigest()
+
+
+def _serialize_result(result):
+    """
+    Transforms the replay result of a variant into a JSON string (the objects of the Petri net are stored by name)
+    """
+    stored = {}
+    for key, value in result.items():
+        if key in _TRANSITION_LIST_KEYS or key in _TRANSITION_SET_KEYS:
+            stored[key] = [x.name for x in value]
+        elif key == _REACHED_MARKING_KEY:
+            stored[key] = [[x.name, y] for x, y in value.items()]
+        else:
+            stored[key] = value
+    return json.dumps(stored)
+
+
+def _deserialize_result(serialization, places, transitions):
+    """
+    Rebuilds the replay result of a variant from its JSON string, restoring the objects of the Petri net
+    """
+    from pm4py.objects.petri.petrinet import Marking
+
+    stored = json.loads(serialization)
+    result = {}
+    for key, value in stored.items():
+        if key in _TRANSITION_LIST_KEYS:
+            result[key] = [transitions[x] for x in value]
+        elif key in _TRANSITION_SET_KEYS:
+            result[key] = {transitions[x] for x in value}
+        elif key == _REACHED_MARKING_KEY:
+            result[key] = Marking({places[x]: y for x, y in value})
+        else:
+            result[key] = value
+    return result
+
+
+class PersistentReplayCache(object):
+    """
+    On-disk (SQLite) cache of the token-based replay results at the variant level.
+
+    The entries are keyed by the fingerprint of the model and by the variant. When the number of entries
+    exceeds the maximum size, the least recently used entries are evicted. Every operation opens (and closes) its
+    own connection to the database, so no connection is left open when the replay fails.
+    """
+
+    def __init__(self, path, net, fingerprint, max_size=DEFAULT_MAX_SIZE):
+        self.path = path
+        self.fingerprint = fingerprint
+        self.max_size = max_size
+        self.places = {p.name: p for p in net.places}
+        self.transitions = {t.name: t for t in net.transitions}
+        with self.__connect() as connection:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS replay_cache (model TEXT NOT NULL, variant TEXT NOT NULL, "
+                "result TEXT NOT NULL, last_access REAL NOT NULL, PRIMARY KEY (model, variant))")
+            connection.execute("CREATE INDEX IF NOT EXISTS replay_cache_access ON replay_cache (last_access)")
+            connection.commit()
+
+    def __connect(self):
+        # the connection is closed when leaving the with block (the uncommitted changes are discarded)
+        return closing(sqlite3.connect(self.path))
+
+    @staticmethod
+    def __variant_key(variant):
+        return json.dumps(variant)
+
+    def get(self, variants):
+        """
+        Retrieves the cached results for the provided variants
+
+        Parameters
+        -------------
+        variants
+            Collection of variants
+
+        Returns
+        -------------
+        results
+            Dictionary associating to each variant found in the cache its replay result
+        """
+        keys = {self.__variant_key(v): v for v in variants}
+        results = {}
+        key_list = list(keys)
+        now = time.time()
+        with self.__connect() as connection:
+            # stay within the maximum number of host parameters of SQLite
+            for i in range(0, len(key_list), 500):
+                batch = key_list[i:i + 500]
+                rows = connection.execute(
+                    "SELECT variant, result FROM replay_cache WHERE model = ? AND variant IN (%s)" % (
+                        ",".join("?" * len(batch))), [self.fingerprint] + batch).fetchall()
+                for key, serialization in rows:
+                    results[keys[key]] = _deserialize_result(serialization, self.places, self.transitions)
+                connection.executemany("UPDATE replay_cache SET last_access = ? WHERE model = ? AND variant = ?",
+                                       [(now, self.fingerprint, key) for key, _ in rows])
+            connection.commit()
+        return results
+
+    def put(self, results):
+        """
+        Stores the replay results of some variants, evicting the least recently used entries
+        if the maximum size is exceeded
+
+        Parameters
+        -------------
+        results
+            Dictionary associating to each variant its replay result
+        """
+        now = time.time()
+        with self.__connect() as connection:
+            connection.executemany(
+                "INSERT OR REPLACE INTO replay_cache (model, variant, result, last_access) VALUES (?, ?, ?, ?)",
+                [(self.fingerprint, self.__variant_key(v), _serialize_result(r), now) for v, r in results.items()])
+            count = connection.execute("SELECT COUNT(*) FROM replay_cache").fetchone()[0]
+            if count > self.max_size:
+                connection.execute(
+                    "DELETE FROM replay_cache WHERE rowid IN (SELECT rowid FROM replay_cache ORDER BY last_access "
+                    "LIMIT ?)", (count - self.max_size,))
+            connection.commit()
@@ -25,7 +25,9 @@ from copy import copy
 from enum import Enum
 from pm4py.util import exec_utils, constants
 from pm4py.util import variants_util
+from pm4py.algo.conformance.tokenreplay import persistent_cache
 import pkgutil
+import time
 
 
 class Parameters(Enum):
@@ -45,6 +47,8 @@ class Parameters(Enum):
     CONSIDER_REMAINING_IN_FITNESS = "consider_remaining_in_fitness"
     ENABLE_PLTR_FITNESS = "enable_pltr_fitness"
     SHOW_PROGRESS_BAR = "show_progress_bar"
+    PERSISTENT_CACHE_PATH = "persistent_cache_path"
+    PERSISTENT_CACHE_MAX_SIZE = "persistent_cache_max_size"
 
 
 class TechnicalParameters(Enum):
@@ -835,6 +839,7 @@ class ApplyTraceTokenReplay:
         """
         Runs the thread and stores the results
         """
+        start_time = time.time()
         self.t_fit, self.t_value, self.act_trans, self.trans_probl, self.reached_marking, self.enabled_trans_in_mark, self.missing, self.consumed, self.remaining, self.produced = \
             apply_trace(self.trace, self.net, self.initial_marking, self.final_marking, self.trans_map,
                         self.enable_pltr_fitness, self.place_fitness, self.transition_fitness,
@@ -853,6 +858,8 @@ class ApplyTraceTokenReplay:
                         cleaning_token_flood=self.cleaning_token_flood,
                         s_components=self.s_components,
                         trace_occurrences=self.trace_occurrences)
+        # the replay exceeded the maximum execution time of the thread
+        self.timed_out = time.time() - start_time > self.thread_maximum_ex_time
         self.thread_is_alive = False
 
 
@@ -933,7 +940,8 @@ def apply_log(log, net, initial_marking, final_marking, enable_pltr_fitness=Fals
               activity_key="concept:name", reach_mark_through_hidden=True, stop_immediately_unfit=False,
               walk_through_hidden_trans=True, places_shortest_path_by_hidden=None,
               variants=None, is_reduction=False, thread_maximum_ex_time=TechnicalParameters.MAX_DEF_THR_EX_TIME.value,
-              cleaning_token_flood=False, disable_variants=False, return_object_names=False, show_progress_bar=True):
+              cleaning_token_flood=False, disable_variants=False, return_object_names=False, show_progress_bar=True,
+              persistent_cache_path=None, persistent_cache_max_size=persistent_cache.DEFAULT_MAX_SIZE):
     """
     Apply token-based replay to a log
 
@@ -973,6 +981,14 @@ def apply_log(log, net, initial_marking, final_marking, enable_pltr_fitness=Fals
         Disable variants grouping
     return_object_names
         Decides whether names instead of object pointers shall be returned
+    show_progress_bar
+        Decides whether the progress bar shall be shown
+    persistent_cache_path
+        (Optional) path of a SQLite database in which the replay results of the variants are persisted.
+        Only the variants that are not already in the cache (for the same model) are replayed.
+        The cache is not used when the place/transition fitness is computed or when the variants are disabled.
+    persistent_cache_max_size
+        Maximum number of entries of the persistent cache (the least recently used ones are evicted)
     """
     post_fix_cache = PostFixCaching()
     marking_to_activity_cache = MarkingToActivityCaching()
@@ -1017,8 +1033,25 @@ def apply_log(log, net, initial_marking, final_marking, enable_pltr_fitness=Fals
                 vc = variants_module.get_variants_sorted_by_count(variants)
                 threads = {}
                 threads_results = {}
+                timed_out_variants = set()
                 all_activated_transitions = set()
 
+                replay_cache = None
+                if persistent_cache_path is not None and not enable_pltr_fitness and not disable_variants:
+                    fingerprint = persistent_cache.get_model_fingerprint(net, initial_marking, final_marking, options={
+                        "consider_remaining_in_fitness": consider_remaining_in_fitness,
+                        "reach_mark_through_hidden": reach_mark_through_hidden,
+                        "stop_immediately_unfit": stop_immediately_unfit,
+                        "walk_through_hidden_trans": walk_through_hidden_trans,
+                        "is_reduction": is_reduction, "cleaning_token_flood": cleaning_token_flood})
+                    if fingerprint is not None:
+                        replay_cache = persistent_cache.PersistentReplayCache(persistent_cache_path, net, fingerprint,
+                                                                              max_size=persistent_cache_max_size)
+                        threads_results = replay_cache.get([x[0] for x in vc])
+                        if progress is not None:
+                            progress.update(len(threads_results))
+                        vc = [x for x in vc if x[0] not in threads_results]
+
                 for i in range(len(vc)):
                     variant = vc[i][0]
                     threads[variant] = ApplyTraceTokenReplay(variants[variant][0], net, initial_marking, final_marking,
@@ -1054,8 +1087,16 @@ def apply_log(log, net, initial_marking, final_marking, enable_pltr_fitness=Fals
                                                 "consumed_tokens": int(t.consumed),
                                                 "remaining_tokens": int(t.remaining),
                                                 "produced_tokens": int(t.produced)}
+                    if t.timed_out:
+                        timed_out_variants.add(variant)
+                    del threads[variant]
+
+                if replay_cache is not None:
+                    # the results of the replays exceeding the maximum execution time are not persisted
+                    replay_cache.put({x[0]: threads_results[x[0]] for x in vc if x[0] not in timed_out_variants})
 
-                    if return_object_names:
+                if return_object_names:
+                    for variant in threads_results:
                         threads_results[variant]["activated_transitions_labels"] = [x.label for x in
                                                                                     threads_results[variant][
                                                                                         "activated_transitions"]]
@@ -1073,7 +1114,7 @@ def apply_log(log, net, initial_marking, final_marking, enable_pltr_fitness=Fals
                         threads_results[variant]["reached_marking"] = {x.name: y for x, y in
                                                                        threads_results[variant][
                                                                            "reached_marking"].items()}
-                    del threads[variant]
+
                 for trace in log:
                     trace_variant = get_variant_from_trace(trace, activity_key, disable_variants=disable_variants)
                     if trace_variant in threads_results:
@@ -1133,6 +1174,9 @@ def apply(log, net, initial_marking, final_marking, parameters=None):
     variants = exec_utils.get_param_value(Parameters.VARIANTS, parameters, None)
 
     show_progress_bar = exec_utils.get_param_value(Parameters.SHOW_PROGRESS_BAR, parameters, True)
+    persistent_cache_path = exec_utils.get_param_value(Parameters.PERSISTENT_CACHE_PATH, parameters, None)
+    persistent_cache_max_size = exec_utils.get_param_value(Parameters.PERSISTENT_CACHE_MAX_SIZE, parameters,
+                                                           persistent_cache.DEFAULT_MAX_SIZE)
 
     return apply_log(log, net, initial_marking, final_marking, enable_pltr_fitness=enable_pltr_fitness,
                      consider_remaining_in_fitness=consider_remaining_in_fitness,
@@ -1142,7 +1186,8 @@ def apply(log, net, initial_marking, final_marking, parameters=None):
                      places_shortest_path_by_hidden=places_shortest_path_by_hidden, activity_key=activity_key,
                      variants=variants, is_reduction=is_reduction, thread_maximum_ex_time=thread_maximum_ex_time,
                      cleaning_token_flood=cleaning_token_flood, disable_variants=disable_variants,
-                     return_object_names=return_names, show_progress_bar=show_progress_bar)
+                     return_object_names=return_names, show_progress_bar=show_progress_bar,
+                     persistent_cache_path=persistent_cache_path, persistent_cache_max_size=persistent_cache_max_size)
 
 
 def apply_variants_list(variants_list, net, initial_marking, final_marking, parameters=None):
@@ -333,7 +333,7 @@ def apply_multiprocessing(obj, pt, parameters=None):
     activity_key = exec_utils.get_param_value(Parameters.ACTIVITY_KEY, parameters, xes_constants.DEFAULT_NAME_KEY)
     num_cores = exec_utils.get_param_value(Parameters.CORES, parameters, multiprocessing.cpu_count() - 2)
 
-    if type(obj) is Trace:
+    if isinstance(obj, Trace):
         variant = tuple(x[activity_key] for x in obj)
         tree, lvs = get_reduced_tree(pt, obj, parameters=parameters)
         return apply_variant(variant, lvs, tree)
@@ -396,7 +396,7 @@ def apply(obj, pt, parameters=None):
     show_progress_bar = exec_utils.get_param_value(Parameters.SHOW_PROGRESS_BAR, parameters, True)
     leaves = frozenset(pt_util.get_leaves(pt))
     activity_key = exec_utils.get_param_value(Parameters.ACTIVITY_KEY, parameters, xes_constants.DEFAULT_NAME_KEY)
-    if type(obj) is Trace:
+    if isinstance(obj, Trace):
         variant = tuple(x[activity_key] for x in obj)
         tree, lvs = get_reduced_tree(pt, obj, parameters=parameters)
         return apply_variant(variant, lvs, tree)
@@ -14,34 +14,29 @@
     You should have received a copy of the GNU General Public License
     along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
 '''
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 from enum import Enum
-from typing import Union, Dict, Any, Optional, Tuple
+from typing import Union, Dict, Any, Optional, Tuple, List
 
 import pandas as pd
 
-import pm4py
-from pm4py.algo.discovery.dfg import algorithm as discover_dfg
 from pm4py.algo.discovery.inductive.util import tree_consistency
 from pm4py.algo.discovery.inductive.variants.im_clean.cuts import sequence as sequence_cut, xor as xor_cut, \
     concurrency as concurrent_cut, loop as loop_cut
+from pm4py.algo.discovery.inductive.variants.im_clean import variant_multiset
+from pm4py.algo.discovery.inductive.variants.im_clean.d_types import DFG, VariantMultiset
 from pm4py.algo.discovery.inductive.variants.im_clean.fall_throughs import activity_once_per_trace, activity_concurrent, \
     strict_tau_loop, tau_loop
-from pm4py.algo.discovery.minimum_self_distance import algorithm as msd_algo
-from pm4py.algo.discovery.minimum_self_distance import utils as msdw_algo
 from pm4py.objects.conversion.log import converter as log_converter
 from pm4py.objects.conversion.process_tree import converter as tree_converter
 from pm4py.objects.dfg.utils import dfg_utils
 from pm4py.objects.log.log import EventLog, EventStream
-from pm4py.objects.log.util import log as log_util
 from pm4py.objects.petri.petrinet import PetriNet, Marking
 from pm4py.objects.process_tree import process_tree as pt
 from pm4py.objects.process_tree import util
 from pm4py.objects.process_tree.process_tree import ProcessTree
-from pm4py.statistics.end_activities.log import get as get_ends
-from pm4py.statistics.start_activities.log import get as get_starters
 from pm4py.util import constants, exec_utils, xes_constants
-from pm4py.util import variants_util
-from pm4py.objects.log.util import filtering_utils
 
 
 class Parameters(Enum):
@@ -49,6 +44,12 @@ class Parameters(Enum):
     NOISE_THRESHOLD = 'noise_threshold'
     DFG_ONLY = 'dfg_only'
     USE_MSD_PARALLEL_CUT = 'use_msd_par_cut'
+    CORES = 'cores'
+    PARALLEL_MIN_VARIANTS = 'parallel_min_variants'
+
+
+# default minimum number of variants of a sublog for it to be mined in a separate process
+DEFAULT_PARALLEL_MIN_VARIANTS = 100
 
 
 def apply(event_log: Union[pd.DataFrame, EventLog, EventStream],
@@ -72,22 +73,9 @@ def apply_tree_variants(variants, parameters=None):
     if parameters is None:
         parameters = {}
 
-    log = EventLog()
-    threshold = exec_utils.get_param_value(Parameters.NOISE_THRESHOLD, parameters, 0.0)
-
-    var_keys = list(variants.keys())
-    for var in var_keys:
-        val = variants[var]
-        if type(val) is list:
-            val = len(val)
-        if threshold == 0.0:
-            # the inductive miner without noise needs only 1 trace per variant
-            val = 1
-        for i in range(val):
-            trace = variants_util.variant_to_trace(var, parameters=parameters)
-            log.append(trace)
+    activities, variants = variant_multiset.from_variants(variants, parameters=parameters)
 
-    return apply_tree(log, parameters=parameters)
+    return _apply_tree_variant_multiset(activities, variants, parameters)
 
 
 def apply_tree(event_log: Union[pd.DataFrame, EventLog, EventStream],
@@ -95,24 +83,35 @@ def apply_tree(event_log: Union[pd.DataFrame, EventLog, EventStream],
     if parameters is None:
         parameters = {}
     event_log = log_converter.apply(event_log, parameters=parameters)
-    if type(event_log) is not EventLog:
+    if not isinstance(event_log, EventLog):
         raise ValueError('input argument log should be of type pandas.DataFrame, Event Log or Event Stream')
     act_key = exec_utils.get_param_value(Parameters.ACTIVITY_KEY.value, parameters,
                                          xes_constants.DEFAULT_NAME_KEY)
 
     if exec_utils.get_param_value(Parameters.DFG_ONLY, parameters, False):
-        event_log = None
+        event_log = EventLog()
 
-    threshold = exec_utils.get_param_value(Parameters.NOISE_THRESHOLD, parameters, 0.0)
+    # the log is mined as a multiset of variants; the time does not depend on the number of traces
+    activities, variants = variant_multiset.from_log(event_log, act_key)
+
+    return _apply_tree_variant_multiset(activities, variants, parameters)
 
-    if threshold == 0.0:
-        # keep one trace per variant; more performant
-        event_log = filtering_utils.keep_one_trace_per_variant(event_log, parameters=parameters)
 
-    tree = inductive_miner(event_log, discover_dfg.apply(event_log, parameters={
-        constants.PARAMETER_CONSTANT_ACTIVITY_KEY: act_key}),
-                           threshold, None,
-                           act_key, exec_utils.get_param_value(Parameters.USE_MSD_PARALLEL_CUT, parameters, True))
+def _apply_tree_variant_multiset(activities, variants, parameters):
+    threshold = exec_utils.get_param_value(Parameters.NOISE_THRESHOLD, parameters, 0.0)
+    use_msd = exec_utils.get_param_value(Parameters.USE_MSD_PARALLEL_CUT, parameters, True)
+    cores = exec_utils.get_param_value(Parameters.CORES, parameters, 1)
+    parallel_min_variants = exec_utils.get_param_value(Parameters.PARALLEL_MIN_VARIANTS, parameters,
+                                                       DEFAULT_PARALLEL_MIN_VARIANTS)
+    dfg = variant_multiset.get_dfg(variants, activities)
+
+    if cores > 1 and len(variants) >= parallel_min_variants:
+        # the sibling sublogs having at least parallel_min_variants variants are mined in the processes of the pool
+        with ProcessPoolExecutor(max_workers=cores) as executor:
+            tree = inductive_miner_variants(variants, activities, dfg, threshold, None, use_msd, executor=executor,
+                                            parallel_min_variants=parallel_min_variants)
+    else:
+        tree = inductive_miner_variants(variants, activities, dfg, threshold, None, use_msd)
 
     tree_consistency.fix_parent_pointers(tree)
     tree = util.fold(tree)
@@ -122,56 +121,102 @@ def apply_tree(event_log: Union[pd.DataFrame, EventLog, EventStream],
 
 
 def inductive_miner(log, dfg, threshold, root, act_key, use_msd):
-    alphabet = pm4py.get_attribute_values(log, act_key)
-    start_activities = get_starters.get_start_activities(log, parameters={
-        constants.PARAMETER_CONSTANT_ACTIVITY_KEY: act_key})
-    end_activities = get_ends.get_end_activities(log, parameters={constants.PARAMETER_CONSTANT_ACTIVITY_KEY: act_key})
-    empty_traces = pm4py.filter_log(lambda trace: len(trace) == 0, log)
-    if len(empty_traces) == 0:
-        if _is_base_case_act(log, act_key) or _is_base_case_silent(log):
-            return _apply_base_case(log, root, act_key)
+    activities, variants = variant_multiset.from_log(log, act_key)
+    return inductive_miner_variants(variants, activities, dfg, threshold, root, use_msd)
+
+
+def inductive_miner_variants(variants: VariantMultiset, activities: List[str], dfg: DFG, threshold: float,
+                             root: Optional[ProcessTree], use_msd: bool, executor: Optional[ProcessPoolExecutor] = None,
+                             parallel_min_variants: int = DEFAULT_PARALLEL_MIN_VARIANTS) -> ProcessTree:
+    """
+    Recursion of the inductive miner on a multiset of variants
+
+    Parameters
+    --------------
+    variants
+        Multiset of variants (tuples of activity indices, associated to their multiplicity)
+    activities
+        List of the activities (associating each index to the activity)
+    dfg
+        DFG of the multiset of variants
+    threshold
+        Noise threshold
+    root
+        Parent of the process tree that is discovered
+    use_msd
+        Use the minimum self distance in the detection of the parallel cut
+    executor
+        (if provided) pool of processes in which the sibling sublogs are mined. The tree is the same as the one
+        obtained by the sequential recursion
+    parallel_min_variants
+        Minimum number of variants of a sublog for it to be mined in the pool
+
+    Returns
+    --------------
+    tree
+        Process tree
+    """
+    alphabet = variant_multiset.get_alphabet(variants, activities)
+    start_activities = variant_multiset.get_start_activities(variants, activities)
+    end_activities = variant_multiset.get_end_activities(variants, activities)
+    pool = {'executor': executor, 'parallel_min_variants': parallel_min_variants}
+    if () not in variants:
+        if _is_base_case_act(variants) or _is_base_case_silent(variants):
+            return _apply_base_case(variants, activities, root)
         pre, post = dfg_utils.get_transitive_relations(dfg, alphabet)
         cut = sequence_cut.detect(alphabet, pre, post)
         if cut is not None:
-            return _add_operator_recursive(pt.ProcessTree(pt.Operator.SEQUENCE, root), threshold, act_key,
-                                           sequence_cut.project(log, cut, act_key), use_msd)
+            return _add_operator_recursive(pt.ProcessTree(pt.Operator.SEQUENCE, root), threshold, activities,
+                                           sequence_cut.project_variants(variants, cut, activities), use_msd, **pool)
         cut = xor_cut.detect(dfg, alphabet)
         if cut is not None:
-            return _add_operator_recursive(pt.ProcessTree(pt.Operator.XOR, root), threshold, act_key,
-                                           xor_cut.project(log, cut, act_key), use_msd)
+            # the traces are partitioned between the groups: the DFGs of the children are derived from the current one
+            return _add_operator_recursive(pt.ProcessTree(pt.Operator.XOR, root), threshold, activities,
+                                           xor_cut.project_variants(variants, cut, activities), use_msd,
+                                           dfgs=[variant_multiset.restrict_dfg(dfg, g) for g in cut], **pool)
         cut = concurrent_cut.detect(dfg, alphabet, start_activities, end_activities,
-                                    msd=msdw_algo.derive_msd_witnesses(log, msd_algo.apply(log, parameters={
-                                        constants.PARAMETER_CONSTANT_ACTIVITY_KEY: act_key}), parameters={
-                                        constants.PARAMETER_CONSTANT_ACTIVITY_KEY: act_key}) if use_msd else None)
+                                    msd=variant_multiset.derive_msd_witnesses(variants, activities,
+                                                                              variant_multiset.get_msd(variants,
+                                                                                                       activities))
+                                    if use_msd else None)
         if cut is not None:
-            return _add_operator_recursive(pt.ProcessTree(pt.Operator.PARALLEL, root), threshold, act_key,
-                                           concurrent_cut.project(log, cut, act_key), use_msd)
+            return _add_operator_recursive(pt.ProcessTree(pt.Operator.PARALLEL, root), threshold, activities,
+                                           concurrent_cut.project_variants(variants, cut, activities), use_msd, **pool)
         cut = loop_cut.detect(dfg, alphabet, start_activities, end_activities)
         if cut is not None:
-            return _add_operator_recursive(pt.ProcessTree(pt.Operator.LOOP, root), threshold, act_key,
-                                           loop_cut.project(log, cut, act_key), use_msd)
-    if len(empty_traces) > 0:
-        nempty = pm4py.filter_log(lambda t: len(t) > 0, log)
-        return _add_operator_recursive(pt.ProcessTree(pt.Operator.XOR, root), threshold, act_key, [EventLog(), nempty],
-                                       use_msd)
-    aopt = activity_once_per_trace.detect(log, alphabet, act_key)
+            dfgs = None
+            if sum(len(g) for g in cut) == len(alphabet) and set().union(*cut) == set(alphabet):
+                # the groups partition the alphabet, and the traces are split in pieces belonging to the groups:
+                # the DFGs of the children are derived from the current one (the detected groups may overlap,
+                # in which case the DFGs are discovered on the projections)
+                dfgs = [variant_multiset.restrict_dfg(dfg, g) for g in cut]
+            return _add_operator_recursive(pt.ProcessTree(pt.Operator.LOOP, root), threshold, activities,
+                                           loop_cut.project_variants(variants, cut, activities), use_msd, dfgs=dfgs,
+                                           **pool)
+    if () in variants:
+        nempty = {variant: count for variant, count in variants.items() if len(variant) > 0}
+        return _add_operator_recursive(pt.ProcessTree(pt.Operator.XOR, root), threshold, activities, [{}, nempty],
+                                       use_msd, dfgs=[Counter(), dfg], **pool)
+    aopt = activity_once_per_trace.detect_variants(variants, alphabet, activities)
     if aopt is not None:
         operator = pt.ProcessTree(operator=pt.Operator.PARALLEL, parent=root)
         operator.children.append(pt.ProcessTree(operator=None, parent=operator, label=aopt))
-        return _add_operator_recursive(operator, threshold, act_key,
-                                       activity_once_per_trace.project(log, aopt, act_key), use_msd)
-    act_conc = activity_concurrent.detect(log, alphabet, act_key, use_msd)
+        return _add_operator_recursive(operator, threshold, activities,
+                                       activity_once_per_trace.project_variants(variants, aopt, activities), use_msd,
+                                       **pool)
+    act_conc = activity_concurrent.detect_variants(variants, alphabet, activities, use_msd, dfg=dfg)
     if act_conc is not None:
-        return _add_operator_recursive(pt.ProcessTree(pt.Operator.PARALLEL, root), threshold, act_key,
-                                       activity_concurrent.project(log, act_conc, act_key), use_msd)
-    stl = strict_tau_loop.detect(log, start_activities, end_activities, act_key)
+        return _add_operator_recursive(pt.ProcessTree(pt.Operator.PARALLEL, root), threshold, activities,
+                                       activity_concurrent.project_variants(variants, act_conc, activities), use_msd,
+                                       **pool)
+    stl = strict_tau_loop.detect_variants(variants, start_activities, end_activities, activities)
     if stl is not None:
-        return _add_operator_recursive(pt.ProcessTree(pt.Operator.LOOP, root), threshold, act_key, [stl, EventLog()],
-                                       use_msd)
-    tl = tau_loop.detect(log, start_activities, act_key)
+        return _add_operator_recursive(pt.ProcessTree(pt.Operator.LOOP, root), threshold, activities, [stl, {}],
+                                       use_msd, **pool)
+    tl = tau_loop.detect_variants(variants, start_activities, activities)
     if tl is not None:
-        return _add_operator_recursive(pt.ProcessTree(pt.Operator.LOOP, root), threshold, act_key, [tl, EventLog()],
-                                       use_msd)
+        return _add_operator_recursive(pt.ProcessTree(pt.Operator.LOOP, root), threshold, activities, [tl, {}],
+                                       use_msd, **pool)
     return _flower(alphabet, root)
 
 
@@ -185,40 +230,70 @@ def _flower(alphabet, root):
     return operator
 
 
-def _is_base_case_act(log, act_key):
-    if len(list(filter(lambda t: len(t) == 1, log))) == len(log):
-        if len(frozenset(log_util.get_event_labels(log, act_key))) == 1:
-            return True
-    return False
+def _is_base_case_act(variants):
+    return len(variants) == 1 and len(next(iter(variants))) == 1
 
 
-def _is_base_case_silent(log):
-    return len(log) == 0
+def _is_base_case_silent(variants):
+    return len(variants) == 0
 
 
-def _apply_base_case(log, root, act_key):
-    if len(log) == 0:
+def _apply_base_case(variants, activities, root):
+    if len(variants) == 0:
         operator = pt.ProcessTree(parent=root)
         return operator
     else:
-        operator = pt.ProcessTree(parent=root, label=log[0][0][act_key])
+        operator = pt.ProcessTree(parent=root, label=activities[next(iter(variants))[0]])
         return operator
 
 
-def _add_operator_recursive(operator, threshold, act_key, logs, use_msd):
+def _add_operator_recursive(operator, threshold, activities, logs, use_msd, dfgs=None, executor=None,
+                            parallel_min_variants=DEFAULT_PARALLEL_MIN_VARIANTS):
+    if dfgs is None:
+        dfgs = [None] * len(logs)
+    dfgs = [dfg if dfg is not None else variant_multiset.get_dfg(log, activities) for log, dfg in zip(logs, dfgs)]
+    pool = {'executor': executor, 'parallel_min_variants': parallel_min_variants}
     if operator.operator != pt.Operator.LOOP:
-        for log in logs:
-            operator.children.append(inductive_miner(log, discover_dfg.apply(log, parameters={
-                constants.PARAMETER_CONSTANT_ACTIVITY_KEY: act_key}), threshold, operator, act_key, use_msd))
+        operator.children.extend(_mine_children(operator, threshold, activities, logs, dfgs, use_msd, **pool))
+    elif len(logs) == 2:
+        operator.children.extend(_mine_children(operator, threshold, activities, logs, dfgs, use_msd, **pool))
     else:
-        operator.children.append(inductive_miner(logs[0], discover_dfg.apply(logs[0], parameters={
-            constants.PARAMETER_CONSTANT_ACTIVITY_KEY: act_key}), threshold, operator, act_key, use_msd))
-        logs = logs[1:]
-        if len(logs) == 1:
-            operator.children.append(inductive_miner(logs[0], discover_dfg.apply(logs[0], parameters={
-                constants.PARAMETER_CONSTANT_ACTIVITY_KEY: act_key}), threshold, operator, act_key, use_msd))
-        else:
-            operator.children.append(
-                _add_operator_recursive(
-                    pt.ProcessTree(operator=pt.Operator.XOR, parent=operator), threshold, act_key, logs, use_msd))
+        operator.children.append(
+            inductive_miner_variants(logs[0], activities, dfgs[0], threshold, operator, use_msd, **pool))
+        operator.children.append(
+            _add_operator_recursive(
+                pt.ProcessTree(operator=pt.Operator.XOR, parent=operator), threshold, activities, logs[1:], use_msd,
+                dfgs=dfgs[1:], **pool))
     return operator
+
+
+def _mine_children(operator, threshold, activities, logs, dfgs, use_msd, executor=None,
+                   parallel_min_variants=DEFAULT_PARALLEL_MIN_VARIANTS):
+    """
+    Mines the subtrees of the sibling sublogs of an operator. When a pool of processes is provided, and at least two
+    sublogs have parallel_min_variants variants, such sublogs are mined in the pool while the others are mined in the
+    current process (a single large sublog is mined in the current process, so that its own children can be
+    distributed). The subtrees are returned in the order of the sublogs.
+    """
+    large = []
+    if executor is not None:
+        large = [i for i, log in enumerate(logs) if len(log) >= parallel_min_variants]
+    if len(large) < 2:
+        large = []
+    futures = {i: executor.submit(_mine_subtree, logs[i], activities, dfgs[i], threshold, use_msd) for i in large}
+    children = []
+    for i, (log, dfg) in enumerate(zip(logs, dfgs)):
+        if i in futures:
+            children.append(None)
+        else:
+            children.append(inductive_miner_variants(log, activities, dfg, threshold, operator, use_msd,
+                                                     executor=executor, parallel_min_variants=parallel_min_variants))
+    for i, future in futures.items():
+        children[i] = future.result()
+        children[i].parent = operator
+    return children
+
+
+def _mine_subtree(variants, activities, dfg, threshold, use_msd):
+    # executed in a process of the pool: the subtree is mined sequentially and sent back (without parent)
+    return inductive_miner_variants(variants, activities, dfg, threshold, None, use_msd)
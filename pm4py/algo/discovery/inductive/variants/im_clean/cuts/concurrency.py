@@ -17,7 +17,7 @@
 from itertools import product
 
 import pm4py
-from pm4py.algo.discovery.inductive.variants.im_clean import utils
+from pm4py.algo.discovery.inductive.variants.im_clean import utils, variant_multiset
 from pm4py.objects.log.log import EventLog
 
 
@@ -56,3 +56,7 @@ def project(log, groups, activity_key):
             proj.append(pm4py.filter_trace(lambda e: e[activity_key] in group, t))
         logs.append(proj)
     return logs
+
+
+def project_variants(variants, groups, activities):
+    return [variant_multiset.project(variants, variant_multiset.get_mask(group, activities)) for group in groups]
@@ -20,8 +20,8 @@ from typing import List, Optional, Set, Counter, Dict
 import networkx as nx
 from networkx.classes.graph import Graph
 
-from pm4py.algo.discovery.inductive.variants.im_clean import utils as im_utils
-from pm4py.algo.discovery.inductive.variants.im_clean.d_types import Cut, DFG
+from pm4py.algo.discovery.inductive.variants.im_clean import utils as im_utils, variant_multiset
+from pm4py.algo.discovery.inductive.variants.im_clean.d_types import Cut, DFG, VariantMultiset
 from pm4py.objects.log.log import EventLog, Trace
 
 
@@ -130,7 +130,7 @@ def _compute_connected_components(dfg: DFG, alphabet: Set[str], start_activities
             del reduced_dfg[(a, b)]
     reduced_alphabet = set(alphabet).difference(do_set)
     nx_directed = im_utils.transform_dfg_to_directed_nx_graph(reduced_dfg, reduced_alphabet)
-    nx_undirected = nx_directed.to_undirected()
+    nx_undirected = nx_directed.to_undirected(as_view=True)
     return [nx_undirected.subgraph(c).copy() for c in nx.connected_components(nx_undirected)]
 
 
@@ -169,3 +169,43 @@ def _append_trace_to_redo_log(redo_trace: Trace, redo_logs: List[List[Trace]], r
             redo_logs[i].append(redo_trace)
         break
     return redo_logs
+
+
+def project_variants(variants: VariantMultiset, cut: Cut, activities: List[str]) -> List[VariantMultiset]:
+    '''
+    Projects a multiset of variants on the 'do' and 'redo' parts of a loop cut. Each variant is split in its maximal
+    pieces of 'do' (resp. 'redo') activities; each 'redo' piece is assigned to the group of its first activity.
+    '''
+    do_mask = variant_multiset.get_mask(cut[0], activities)
+    redo_index = {}
+    for i, group in enumerate(cut[1:]):
+        for a in group:
+            redo_index[a] = i
+    redo_index = [redo_index.get(a) for a in activities]
+    do_log = {}
+    redo_logs = [{} for group in cut[1:]]
+    for variant, count in variants.items():
+        do_start = 0
+        redo_start = None
+        for i, a in enumerate(variant):
+            if do_mask[a]:
+                if redo_start is not None:
+                    _add_to_redo_log(variant[redo_start:i], count, redo_logs, redo_index)
+                    redo_start = None
+                    do_start = i
+            elif redo_start is None:
+                redo_start = i
+                if i > do_start:
+                    variant_multiset.add_variant(do_log, variant[do_start:i], count)
+        if redo_start is not None:
+            _add_to_redo_log(variant[redo_start:], count, redo_logs, redo_index)
+            do_start = len(variant)
+        variant_multiset.add_variant(do_log, variant[do_start:], count)
+    logs = [do_log]
+    logs.extend(redo_logs)
+    return logs
+
+
+def _add_to_redo_log(redo_variant, count, redo_logs, redo_index):
+    if redo_index[redo_variant[0]] is not None:
+        variant_multiset.add_variant(redo_logs[redo_index[redo_variant[0]]], redo_variant, count)
@@ -18,7 +18,7 @@ from itertools import product
 
 import pm4py
 from pm4py.objects.log.log import EventLog
-from pm4py.algo.discovery.inductive.variants.im_clean import utils
+from pm4py.algo.discovery.inductive.variants.im_clean import utils, variant_multiset
 
 
 def detect(alphabet, transitive_predecessors, transitive_successors):
@@ -96,3 +96,22 @@ def _is_strict_subset(A, B):
 
 def _is_strict_superset(A, B):
     return A != B and A.issuperset(B)
+
+
+def project_variants(variants, groups, activities):
+    '''
+    This method projects a multiset of variants based on a presumed sequence cut and a list of activity groups
+    Parameters
+    ----------
+    variants
+        multiset of variants (tuples of activity indices)
+    groups
+        list of activity sets to be used in projection (activities can only appear in one group)
+    activities
+        list of the activities (associating each index to the activity)
+
+    Returns
+    -------
+        list of corresponding multisets of variants according to the sequence cut.
+    '''
+    return [variant_multiset.project(variants, variant_multiset.get_mask(group, activities)) for group in groups]
@@ -19,7 +19,7 @@ from typing import Optional, Dict
 import networkx as nx
 
 import pm4py
-from pm4py.algo.discovery.inductive.variants.im_clean import utils as im_utils
+from pm4py.algo.discovery.inductive.variants.im_clean import utils as im_utils, variant_multiset
 from pm4py.algo.discovery.inductive.variants.im_clean.d_types import DFG, Cut
 
 
@@ -48,15 +48,9 @@ def detect(dfg: DFG, alphabet: Dict[str, int]) -> Optional[Cut]:
 
     '''
     nx_dfg = im_utils.transform_dfg_to_directed_nx_graph(dfg, alphabet)
-    nx_und = nx_dfg.to_undirected()
-    conn_comps = [nx_und.subgraph(c).copy() for c in nx.connected_components(nx_und)]
-    if len(conn_comps) > 1:
-        cuts = list()
-        for comp in conn_comps:
-            cuts.append(set(comp.nodes))
-        return cuts
-    else:
-        return None
+    nx_und = nx_dfg.to_undirected(as_view=True)
+    cuts = [set(c) for c in nx.connected_components(nx_und)]
+    return cuts if len(cuts) > 1 else None
 
 
 def project(log, groups, activity_key):
@@ -66,3 +60,12 @@ def project(log, groups, activity_key):
     for group in groups:
         logs.append(pm4py.filter_log(lambda t: t[0][activity_key] in group, log))
     return logs
+
+
+def project_variants(variants, groups, activities):
+    # assumes that no empty variants are in the multiset
+    logs = list()
+    for group in groups:
+        mask = variant_multiset.get_mask(group, activities)
+        logs.append({variant: count for variant, count in variants.items() if mask[variant[0]]})
+    return logs
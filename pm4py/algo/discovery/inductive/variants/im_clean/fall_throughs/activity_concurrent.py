@@ -14,6 +14,7 @@
     You should have received a copy of the GNU General Public License
     along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
 '''
+from collections import Counter
 from typing import Dict, Optional, List
 
 import pm4py
@@ -21,6 +22,8 @@ from pm4py.algo.discovery.dfg import algorithm as discover_dfg
 from pm4py.algo.discovery.inductive.variants.im_clean.cuts import sequence as sequence_cut, loop as loop_cut, \
     xor as xor_cut, concurrency as concurrent_cut
 from pm4py.objects.dfg.utils import dfg_utils
+from pm4py.algo.discovery.inductive.variants.im_clean import variant_multiset
+from pm4py.algo.discovery.inductive.variants.im_clean.d_types import DFG, VariantMultiset
 from pm4py.objects.log.log import EventLog
 from pm4py.util import constants
 from pm4py.algo.discovery.minimum_self_distance import algorithm as msd_algo
@@ -35,7 +38,9 @@ def detect(log: EventLog, alphabet: Dict[str, int], act_key: str, use_msd: bool)
         candidates = candidates.intersection(set(map(lambda e: e[act_key], t)))
         if len(candidates) == 0:
             return None
-    for a in candidates:
+    # the candidates are considered in the order of the alphabet (the order of the set would depend on the hash seed,
+    # and on the order of the traces)
+    for a in [x for x in alphabet if x in candidates]:
         proj = EventLog()
         for t in log:
             proj.append(pm4py.filter_trace(lambda e: e[act_key] != a, t))
@@ -73,3 +78,124 @@ def project(log: EventLog, activity: str, activity_key: str) -> List[EventLog]:
         proj.append(pm4py.filter_trace(lambda e: e[activity_key] != activity, t))
         proj_act.append(pm4py.filter_trace(lambda e: e[activity_key] == activity, t))
     return [proj_act, proj]
+
+
+def detect_variants(variants: VariantMultiset, alphabet: Dict[str, int], activities: List[str], use_msd: bool,
+                    dfg: Optional[DFG] = None) -> Optional[str]:
+    """
+    Detects the activity-concurrent fall-through on a multiset of variants, reaching the same decision as the
+    detection on the event log.
+
+    The sublogs without each candidate activity are not materialized: a single pass over the variants collects,
+    for every candidate, the directly-follows arcs bridging its maximal runs and the activities following the runs
+    at the start of the traces. The DFG and the start activities of the sublog without the activity are then derived
+    from the ones of the current log, and ordered by their first occurrence in the sublog (as the cuts could depend
+    on the order of the arcs).
+
+    Parameters
+    --------------
+    variants
+        Multiset of variants
+    alphabet
+        Activities of the multiset of variants
+    activities
+        List of the activities (associating each index to the activity)
+    use_msd
+        Use the minimum self distance in the detection of the parallel cut
+    dfg
+        (if provided) DFG of the multiset of variants
+
+    Returns
+    --------------
+    activity
+        Activity that is concurrent to the rest of the log (None if the fall-through does not apply)
+    """
+    # the candidates are the activities occurring in every variant
+    candidates = None
+    for variant in variants:
+        candidates = set(variant) if candidates is None else candidates.intersection(variant)
+        if len(candidates) == 0:
+            return None
+    if candidates is None:
+        return None
+    # single pass over the variants, collecting the information on the maximal runs of the candidates
+    only = set()
+    bridges = {a: Counter() for a in candidates}
+    followers_at_start = {a: Counter() for a in candidates}
+    # first occurrence (index of the variant, position in the variant) of the arcs and the start activities
+    first_arcs = {}
+    first_bridges = {a: {} for a in candidates}
+    first_starts = {}
+    first_followers = {a: {} for a in candidates}
+    for v, (variant, count) in enumerate(variants.items()):
+        n = len(variant)
+        if n > 0:
+            first_starts.setdefault(activities[variant[0]], (v, 0))
+        for i in range(n - 1):
+            first_arcs.setdefault((activities[variant[i]], activities[variant[i + 1]]), (v, i))
+        i = 0
+        while i < n:
+            a = variant[i]
+            j = i
+            while j + 1 < n and variant[j + 1] == a:
+                j += 1
+            if a in candidates:
+                if i > 0 and j < n - 1:
+                    arc = (activities[variant[i - 1]], activities[variant[j + 1]])
+                    bridges[a][arc] += count
+                    first_bridges[a].setdefault(arc, (v, i - 1))
+                elif j < n - 1:
+                    followers_at_start[a][activities[variant[j + 1]]] += count
+                    first_followers[a].setdefault(activities[variant[j + 1]], (v, 0))
+                elif i == 0:
+                    # the removal of the activity would produce an empty trace
+                    only.add(a)
+            i = j + 1
+    candidates = {activities[a] for a in candidates if a not in only}
+    indices = {x: i for i, x in enumerate(activities)}
+    if dfg is None:
+        dfg = variant_multiset.get_dfg(variants, activities)
+    start_act = variant_multiset.get_start_activities(variants, activities)
+    end_act = variant_multiset.get_end_activities(variants, activities)
+    msd = None
+    # the candidates are considered in the order of the alphabet, as in the detection on the event log
+    for a in [x for x in alphabet if x in candidates]:
+        idx = indices[a]
+        dfg_proj = Counter({(x, y): c for (x, y), c in dfg.items() if x != a and y != a})
+        dfg_proj.update(bridges[idx])
+        dfg_proj = __sort_by_first_occurrence(dfg_proj, first_arcs, first_bridges[idx])
+        alphabet_proj = {x: c for x, c in alphabet.items() if x != a}
+        start_act_proj = Counter({x: c for x, c in start_act.items() if x != a})
+        start_act_proj.update(followers_at_start[idx])
+        start_act_proj = __sort_by_first_occurrence(start_act_proj, first_starts, first_followers[idx])
+        pre_proj, post_proj = dfg_utils.get_transitive_relations(dfg_proj, alphabet_proj)
+        cut = sequence_cut.detect(alphabet_proj, pre_proj, post_proj)
+        if cut is not None:
+            return a
+        cut = xor_cut.detect(dfg_proj, alphabet_proj)
+        if cut is not None:
+            return a
+        # the minimum self distance witnesses are the only information requiring a pass over the variants
+        msd_proj = None
+        if use_msd:
+            if msd is None:
+                msd = variant_multiset.get_msd(variants, activities)
+            msd_proj = variant_multiset.derive_msd_witnesses(variants, activities, msd, excluded=idx)
+        cut = concurrent_cut.detect(dfg_proj, alphabet_proj, start_act_proj, end_act, msd=msd_proj)
+        if cut is not None:
+            return a
+        cut = loop_cut.detect(dfg_proj, alphabet_proj, start_act_proj, end_act)
+        if cut is not None:
+            return a
+    return None
+
+
+def __sort_by_first_occurrence(counter: Counter, first: Dict, first_added: Dict) -> Counter:
+    # the elements are kept from the current log, or added by the removal of the activity (or both)
+    position = lambda x: min(p for p in (first.get(x), first_added.get(x)) if p is not None)
+    return Counter({x: counter[x] for x in sorted(counter, key=position)})
+
+
+def project_variants(variants: VariantMultiset, activity: str, activities: List[str]) -> List[VariantMultiset]:
+    return [variant_multiset.project(variants, [a == activity for a in activities]),
+            variant_multiset.project(variants, [a != activity for a in activities])]
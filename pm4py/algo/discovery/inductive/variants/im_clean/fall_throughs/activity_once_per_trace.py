@@ -14,9 +14,12 @@
     You should have received a copy of the GNU General Public License
     along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
 '''
+from collections import Counter
 from typing import Dict, Optional, List
 
 import pm4py
+from pm4py.algo.discovery.inductive.variants.im_clean import variant_multiset
+from pm4py.algo.discovery.inductive.variants.im_clean.d_types import VariantMultiset
 from pm4py.objects.log.log import EventLog
 
 
@@ -38,3 +41,20 @@ def project(log: EventLog, activity: str, activity_key: str) -> List[EventLog]:
     for t in log:
         proj.append(pm4py.filter_trace(lambda e: e[activity_key] != activity, t))
     return [proj]
+
+
+def detect_variants(variants: VariantMultiset, alphabet: Dict[str, int], activities: List[str]) -> Optional[str]:
+    # the candidates are removed from the same set of the detection on the event log (the removals do not change the
+    # order of the remaining elements), so the same activity is returned
+    candidates = set(alphabet.keys())
+    for variant in variants:
+        occurrences = Counter(activities[a] for a in variant)
+        for a in [x for x in candidates if occurrences[x] != 1]:
+            candidates.remove(a)
+        if len(candidates) == 0:
+            return None
+    return next(iter(candidates))
+
+
+def project_variants(variants: VariantMultiset, activity: str, activities: List[str]) -> List[VariantMultiset]:
+    return [variant_multiset.project(variants, [a != activity for a in activities])]
@@ -16,6 +16,8 @@
 '''
 from typing import Optional
 
+from pm4py.algo.discovery.inductive.variants.im_clean import variant_multiset
+from pm4py.algo.discovery.inductive.variants.im_clean.d_types import VariantMultiset
 from pm4py.objects.log.log import EventLog, Trace
 
 
@@ -29,3 +31,18 @@ def detect(log: EventLog, start_activities, act_key: str) -> Optional[EventLog]:
                 x = i
         proj.append(Trace(t[x:len(t)]))
     return proj if len(proj) > len(log) else None
+
+
+def detect_variants(variants: VariantMultiset, start_activities, activities) -> Optional[VariantMultiset]:
+    start_mask = variant_multiset.get_mask(start_activities, activities)
+    proj = {}
+    split = False
+    for variant, count in variants.items():
+        x = 0
+        for i in range(1, len(variant)):
+            if start_mask[variant[i]]:
+                variant_multiset.add_variant(proj, variant[x:i], count)
+                x = i
+                split = True
+        variant_multiset.add_variant(proj, variant[x:len(variant)], count)
+    return proj if split else None
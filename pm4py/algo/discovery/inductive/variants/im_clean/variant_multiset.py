@@ -0,0 +1,226 @@
+'''
+    This file is part of PM4Py (More Info: https://pm4py.fit.fraunhofer.de).
+
+    PM4Py is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    PM4Py is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
+'''
+from collections import Counter
+from typing import Dict, List, Tuple, Set, Iterable, Optional, Any
+
+from pm4py.algo.discovery.inductive.variants.im_clean.d_types import DFG, VariantMultiset
+from pm4py.util import variants_util
+
+# compact representation of the (sub)logs handled by the inductive miner: a multiset of variants, i.e., a dictionary
+# associating tuples of activity indices to their multiplicity. The indices refer to a list of activities that is
+# shared by all the sublogs of the recursion. The dictionaries keep the order of first occurrence of the variants,
+# so the alphabet, the DFG and the start/end activities are obtained in the same order as on the corresponding log.
+
+
+def from_log(log, activity_key: str) -> Tuple[List[str], VariantMultiset]:
+    """
+    Builds the multiset of variants of an event log
+
+    Parameters
+    ------------
+    log
+        Event log
+    activity_key
+        Attribute to use as activity
+
+    Returns
+    ------------
+    activities
+        List of the activities (the position in the list is the index of the activity)
+    variants
+        Multiset of variants
+    """
+    indices = {}
+    activities = []
+    variants = {}
+    for trace in log:
+        variant = []
+        for event in trace:
+            activity = event[activity_key]
+            if activity not in indices:
+                indices[activity] = len(activities)
+                activities.append(activity)
+            variant.append(indices[activity])
+        variant = tuple(variant)
+        variants[variant] = variants.get(variant, 0) + 1
+    return activities, variants
+
+
+def from_variants(variants_dict: Dict[Any, Any], parameters: Optional[Dict[Any, Any]] = None) -> Tuple[
+    List[str], VariantMultiset]:
+    """
+    Builds the multiset of variants from a dictionary of variants (associating each variant to its count,
+    or to the list of its traces)
+
+    Parameters
+    ------------
+    variants_dict
+        Dictionary of variants
+    parameters
+        Parameters (the variant delimiter is used when the variants are strings)
+
+    Returns
+    ------------
+    activities
+        List of the activities (the position in the list is the index of the activity)
+    variants
+        Multiset of variants
+    """
+    indices = {}
+    activities = []
+    variants = {}
+    for var, val in variants_dict.items():
+        if type(val) is list:
+            val = len(val)
+        variant = []
+        for activity in variants_util.get_activities_from_variant(var, parameters=parameters):
+            if activity not in indices:
+                indices[activity] = len(activities)
+                activities.append(activity)
+            variant.append(indices[activity])
+        variant = tuple(variant)
+        variants[variant] = variants.get(variant, 0) + val
+    return activities, variants
+
+
+def get_number_of_traces(variants: VariantMultiset) -> int:
+    return sum(variants.values())
+
+
+def get_alphabet(variants: VariantMultiset, activities: List[str]) -> Dict[str, int]:
+    """
+    Gets the activities occurring in the variants, associated to their number of occurrences
+    """
+    counts = {}
+    for variant, count in variants.items():
+        for a in variant:
+            counts[a] = counts.get(a, 0) + count
+    return {activities[a]: c for a, c in counts.items()}
+
+
+def get_dfg(variants: VariantMultiset, activities: List[str]) -> DFG:
+    """
+    Gets the directly-follows graph of the variants
+    """
+    dfg = Counter()
+    for variant, count in variants.items():
+        for i in range(len(variant) - 1):
+            dfg[(activities[variant[i]], activities[variant[i + 1]])] += count
+    return dfg
+
+
+def restrict_dfg(dfg: DFG, group: Set[str]) -> DFG:
+    """
+    Restricts a directly-follows graph to the arcs between activities of the group. This is the DFG of a projection
+    that keeps contiguous pieces of the traces (e.g. the projections of the XOR and loop cuts)
+    """
+    return Counter({(a, b): c for (a, b), c in dfg.items() if a in group and b in group})
+
+
+def get_start_activities(variants: VariantMultiset, activities: List[str]) -> Dict[str, int]:
+    start_activities = {}
+    for variant, count in variants.items():
+        if variant:
+            a = activities[variant[0]]
+            start_activities[a] = start_activities.get(a, 0) + count
+    return start_activities
+
+
+def get_end_activities(variants: VariantMultiset, activities: List[str]) -> Dict[str, int]:
+    end_activities = {}
+    for variant, count in variants.items():
+        if variant:
+            a = activities[variant[-1]]
+            end_activities[a] = end_activities.get(a, 0) + count
+    return end_activities
+
+
+def get_mask(group: Iterable[str], activities: List[str]) -> List[bool]:
+    """
+    Gets the mask (list of booleans indexed by the activity index) of the activities of the group
+    """
+    group = set(group)
+    return [a in group for a in activities]
+
+
+def add_variant(variants: VariantMultiset, variant: Tuple[int, ...], count: int):
+    variants[variant] = variants.get(variant, 0) + count
+
+
+def project(variants: VariantMultiset, mask: List[bool]) -> VariantMultiset:
+    """
+    Projects each variant on the activities enabled by the mask (variants that become equal are merged)
+    """
+    proj = {}
+    for variant, count in variants.items():
+        add_variant(proj, tuple(a for a in variant if mask[a]), count)
+    return proj
+
+
+def get_msd(variants: VariantMultiset, activities: List[str]) -> Dict[str, int]:
+    """
+    Computes the minimum self distance of the activities (as the minimum_self_distance algorithm on the log)
+    """
+    msd = {}
+    for variant in variants:
+        last_position = {}
+        for i, a in enumerate(variant):
+            if a in last_position:
+                distance = i - last_position[a] - 1
+                if a not in msd or distance < msd[a]:
+                    msd[a] = distance
+            last_position[a] = i
+    return {activities[a]: d for a, d in msd.items()}
+
+
+def derive_msd_witnesses(variants: VariantMultiset, activities: List[str], msd: Dict[str, int],
+                         excluded: Optional[int] = None) -> Dict[str, Set[str]]:
+    """
+    Derives the minimum self distance witnesses (as the minimum_self_distance utilities on the log)
+
+    Parameters
+    ------------
+    variants
+        Multiset of variants
+    activities
+        List of the activities
+    msd
+        Minimum self distance of the activities
+    excluded
+        (if provided) index of an activity that is removed from the variants, i.e., the witnesses are derived
+        on the projection of the variants on the other activities (without building it)
+
+    Returns
+    ------------
+    witnesses
+        Dictionary associating each activity (having a positive minimum self distance) to its witnesses
+    """
+    witnesses = {}
+    for variant in variants:
+        if excluded is not None:
+            variant = [a for a in variant if a != excluded]
+        last_position = {}
+        for i, a in enumerate(variant):
+            name = activities[a]
+            if name in msd and msd[name] > 0:
+                if name not in witnesses:
+                    witnesses[name] = set()
+                if a in last_position and i - last_position[a] - 1 == msd[name]:
+                    for b in variant[last_position[a] + 1:i]:
+                        witnesses[name].add(activities[b])
+            last_position[a] = i
+    return witnesses
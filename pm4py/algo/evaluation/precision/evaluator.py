@@ -16,6 +16,7 @@
 '''
 from pm4py.algo.evaluation.precision.variants import etconformance_token
 from pm4py.algo.evaluation.precision.variants import align_etconformance
+from pm4py.algo.evaluation.precision.variants import align_etconformance_trie
 from pm4py.objects.conversion.log import converter as log_conversion
 from pm4py.objects.petri.check_soundness import check_easy_soundness_net_in_fin_marking
 from enum import Enum
@@ -25,12 +26,14 @@ from pm4py.util import exec_utils
 class Variants(Enum):
     ETCONFORMANCE_TOKEN = etconformance_token
     ALIGN_ETCONFORMANCE = align_etconformance
+    ALIGN_ETCONFORMANCE_TRIE = align_etconformance_trie
 
 
 ETCONFORMANCE_TOKEN = Variants.ETCONFORMANCE_TOKEN
 ALIGN_ETCONFORMANCE = Variants.ALIGN_ETCONFORMANCE
+ALIGN_ETCONFORMANCE_TRIE = Variants.ALIGN_ETCONFORMANCE_TRIE
 
-VERSIONS = {ETCONFORMANCE_TOKEN, ALIGN_ETCONFORMANCE}
+VERSIONS = {ETCONFORMANCE_TOKEN, ALIGN_ETCONFORMANCE, ALIGN_ETCONFORMANCE_TRIE}
 
 
 def apply(log, net, marking, final_marking, parameters=None, variant=None):
@@ -54,6 +57,7 @@ def apply(log, net, marking, final_marking, parameters=None, variant=None):
         Variant of the algorithm that should be applied:
             - Variants.ETCONFORMANCE_TOKEN
             - Variants.ALIGN_ETCONFORMANCE
+            - Variants.ALIGN_ETCONFORMANCE_TRIE
     """
     if parameters is None:
         parameters = {}
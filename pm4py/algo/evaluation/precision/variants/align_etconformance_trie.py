@@ -0,0 +1,241 @@
+'''
+    This file is part of PM4Py (More Info: https://pm4py.fit.fraunhofer.de).
+
+    PM4Py is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    PM4Py is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
+'''
+import heapq
+from collections import deque
+
+from pm4py.algo.evaluation.precision.parameters import Parameters
+from pm4py.objects import log as log_lib
+from pm4py.objects.petri import align_utils as utils
+from pm4py.objects.petri import check_soundness
+from pm4py.objects.petri import compiled_net
+from pm4py.objects.trie.definition import Trie
+from pm4py.statistics.start_activities.log.get import get_start_activities
+from pm4py.util import exec_utils
+
+
+def apply(log, net, marking, final_marking, parameters=None):
+    """
+    Get Align-ET Conformance precision, aligning the prefixes of the log along their prefix trie.
+
+    Instead of aligning every prefix from scratch, a single uniform-cost search is done on the product of the
+    Petri net with the prefix trie of the log, so the search work done for a prefix is shared by all its extensions.
+    For each prefix, the markings in which the optimal alignments (synchronous moves and moves on invisible
+    transitions) stop are the same as in the Align-ET Conformance variant. The visible transitions eventually
+    enabled by a marking are computed once per marking.
+
+    Parameters
+    ----------
+    log
+        Trace log
+    net
+        Petri net
+    marking
+        Initial marking
+    final_marking
+        Final marking
+    parameters
+        Parameters of the algorithm, including:
+            Parameters.ACTIVITY_KEY -> Activity key
+
+    Returns
+    ----------
+    precision
+        Precision value
+    """
+    if parameters is None:
+        parameters = {}
+
+    activity_key = exec_utils.get_param_value(Parameters.ACTIVITY_KEY, parameters, log_lib.util.xes.DEFAULT_NAME_KEY)
+
+    # default value for precision, when no activated transitions (not even by looking at the initial marking) are found
+    precision = 1.0
+    sum_ee = 0
+    sum_at = 0
+
+    if not check_soundness.check_easy_soundness_net_in_fin_marking(net, marking, final_marking):
+        raise Exception("trying to apply Align-ETConformance on a Petri net that is not a easy sound net!!")
+
+    root, prefix_count = build_prefix_trie(log, activity_key=activity_key)
+    cnet = compiled_net.construct(net)
+    all_markings = align_prefix_trie_stop_markings(cnet, cnet.encode_marking(marking), root, prefix_count)
+
+    closure_cache = utils.get_visible_transitions_closure_cache(net)
+    closures = {}
+    for node, count in prefix_count.items():
+        markings = all_markings[node]
+        if markings is not None:
+            log_transitions = set(child.label for child in node.children)
+            activated_transitions_labels = set()
+            for m in markings:
+                if m not in closures:
+                    closures[m] = set(x.label for x in closure_cache.get(net, cnet.decode_marking(m)) if
+                                      x.label is not None)
+                activated_transitions_labels = activated_transitions_labels.union(closures[m])
+            escaping_edges = activated_transitions_labels.difference(log_transitions)
+
+            sum_at += len(activated_transitions_labels) * count
+            sum_ee += len(escaping_edges) * count
+
+    # the empty prefix is counted as in the Align-ET Conformance variant
+    start_activities = set(get_start_activities(log, parameters=parameters))
+    trans_en_ini_marking = set(
+        [x.label for x in utils.get_visible_transitions_eventually_enabled_by_marking(net, marking)])
+    diff = trans_en_ini_marking.difference(start_activities)
+    sum_at += len(log) * len(trans_en_ini_marking)
+    sum_ee += len(log) * len(diff)
+
+    if sum_at > 0:
+        precision = 1 - float(sum_ee) / float(sum_at)
+
+    return precision
+
+
+def build_prefix_trie(log, activity_key=log_lib.util.xes.DEFAULT_NAME_KEY):
+    """
+    Builds the prefix trie of the log
+
+    Parameters
+    -------------
+    log
+        Trace log
+    activity_key
+        Activity key
+
+    Returns
+    -------------
+    root
+        Root of the trie (the children of a node are the activities following the prefix in the log)
+    prefix_count
+        Dictionary associating to each (non-empty) prefix followed by an activity in the log, the number of traces
+        in which the prefix is followed by an activity
+    """
+    root = Trie()
+    prefix_count = {}
+    for trace in log:
+        node = root
+        for i, event in enumerate(trace):
+            if i > 0:
+                prefix_count[node] = prefix_count.get(node, 0) + 1
+            activity = event[activity_key]
+            child = None
+            for c in node.children:
+                if c.label == activity:
+                    child = c
+                    break
+            if child is None:
+                child = Trie(label=activity, parent=node, depth=node.depth + 1)
+                node.children.append(child)
+            node = child
+        node.final = True
+    return root, prefix_count
+
+
+def align_prefix_trie_stop_markings(cnet, ini, root, prefix_count):
+    """
+    Gets, for each prefix, the markings in which the optimal alignments of the prefix stop. The alignments use only
+    synchronous moves (cost 0) and moves on invisible transitions (cost 1), as in the Align-ET Conformance variant.
+
+    The states of the search are couples (encoded marking, node of the trie). The optimal markings of a prefix are
+    final when the search goes beyond their cost, and the states of a node are not expanded anymore when the
+    markings of all the prefixes in its subtree are final.
+
+    Parameters
+    -------------
+    cnet
+        Compiled Petri net
+    ini
+        Encoded initial marking
+    root
+        Root of the prefix trie
+    prefix_count
+        Prefixes to align (nodes of the trie)
+
+    Returns
+    -------------
+    markings
+        Dictionary associating to each prefix the list of (encoded) markings in which its optimal alignments stop,
+        or None if the prefix cannot be replayed on the model
+    """
+    invisible_transitions = [t for t, label in enumerate(cnet.labels) if label is None]
+    transitions_per_label = {}
+    for t, label in enumerate(cnet.labels):
+        if label is not None:
+            transitions_per_label.setdefault(label, []).append(t)
+
+    # number of prefixes, in the subtree of each node, whose markings are not final yet
+    pending = {}
+    for node in prefix_count:
+        ancestor = node
+        while ancestor is not None:
+            pending[ancestor] = pending.get(ancestor, 0) + 1
+            ancestor = ancestor.parent
+
+    markings = {node: None for node in prefix_count}
+    optimal_cost = {}
+    # prefixes whose optimal cost is known, in increasing order of cost
+    found = deque()
+    closed = set()
+    best_g = {(ini, root): 0}
+    counter = 0
+    open_set = [(0, counter, ini, root)]
+
+    while open_set and pending.get(root, 0) > 0:
+        g, _, m, node = heapq.heappop(open_set)
+
+        while found and found[0][0] < g:
+            ancestor = found.popleft()[1]
+            while ancestor is not None:
+                pending[ancestor] -= 1
+                ancestor = ancestor.parent
+
+        state = (m, node)
+        if state in closed:
+            continue
+        closed.add(state)
+
+        if node in prefix_count:
+            if node not in optimal_cost:
+                optimal_cost[node] = g
+                markings[node] = [m]
+                found.append((g, node))
+            elif optimal_cost[node] == g:
+                markings[node].append(m)
+
+        if pending.get(node, 0) == 0:
+            continue
+
+        successors = [(cnet.execute(t, m), node, utils.STD_TAU_COST) for t in invisible_transitions if
+                      cnet.is_enabled(t, m)]
+        for child in node.children:
+            if pending.get(child, 0) == 0:
+                continue
+            for t in transitions_per_label.get(child.label, []):
+                if cnet.is_enabled(t, m):
+                    successors.append((cnet.execute(t, m), child, utils.STD_SYNC_COST))
+
+        for new_m, new_node, cost in successors:
+            new_state = (new_m, new_node)
+            if new_state in closed:
+                continue
+            new_g = g + cost
+            if new_state in best_g and best_g[new_state] <= new_g:
+                continue
+            best_g[new_state] = new_g
+            counter += 1
+            heapq.heappush(open_set, (new_g, counter, new_m, new_node))
+
+    return markings
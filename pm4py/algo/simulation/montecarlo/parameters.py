@@ -33,3 +33,5 @@ class Parameters(Enum):
     PARAM_DEFAULT_NUM_RESOURCES_PER_PLACE = "default_num_resources_per_place"
     PARAM_SMALL_SCALE_FACTOR = "small_scale_factor"
     PARAM_MAX_THREAD_EXECUTION_TIME = "max_thread_exec_time"
+    PARAM_SEED = "seed"
+    PARAM_MAX_CASE_STEPS = "max_case_steps"
@@ -14,7 +14,7 @@
     You should have received a copy of the GNU General Public License
     along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
 '''
-from pm4py.algo.simulation.montecarlo.variants import petri_semaph_fifo
+from pm4py.algo.simulation.montecarlo.variants import petri_semaph_fifo, petri_discrete_event
 from pm4py.algo.simulation.montecarlo.outputs import Outputs
 from pm4py.util import exec_utils
 from enum import Enum
@@ -22,11 +22,12 @@ from enum import Enum
 
 class Variants(Enum):
     PETRI_SEMAPH_FIFO = petri_semaph_fifo
+    PETRI_DISCRETE_EVENT = petri_discrete_event
 
 
 DEFAULT_VARIANT = Variants.PETRI_SEMAPH_FIFO
 
-VERSIONS = {Variants.PETRI_SEMAPH_FIFO}
+VERSIONS = {Variants.PETRI_SEMAPH_FIFO, Variants.PETRI_DISCRETE_EVENT}
 
 
 def apply(log, net, im, fm, variant=DEFAULT_VARIANT, parameters=None):
@@ -47,6 +48,7 @@ def apply(log, net, im, fm, variant=DEFAULT_VARIANT, parameters=None):
     variant
         Variant of the algorithm to use:
         - Variants.PETRI_SEMAPH_FIFO
+        - Variants.PETRI_DISCRETE_EVENT (single-threaded, event calendar with virtual clocks)
     parameters
         Parameters of the algorithm:
             Parameters.PARAM_NUM_SIMULATIONS => (default: 100)
@@ -63,6 +65,9 @@ def apply(log, net, im, fm, variant=DEFAULT_VARIANT, parameters=None):
             Parameters.PARAM_SMALL_SCALE_FACTOR => Scale factor for the sleeping time of the actual simulation
             (default: 864000.0, 10gg)
             Parameters.PARAM_MAX_THREAD_EXECUTION_TIME => Maximum execution time per thread (default: 60.0, 1 minute)
+            Parameters.PARAM_SEED => Seed of the simulation (only Variants.PETRI_DISCRETE_EVENT; default: None)
+            Parameters.PARAM_MAX_CASE_STEPS => Maximum number of transitions fired per case
+            (only Variants.PETRI_DISCRETE_EVENT; default: 10000)
 
     Returns
     ------------
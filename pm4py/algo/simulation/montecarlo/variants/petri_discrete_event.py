@@ -0,0 +1,426 @@
+'''
+    This file is part of PM4Py (More Info: https://pm4py.fit.fraunhofer.de).
+
+    PM4Py is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    PM4Py is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
+'''
+import datetime
+import heapq
+import logging
+from bisect import bisect_right
+from collections import deque
+from statistics import median
+from time import time
+
+import numpy as np
+
+from pm4py.algo.simulation.montecarlo.outputs import Outputs
+from pm4py.algo.simulation.montecarlo.parameters import Parameters
+from pm4py.algo.simulation.montecarlo.utils import replay
+from pm4py.objects.log.log import EventLog, Trace, Event
+from pm4py.objects.petri import compiled_net
+from pm4py.statistics.traces.log import case_arrival
+from pm4py.util import exec_utils, xes_constants
+
+# number of random values that are extracted at once from each distribution
+SAMPLES_BATCH_SIZE = 1024
+
+# kinds of the events of the calendar
+ARRIVAL = 0
+RESUME = 1
+COMPLETION = 2
+TIMEOUT = 3
+
+
+class SampleBuffer(object):
+    def __init__(self, function, batch_size=SAMPLES_BATCH_SIZE):
+        """
+        Buffer of random values, that are extracted in batches from the given function
+
+        Parameters
+        -------------
+        function
+            Function accepting the number of values to extract
+        batch_size
+            Number of values extracted at once
+        """
+        self.function = function
+        self.batch_size = batch_size
+        self.values = []
+        self.index = 0
+
+    def next(self):
+        if self.index >= len(self.values):
+            self.values = self.function(self.batch_size)
+            self.index = 0
+        self.index += 1
+        return self.values[self.index - 1]
+
+
+class SimulatedCase(object):
+    def __init__(self, id, marking, arrival_time):
+        """
+        State of a simulated case
+
+        Parameters
+        -------------
+        id
+            Identifier
+        marking
+            Current (encoded) marking
+        arrival_time
+            Time of arrival of the case
+        """
+        self.id = id
+        self.marking = marking
+        # virtual clock of the case: time in which the current transition has been chosen
+        self.clock = arrival_time
+        # transition in execution (None when the case is waiting for the resource of the source place)
+        self.transition = None
+        self.duration = 0.0
+        # places in which a resource should be acquired before executing the transition
+        self.pending = []
+        self.pending_index = 0
+        # number of resources held by the case, per place
+        self.held = {}
+        # times in which the tokens of the case have been put in the places (FIFO)
+        self.token_times = {}
+        self.trace = Trace()
+        self.steps = 0
+        self.terminated_correctly = False
+        self.aborted = False
+
+
+def apply(log, net, im, fm, parameters=None):
+    """
+    Performs a Monte Carlo simulation of an accepting Petri net without duplicate transitions and where the preset is always
+    distinct from the postset (discrete-event variant; the cases are simulated on virtual clocks by a single-threaded
+    engine, that processes a calendar of events ordered by time. The resources of the places are granted in FIFO order,
+    as in the semaphores-based variant, without sleeping and without the need of a thread per case)
+
+    Parameters
+    -------------
+    log
+        Event log
+    net
+        Accepting Petri net without duplicate transitions and where the preset is always distinct from the postset
+    im
+        Initial marking
+    fm
+        Final marking
+    parameters
+        Parameters of the algorithm:
+            PARAM_NUM_SIMULATIONS => (default: 100)
+            PARAM_FORCE_DISTRIBUTION => Force a particular stochastic distribution (e.g. normal) when the stochastic map
+            is discovered from the log (default: None; no distribution is forced)
+            PARAM_ENABLE_DIAGNOSTICS => Enable the printing of diagnostics (default: True)
+            PARAM_CASE_ARRIVAL_RATIO => Case arrival of new cases (default: None; inferred from the log)
+            PARAM_PROVIDED_SMAP => Stochastic map that is used in the simulation (default: None; inferred from the log)
+            PARAM_MAP_RESOURCES_PER_PLACE => Specification of the number of resources available per place
+            (default: None; each place gets the default number of resources)
+            PARAM_DEFAULT_NUM_RESOURCES_PER_PLACE => Default number of resources per place when not specified
+            (default: 1; each place gets 1 resource and has to wait for the resource to finish)
+            PARAM_SMALL_SCALE_FACTOR, PARAM_MAX_THREAD_EXECUTION_TIME => The cases that are not completed after
+            PARAM_MAX_THREAD_EXECUTION_TIME * PARAM_SMALL_SCALE_FACTOR units of (simulated) time from their arrival
+            are aborted and release their resources, as the threads of the semaphores-based variant on timeout
+            (default: 60.0 * 864000)
+            PARAM_SEED => Seed of the random number generator; the same seed gives the same simulation
+            (default: None; the current state of the NumPy random number generator is used)
+            PARAM_MAX_CASE_STEPS => Maximum number of transitions fired per case; the cases exceeding it are discarded
+            (default: 10000)
+
+    Returns
+    ------------
+    simulated_log
+        Simulated event log
+    simulation_result
+        Result of the simulation:
+            Outputs.OUTPUT_PLACES_INTERVAL_TREES => inteval trees that associate to each place the times in which it was occupied.
+            Outputs.OUTPUT_TRANSITIONS_INTERVAL_TREES => interval trees that associate to each transition the intervals of time
+            in which it could not fire because some token was in the output.
+            Outputs.OUTPUT_CASES_EX_TIME => Throughput time of the cases included in the simulated log
+            Outputs.OUTPUT_MEDIAN_CASES_EX_TIME => Median of the throughput times
+            Outputs.OUTPUT_CASE_ARRIVAL_RATIO => Case arrival ratio that was specified in the simulation
+            Outputs.OUTPUT_TOTAL_CASES_TIME => Total time occupied by cases of the simulated log
+    """
+    if parameters is None:
+        parameters = {}
+
+    timestamp_key = exec_utils.get_param_value(Parameters.TIMESTAMP_KEY, parameters,
+                                               xes_constants.DEFAULT_TIMESTAMP_KEY)
+    no_simulations = exec_utils.get_param_value(Parameters.PARAM_NUM_SIMULATIONS, parameters,
+                                                100)
+    force_distribution = exec_utils.get_param_value(Parameters.PARAM_FORCE_DISTRIBUTION, parameters,
+                                                    None)
+    enable_diagnostics = exec_utils.get_param_value(Parameters.PARAM_ENABLE_DIAGNOSTICS, parameters,
+                                                    True)
+    case_arrival_ratio = exec_utils.get_param_value(Parameters.PARAM_CASE_ARRIVAL_RATIO, parameters,
+                                                    None)
+    smap = exec_utils.get_param_value(Parameters.PARAM_PROVIDED_SMAP, parameters,
+                                      None)
+    resources_per_places = exec_utils.get_param_value(Parameters.PARAM_MAP_RESOURCES_PER_PLACE, parameters,
+                                                      None)
+    default_num_resources_per_places = exec_utils.get_param_value(Parameters.PARAM_DEFAULT_NUM_RESOURCES_PER_PLACE,
+                                                                  parameters, 1)
+    small_scale_factor = exec_utils.get_param_value(Parameters.PARAM_SMALL_SCALE_FACTOR, parameters,
+                                                    864000)
+    max_thread_exec_time = exec_utils.get_param_value(Parameters.PARAM_MAX_THREAD_EXECUTION_TIME, parameters,
+                                                      60.0)
+    seed = exec_utils.get_param_value(Parameters.PARAM_SEED, parameters, None)
+    max_case_steps = exec_utils.get_param_value(Parameters.PARAM_MAX_CASE_STEPS, parameters, 10000)
+
+    if case_arrival_ratio is None:
+        case_arrival_ratio = case_arrival.get_case_arrival_avg(log, parameters=parameters)
+    if resources_per_places is None:
+        resources_per_places = {}
+
+    logging.basicConfig()
+    logger = logging.getLogger(__name__)
+    logger.setLevel(logging.DEBUG)
+
+    # when the user does not specify any map from transitions to random variables,
+    # a replay operation is performed
+    if smap is None:
+        if enable_diagnostics:
+            logger.info(str(time()) + " started the replay operation.")
+        if force_distribution is not None:
+            smap = replay.get_map_from_log_and_net(log, net, im, fm, force_distribution=force_distribution,
+                                                   parameters=parameters)
+        else:
+            smap = replay.get_map_from_log_and_net(log, net, im, fm, parameters=parameters)
+        if enable_diagnostics:
+            logger.info(str(time()) + " ended the replay operation.")
+
+    # the random variables extract their values from the global NumPy generator: it is seeded for the simulation,
+    # and its state is restored afterwards
+    random_state = None
+    if seed is not None:
+        random_state = np.random.get_state()
+        np.random.seed(seed)
+    try:
+        list_cases, cases_ex_time, places_intervals, transitions_intervals = __simulate(
+            net, im, fm, smap, resources_per_places, default_num_resources_per_places, no_simulations,
+            case_arrival_ratio, max_thread_exec_time * small_scale_factor, max_case_steps)
+    finally:
+        if random_state is not None:
+            np.random.set_state(random_state)
+
+    if enable_diagnostics:
+        logger.info(str(time()) + " ended the Monte carlo simulation.")
+
+    from intervaltree import IntervalTree, Interval
+
+    places_interval_trees = {p: IntervalTree(Interval(x, y) for x, y in places_intervals[p]) for p in net.places}
+    transitions_interval_trees = {t.name: IntervalTree(Interval(x, y) for x, y in transitions_intervals[t]) for t in
+                                  net.transitions}
+
+    log = EventLog(list_cases)
+    min_timestamp = log[0][0][timestamp_key].timestamp()
+    max_timestamp = max(y[timestamp_key].timestamp() for x in log for y in x)
+
+    return log, {Outputs.OUTPUT_PLACES_INTERVAL_TREES.value: places_interval_trees,
+                 Outputs.OUTPUT_TRANSITIONS_INTERVAL_TREES.value: transitions_interval_trees,
+                 Outputs.OUTPUT_CASES_EX_TIME.value: cases_ex_time,
+                 Outputs.OUTPUT_MEDIAN_CASES_EX_TIME.value: median(cases_ex_time),
+                 Outputs.OUTPUT_CASE_ARRIVAL_RATIO.value: case_arrival_ratio,
+                 Outputs.OUTPUT_TOTAL_CASES_TIME.value: max_timestamp - min_timestamp}
+
+
+def __simulate(net, im, fm, smap, resources_per_places, default_num_resources_per_places, no_simulations,
+               case_arrival_ratio, case_timeout, max_case_steps):
+    """
+    Runs the discrete-event simulation of the cases
+
+    Returns
+    -------------
+    list_cases
+        Traces of the cases that terminated correctly (in order of arrival)
+    cases_ex_time
+        Throughput times of the cases that terminated correctly
+    places_intervals
+        Intervals of time in which the places were occupied
+    transitions_intervals
+        Intervals of time in which the transitions waited for the resources of their output places
+    """
+    cnet = compiled_net.construct(net)
+    places = cnet.places
+    transitions = cnet.transitions
+    labels = cnet.labels
+    encoded_im = cnet.encode_marking(im)
+    final_places = [(i, n) for i, n in enumerate(cnet.encode_marking(fm)) if n > 0]
+    source = places.index(list(im)[0])
+    # one resource is needed for each place of the preset/postset (independently from the weight of the arcs)
+    preset = [[p for p, w in enumerate(cnet.pre[t]) if w > 0] for t in range(len(transitions))]
+    postset = [[p for p, w in enumerate(cnet.post[t]) if w > 0] for t in range(len(transitions))]
+
+    capacity = [resources_per_places[p] if p in resources_per_places else default_num_resources_per_places
+                for p in places]
+    occupied = [0] * len(places)
+    waiting = [deque() for p in places]
+    places_intervals = {p: [] for p in places}
+    transitions_intervals = {t: [] for t in transitions}
+
+    weights = [smap[t].get_weight() if t in smap else 1.0 for t in transitions]
+    durations = [SampleBuffer(smap[t].get_values) if t in smap else None for t in transitions]
+    uniform = SampleBuffer(lambda n: np.random.random(n).tolist())
+    choices_cache = {}
+    # for each reached (encoded) marking: whether it covers the final marking, and the enabled transitions
+    markings_cache = {}
+    firings_cache = {}
+
+    calendar = []
+    # tie-breaker of the events happening at the same time (keeps the simulation deterministic)
+    counter = 0
+
+    def schedule(event_time, kind, case):
+        nonlocal counter
+        counter += 1
+        heapq.heappush(calendar, (event_time, counter, kind, case))
+
+    def pick_transition(enabled):
+        key = tuple(enabled)
+        if key not in choices_cache:
+            cumulative = np.cumsum([weights[t] for t in enabled])
+            if cumulative[-1] == 0:
+                cumulative = np.arange(1, len(enabled) + 1, dtype=np.float64)
+            choices_cache[key] = (cumulative / cumulative[-1]).tolist()
+        return enabled[min(bisect_right(choices_cache[key], uniform.next()), len(enabled) - 1)]
+
+    def sample_duration(t):
+        if durations[t] is None:
+            return 0.0
+        value = -1
+        while value < 0:
+            value = durations[t].next()
+        return value
+
+    def release(case, p, current_time):
+        case.held[p] -= 1
+        if case.held[p] == 0:
+            del case.held[p]
+        occupied[p] -= 1
+        while waiting[p] and waiting[p][0].aborted:
+            waiting[p].popleft()
+        if waiting[p]:
+            # the resource is granted to the first case that is waiting for it
+            next_case = waiting[p].popleft()
+            occupied[p] += 1
+            next_case.held[p] = next_case.held.get(p, 0) + 1
+            next_case.pending_index += 1
+            schedule(current_time, RESUME, next_case)
+
+    def release_all(case, current_time):
+        for p in list(case.held):
+            while p in case.held:
+                release(case, p, current_time)
+
+    def acquire(case, current_time):
+        while case.pending_index < len(case.pending):
+            p = case.pending[case.pending_index]
+            if occupied[p] >= capacity[p]:
+                waiting[p].append(case)
+                return
+            occupied[p] += 1
+            case.held[p] = case.held.get(p, 0) + 1
+            case.pending_index += 1
+        if case.transition is None:
+            # the case obtained the resource of the source place
+            case.token_times.setdefault(source, deque()).append(current_time)
+            case.clock = current_time
+            step(case, current_time)
+        else:
+            waiting_time = current_time - case.clock
+            if waiting_time > 0:
+                transitions_intervals[transitions[case.transition]].append((case.clock, current_time))
+            schedule(case.clock + max(case.duration, waiting_time), COMPLETION, case)
+
+    def step(case, current_time):
+        if case.marking not in markings_cache:
+            markings_cache[case.marking] = (all(case.marking[p] >= n for p, n in final_places),
+                                            cnet.enabled_transitions(case.marking))
+        is_final, enabled = markings_cache[case.marking]
+        if is_final:
+            case.terminated_correctly = True
+            release_all(case, current_time)
+            return
+        if not enabled or case.steps >= max_case_steps:
+            release_all(case, current_time)
+            return
+        t = pick_transition(enabled)
+        case.steps += 1
+        case.transition = t
+        case.duration = sample_duration(t)
+        case.clock = current_time
+        case.pending = postset[t]
+        case.pending_index = 0
+        acquire(case, current_time)
+
+    def complete(case, current_time):
+        t = case.transition
+        key = (case.marking, t)
+        if key not in firings_cache:
+            firings_cache[key] = cnet.weak_execute(t, case.marking)
+        case.marking = firings_cache[key]
+        for p in postset[t]:
+            case.token_times.setdefault(p, deque()).append(current_time)
+        if labels[t] is not None:
+            case.trace.append(Event({xes_constants.DEFAULT_NAME_KEY: labels[t],
+                                     xes_constants.DEFAULT_TIMESTAMP_KEY: datetime.datetime.fromtimestamp(
+                                         current_time)}))
+        for p in preset[t]:
+            if case.token_times.get(p):
+                p_ex_time = case.token_times[p].popleft()
+                if current_time - p_ex_time > 0:
+                    places_intervals[places[p]].append((p_ex_time, current_time))
+            if p in case.held:
+                release(case, p, current_time)
+        step(case, current_time)
+
+    cases = []
+    # the start timestamp is set to 1000000 instead of 0 to avoid problems with 32 bit machines
+    start_time = 1000000
+    for i in range(no_simulations):
+        case = SimulatedCase(i, encoded_im, start_time)
+        case.pending = [source]
+        cases.append(case)
+        schedule(start_time, ARRIVAL, case)
+        schedule(start_time + case_timeout, TIMEOUT, case)
+        start_time = start_time + case_arrival_ratio
+
+    while calendar:
+        current_time, _, kind, case = heapq.heappop(calendar)
+        if case.aborted:
+            continue
+        if kind == TIMEOUT:
+            if not case.terminated_correctly:
+                # the case is stuck (e.g. in a deadlock on the resources): it is aborted and its resources are released
+                case.aborted = True
+                release_all(case, current_time)
+        elif kind == COMPLETION:
+            complete(case, current_time)
+        else:
+            acquire(case, current_time)
+
+    # the cases that are still waiting for some resource (or that were discarded) did not terminate correctly
+    list_cases = []
+    cases_ex_time = []
+    for case in cases:
+        if case.terminated_correctly:
+            list_cases.append(case.trace)
+            if len(case.trace) > 0:
+                cases_ex_time.append(case.trace[-1][xes_constants.DEFAULT_TIMESTAMP_KEY].timestamp() - case.trace[0][
+                    xes_constants.DEFAULT_TIMESTAMP_KEY].timestamp())
+            else:
+                cases_ex_time.append(0)
+
+    return list_cases, cases_ex_time, places_intervals, transitions_intervals
@@ -15,12 +15,11 @@
     along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
 '''
 import datetime
-from copy import copy
 from enum import Enum
 from random import choice
 
 from pm4py.objects.log import log as log_instance
-from pm4py.objects.petri import semantics
+from pm4py.objects.petri import compiled_net
 from pm4py.objects.petri.petrinet import PetriNet
 from pm4py.util import constants
 from pm4py.util import exec_utils
@@ -66,31 +65,36 @@ def apply_playout(net, initial_marking, no_traces=100, max_trace_length=100,
     curr_timestamp = 10000000
     all_visited_elements = []
 
+    cnet = compiled_net.construct(net)
+    encoded_initial_marking = cnet.encode_marking(initial_marking)
+    encoded_final_marking = cnet.encode_marking(final_marking) if final_marking is not None else None
+
     for i in range(no_traces):
         visited_elements = []
         visible_transitions_visited = []
 
-        marking = copy(initial_marking)
+        marking = encoded_initial_marking
         while len(visible_transitions_visited) < max_trace_length:
             visited_elements.append(marking)
 
-            if not semantics.enabled_transitions(net, marking):  # supports nets with possible deadlocks
+            all_enabled_trans = cnet.enabled_transitions(marking)
+            if not all_enabled_trans:  # supports nets with possible deadlocks
                 break
-            all_enabled_trans = semantics.enabled_transitions(net, marking)
-            if final_marking is not None and marking == final_marking:
-                trans = choice(list(all_enabled_trans.union({None})))
+            if encoded_final_marking is not None and marking == encoded_final_marking:
+                trans = choice(all_enabled_trans + [None])
             else:
-                trans = choice(list(all_enabled_trans))
+                trans = choice(all_enabled_trans)
             if trans is None:
                 break
 
-            visited_elements.append(trans)
-            if trans.label is not None:
+            visited_elements.append(cnet.transitions[trans])
+            if cnet.labels[trans] is not None:
                 visible_transitions_visited.append(trans)
 
-            marking = semantics.execute(trans, net, marking)
+            marking = cnet.execute(trans, marking)
 
-        all_visited_elements.append(tuple(visited_elements))
+        all_visited_elements.append(tuple(cnet.decode_marking(x) if type(x) is tuple else x
+                                          for x in visited_elements))
 
     if return_visited_elements:
         return all_visited_elements
@@ -19,7 +19,7 @@ from collections import Counter
 from enum import Enum
 
 from pm4py.objects.log import log as log_instance
-from pm4py.objects.petri import semantics
+from pm4py.objects.petri import compiled_net
 from pm4py.objects.petri.petrinet import PetriNet
 from pm4py.util import constants
 from pm4py.util import exec_utils
@@ -74,7 +74,12 @@ def apply(net, initial_marking, final_marking=None, parameters=None):
 
     feasible_elements = []
 
-    to_visit = [(initial_marking, (), ())]
+    # the exploration works on the compiled (integer-indexed) net: markings are tuples of integers and
+    # transitions are indices
+    cnet = compiled_net.construct(net)
+    encoded_final_marking = cnet.encode_marking(final_marking) if final_marking is not None else None
+
+    to_visit = [(cnet.encode_marking(initial_marking), (), ())]
     visited = set()
 
     while len(to_visit) > 0:
@@ -88,9 +93,10 @@ def apply(net, initial_marking, final_marking=None, parameters=None):
             continue
         visited.add((m, trace))
 
-        en_t = semantics.enabled_transitions(net, m)
+        en_t = cnet.enabled_transitions(m)
 
-        if (final_marking is not None and m == final_marking) or (final_marking is None and len(en_t) == 0):
+        if (encoded_final_marking is not None and m == encoded_final_marking) or (
+                encoded_final_marking is None and len(en_t) == 0):
             if len(trace) <= max_trace_length:
                 feasible_elements.append(elements)
 
@@ -103,9 +109,9 @@ def apply(net, initial_marking, final_marking=None, parameters=None):
             if counter_elements[m] > max_marking_occ:
                 continue
 
-            new_m = semantics.weak_execute(t, m)
-            if t.label is not None:
-                new_trace = trace + (t.label,)
+            new_m = cnet.weak_execute(t, m)
+            if cnet.labels[t] is not None:
+                new_trace = trace + (cnet.labels[t],)
             else:
                 new_trace = trace
 
@@ -115,6 +121,10 @@ def apply(net, initial_marking, final_marking=None, parameters=None):
                 continue
             to_visit.append(new_state)
 
+    # decodes the markings and the transitions of the feasible paths
+    feasible_elements = [tuple(cnet.decode_marking(x) if type(x) is tuple else cnet.transitions[x] for x in elements)
+                         for elements in feasible_elements]
+
     if return_elements:
         return feasible_elements
 
@@ -70,6 +70,7 @@ def apply(log, net, marking, final_marking, parameters=None):
     align_stop_marking = align_fake_log_stop_marking(fake_log, net, marking, final_marking, parameters=parameters)
     all_markings = transform_markings_from_sync_to_original_net(align_stop_marking, net, parameters=parameters)
 
+    closure_cache = utils.get_visible_transitions_closure_cache(net)
     for i in range(len(prefixes)):
         markings = all_markings[i]
 
@@ -80,8 +81,7 @@ def apply(log, net, marking, final_marking, parameters=None):
                 # add to the set of activated transitions in the model the activated transitions
                 # for each prefix
                 activated_transitions_labels = activated_transitions_labels.union(
-                    x.label for x in utils.get_visible_transitions_eventually_enabled_by_marking(net, m) if
-                    x.label is not None)
+                    x.label for x in closure_cache.get(net, m) if x.label is not None)
             escaping_edges = activated_transitions_labels.difference(log_transitions)
 
             sum_at += len(activated_transitions_labels) * prefix_count[prefixes_keys[i]]
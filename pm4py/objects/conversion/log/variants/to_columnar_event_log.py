@@ -0,0 +1,63 @@
+'''
+    This file is part of PM4Py (More Info: https://pm4py.fit.fraunhofer.de).
+
+    PM4Py is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    PM4Py is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
+'''
+import pkgutil
+from enum import Enum
+
+from pm4py.objects.conversion.log.variants import to_event_log
+from pm4py.objects.log import columnar_log
+from pm4py.util import exec_utils, constants as pmconstants
+
+
+class Parameters(Enum):
+    CASE_ATTRIBUTE_PREFIX = "case_attribute_prefix"
+    CASE_ID_KEY = pmconstants.PARAMETER_CONSTANT_CASEID_KEY
+
+
+def apply(log, parameters=None):
+    """
+    Converts a dataframe/event stream/event log to a columnar event log
+
+    Parameters
+    -------------
+    log
+        Log object
+    parameters
+        Parameters of the algorithm, including:
+        - Parameters.CASE_ID_KEY => column containing the case identifier (for dataframes)
+        - Parameters.CASE_ATTRIBUTE_PREFIX => prefix of the case attributes (for dataframes)
+
+    Returns
+    -------------
+    columnar_log
+        Columnar event log
+    """
+    if parameters is None:
+        parameters = {}
+
+    if isinstance(log, columnar_log.ColumnarEventLog):
+        return log
+
+    if pkgutil.find_loader("pandas"):
+        import pandas
+        if isinstance(log, pandas.core.frame.DataFrame):
+            case_glue = exec_utils.get_param_value(Parameters.CASE_ID_KEY, parameters, pmconstants.CASE_CONCEPT_NAME)
+            case_pref = exec_utils.get_param_value(Parameters.CASE_ATTRIBUTE_PREFIX, parameters,
+                                                   pmconstants.CASE_ATTRIBUTE_PREFIX)
+            return columnar_log.from_dataframe(log, parameters={pmconstants.PARAMETER_CONSTANT_CASEID_KEY: case_glue,
+                                                                "case_attribute_prefix": case_pref})
+
+    return columnar_log.from_event_log(to_event_log.apply(log, parameters=parameters))
@@ -16,7 +16,6 @@
 '''
 import logging
 import pkgutil
-import queue
 from collections import Counter
 from copy import copy
 
@@ -922,33 +921,32 @@ def get_transitive_relations(dfg, alphabet):
         second argument maps an activity on all other activities that it can reach (transitively) ('transitive post set')
 
     '''
-    q = queue.Queue()
+    nodes = list(alphabet)
+    index = {a: i for i, a in enumerate(nodes)}
+    # the reachability relation is computed by the Warshall algorithm, representing the sets as bit masks
+    reach = [0] * len(nodes)
+    for a, b in dfg:
+        reach[index[a]] |= 1 << index[b]
+    for k in range(len(nodes)):
+        bit = 1 << k
+        reach_k = reach[k]
+        for i in range(len(nodes)):
+            if reach[i] & bit:
+                reach[i] |= reach_k
     pre = dict()
     post = dict()
-    for a in alphabet:
+    for a in nodes:
         pre[a] = set()
         post[a] = set()
-    if len(dfg) > 0:
-        for e in dfg:
-            q.put(e)
-        while q.qsize() > 0:
-            s, t = q.get()
-            post[s].add(t)
-            pre[t].add(s)
-            post[s].update(post[t])
-            pre[t].update(pre[s])
-
-            for a, b in dfg:
-                if b == s:
-                    # incoming arcs in s; inherit postset of s
-                    if not post[s].issubset(post[a]):
-                        post[a].update(post[s])
-                        q.put((a, b))
-                if a == t:
-                    # outgoing arcs from t
-                    if not pre[t].issubset(pre[b]):
-                        pre[b].update(pre[t])
-                        q.put((a, b))
+    for i, a in enumerate(nodes):
+        mask = reach[i]
+        j = 0
+        while mask:
+            if mask & 1:
+                post[a].add(nodes[j])
+                pre[nodes[j]].add(a)
+            mask >>= 1
+            j += 1
     return pre, post
 
 
@@ -0,0 +1,577 @@
+'''
+    This file is part of PM4Py (More Info: https://pm4py.fit.fraunhofer.de).
+
+    PM4Py is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    PM4Py is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
+'''
+import copy
+import weakref
+from collections.abc import MutableMapping
+
+import numpy as np
+
+from pm4py.objects.log.log import Event, Trace, EventLog, XESExtension
+from pm4py.util import xes_constants as xes
+from pm4py.util import constants as pm4_constants
+
+# code used in the columns to mark that an attribute is not set for the given event/trace
+MISSING = -1
+
+
+def _category_key(value):
+    # the type is part of the key, otherwise True/1/1.0 would share the same category
+    return type(value), value
+
+
+class ColumnStore(object):
+    """
+    Set of dictionary-encoded (categorical) columns sharing the same length.
+    Each column is stored as an array of integer codes (MISSING if the attribute is not set)
+    and the list of its categories.
+    """
+
+    def __init__(self, length=0):
+        self.__length = length
+        self.__codes = {}
+        self.__categories = {}
+        self.__category_index = {}
+
+    def __len__(self):
+        return self.__length
+
+    def keys(self):
+        return list(self.__codes)
+
+    def add_column(self, key, codes, categories):
+        """
+        Adds an already encoded column to the store
+        """
+        codes = np.asarray(codes)
+        if len(codes) != self.__length:
+            raise Exception("the column " + str(key) + " has not the same length of the store")
+        self.__codes[key] = codes
+        # lazily-decoded sequences of categories (e.g. memory-mapped ones) are kept as they are
+        self.__categories[key] = categories if hasattr(categories, "to_array") else list(categories)
+        self.__category_index.pop(key, None)
+
+    def get_codes(self, key):
+        return self.__codes[key]
+
+    def get_categories(self, key):
+        return self.__categories[key]
+
+    def get_values(self, key, indices=None):
+        """
+        Decodes (in a vectorized way) the values of a column; missing values are returned as None
+        """
+        codes = self.__codes[key] if indices is None else self.__codes[key][indices]
+        categories = np.empty(len(self.__categories[key]) + 1, dtype=object)
+        if hasattr(self.__categories[key], "to_array"):
+            categories[:-1] = self.__categories[key].to_array()
+        else:
+            categories[:-1] = self.__categories[key]
+        # the code MISSING (-1) points to the last element, that is None
+        return categories[codes]
+
+    def has_value(self, key, index):
+        return key in self.__codes and self.__codes[key][index] != MISSING
+
+    def get_value(self, key, index):
+        code = self.__codes[key][index] if key in self.__codes else MISSING
+        if code == MISSING:
+            raise KeyError(key)
+        return self.__categories[key][code]
+
+    def keys_at(self, index):
+        return [key for key, codes in self.__codes.items() if codes[index] != MISSING]
+
+    def __get_code(self, key, value):
+        if key not in self.__category_index:
+            index = {}
+            for i, cat in enumerate(self.__categories[key]):
+                try:
+                    index.setdefault(_category_key(cat), i)
+                except TypeError:
+                    pass
+            self.__category_index[key] = index
+        index = self.__category_index[key]
+        try:
+            ck = _category_key(value)
+            if ck not in index:
+                index[ck] = len(self.__categories[key])
+                self.__categories[key].append(value)
+            return index[ck]
+        except TypeError:
+            # unhashable values (e.g. lists) get their own category
+            self.__categories[key].append(value)
+            return len(self.__categories[key]) - 1
+
+    def set_value(self, key, index, value):
+        if key not in self.__codes:
+            self.__codes[key] = np.full(self.__length, MISSING, dtype=np.int32)
+            self.__categories[key] = []
+        code = self.__get_code(key, value)
+        if code > np.iinfo(self.__codes[key].dtype).max:
+            self.__codes[key] = self.__codes[key].astype(np.int64)
+        if not self.__codes[key].flags.writeable:
+            self.__codes[key] = self.__codes[key].copy()
+        self.__codes[key][index] = code
+
+    def del_value(self, key, index):
+        if not self.has_value(key, index):
+            raise KeyError(key)
+        if not self.__codes[key].flags.writeable:
+            self.__codes[key] = self.__codes[key].copy()
+        self.__codes[key][index] = MISSING
+
+
+def encode_values(values):
+    """
+    Dictionary-encodes a list of values (None stands for a missing value)
+
+    Returns
+    --------------
+    codes
+        NumPy array of codes
+    categories
+        List of categories
+    """
+    codes = np.empty(len(values), dtype=np.int32)
+    categories = []
+    index = {}
+    for i, v in enumerate(values):
+        if v is None:
+            codes[i] = MISSING
+            continue
+        try:
+            ck = _category_key(v)
+            if ck not in index:
+                index[ck] = len(categories)
+                categories.append(v)
+            codes[i] = index[ck]
+        except TypeError:
+            codes[i] = len(categories)
+            categories.append(v)
+    return codes, categories
+
+
+class ColumnarAttributes(MutableMapping):
+    """
+    Write-through dict-like view over the attributes of a single row of a column store
+    """
+
+    def __init__(self, store, index):
+        self._store = store
+        self._index = index
+
+    def __getitem__(self, key):
+        return self._store.get_value(key, self._index)
+
+    def __setitem__(self, key, value):
+        self._store.set_value(key, self._index, value)
+
+    def __delitem__(self, key):
+        self._store.del_value(key, self._index)
+
+    def __contains__(self, key):
+        return self._store.has_value(key, self._index)
+
+    def __iter__(self):
+        return iter(self._store.keys_at(self._index))
+
+    def __len__(self):
+        return len(self._store.keys_at(self._index))
+
+    def __repr__(self):
+        return str(dict(self))
+
+    def copy(self):
+        return dict(self)
+
+    def __copy__(self):
+        return dict(self)
+
+    def __deepcopy__(self, memodict={}):
+        return copy.deepcopy(dict(self), memodict)
+
+
+class ColumnarEvent(Event):
+    """
+    Event that is a view over a row of the event columns of a columnar event log.
+    Changes to the event are written through to the columns.
+    """
+
+    def __init__(self, store, index):
+        self.__attributes = ColumnarAttributes(store, index)
+
+    def _get_dict(self):
+        return self.__attributes
+
+    _dict = property(_get_dict)
+
+    def __contains__(self, key):
+        return key in self.__attributes
+
+    def __deepcopy__(self, memodict={}):
+        return Event(copy.deepcopy(dict(self.__attributes), memodict))
+
+
+class ColumnarTrace(Trace):
+    """
+    Trace that is a view over a range of rows of the event columns of a columnar event log.
+    The list of events is materialized (as views) only when the trace is changed or its list is accessed;
+    from that moment, the log keeps the trace, so that the changes are not lost.
+    """
+
+    def __init__(self, log, index):
+        self._log = log
+        self._index = index
+        self._attributes = ColumnarAttributes(log.trace_store, index)
+        self.__materialized = None
+
+    def __range(self):
+        return range(int(self._log.offsets[self._index]), int(self._log.offsets[self._index + 1]))
+
+    def _get_list(self):
+        if self.__materialized is None:
+            self.__materialized = [ColumnarEvent(self._log.event_store, i) for i in self.__range()]
+            self._log._keep_trace(self)
+        return self.__materialized
+
+    def _set_list(self, value):
+        self.__materialized = value
+        self._log._keep_trace(self)
+
+    _list = property(_get_list, _set_list)
+
+    def __getitem__(self, key):
+        if self.__materialized is not None:
+            return self.__materialized[key]
+        if isinstance(key, slice):
+            return [ColumnarEvent(self._log.event_store, i) for i in self.__range()[key]]
+        return ColumnarEvent(self._log.event_store, self.__range()[key])
+
+    def __iter__(self):
+        if self.__materialized is not None:
+            return iter(self.__materialized)
+        store = self._log.event_store
+        return (ColumnarEvent(store, i) for i in self.__range())
+
+    def __reversed__(self):
+        if self.__materialized is not None:
+            return reversed(self.__materialized)
+        store = self._log.event_store
+        return (ColumnarEvent(store, i) for i in reversed(self.__range()))
+
+    def __len__(self):
+        if self.__materialized is not None:
+            return len(self.__materialized)
+        return len(self.__range())
+
+    def __contains__(self, item):
+        return any(ev == item for ev in self)
+
+    def __hash__(self):
+        ret = 0
+        for ev in self:
+            ret += hash(ev)
+            ret = ret % 479001599
+        return ret
+
+    def __eq__(self, other):
+        if len(self) != len(other):
+            return False
+        elif self.attributes != other.attributes:
+            return False
+        for ev1, ev2 in zip(self, other):
+            if ev1 != ev2:
+                return False
+        return True
+
+    def __repr__(self, ret_list=False):
+        # does not materialize the list of events
+        events = list(self)
+        if len(events) > 2:
+            events = [events[0], "..", events[-1]]
+        ret = {"attributes": self._attributes, "events": events}
+        if ret_list:
+            return ret
+        return str(ret)
+
+    def __deepcopy__(self, memodict={}):
+        return Trace([copy.deepcopy(ev, memodict) for ev in self],
+                     attributes=copy.deepcopy(self._attributes, memodict))
+
+
+class ColumnarEventLog(EventLog):
+    """
+    Event log backed by dictionary-encoded NumPy columns.
+
+    Events are stored in a column store (one row per event, traces being contiguous ranges of rows
+    delimited by the offsets array), and trace attributes in a second column store (one row per trace).
+    The log exposes the same API of an EventLog, returning lightweight views for the traces and the events,
+    while new code can work directly on the columns (get_event_column / get_trace_column).
+    """
+
+    def __init__(self, event_store, trace_store, offsets, attributes=None, extensions=None, omni_present=None,
+                 classifiers=None):
+        self._attributes = attributes if attributes is not None else {}
+        self._extensions = extensions if extensions is not None else {}
+        self._omni = omni_present if omni_present is not None else {}
+        self._classifiers = classifiers if classifiers is not None else {}
+        self.__event_store = event_store
+        self.__trace_store = trace_store
+        self.__offsets = np.asarray(offsets, dtype=np.int64)
+        self.__materialized = None
+        # the views of the traces in use are shared, so that every access to a trace returns the same object
+        self.__trace_views = weakref.WeakValueDictionary()
+        # traces whose list of events has been materialized (they could have been changed)
+        self.__kept_traces = {}
+
+    def _get_event_store(self):
+        return self.__event_store
+
+    def _get_trace_store(self):
+        return self.__trace_store
+
+    def _get_offsets(self):
+        return self.__offsets
+
+    def _get_trace(self, index):
+        trace = self.__trace_views.get(index)
+        if trace is None:
+            trace = ColumnarTrace(self, index)
+            self.__trace_views[index] = trace
+        return trace
+
+    def _keep_trace(self, trace):
+        self.__kept_traces[trace._index] = trace
+
+    def __getstate__(self):
+        # the cache of the views (weak references) cannot be pickled, and is rebuilt on load
+        state = self.__dict__.copy()
+        del state["_ColumnarEventLog__trace_views"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.__trace_views = weakref.WeakValueDictionary(self.__kept_traces)
+
+    def _get_list(self):
+        if self.__materialized is None:
+            self.__materialized = [self._get_trace(i) for i in range(len(self.__offsets) - 1)]
+        return self.__materialized
+
+    def _set_list(self, value):
+        self.__materialized = value
+
+    _list = property(_get_list, _set_list)
+    event_store = property(_get_event_store)
+    trace_store = property(_get_trace_store)
+    offsets = property(_get_offsets)
+
+    def is_materialized(self):
+        """
+        Checks if the list of traces, or the list of events of some trace, has been materialized (from that moment,
+        the traces of the log could differ from the rows of the columns)
+        """
+        return self.__materialized is not None or len(self.__kept_traces) > 0
+
+    def get_event_column(self, key):
+        """
+        Gets the encoded event column (codes and categories) for the given attribute
+        """
+        return self.__event_store.get_codes(key), self.__event_store.get_categories(key)
+
+    def get_trace_column(self, key):
+        """
+        Gets the encoded trace column (codes and categories) for the given attribute
+        """
+        return self.__trace_store.get_codes(key), self.__trace_store.get_categories(key)
+
+    def __getitem__(self, key):
+        if self.__materialized is not None:
+            return self.__materialized[key]
+        if isinstance(key, slice):
+            return [self._get_trace(i) for i in range(len(self.__offsets) - 1)[key]]
+        return self._get_trace(range(len(self.__offsets) - 1)[key])
+
+    def __iter__(self):
+        if self.__materialized is not None:
+            return iter(self.__materialized)
+        return (self._get_trace(i) for i in range(len(self.__offsets) - 1))
+
+    def __reversed__(self):
+        if self.__materialized is not None:
+            return reversed(self.__materialized)
+        return (self._get_trace(i) for i in reversed(range(len(self.__offsets) - 1)))
+
+    def __len__(self):
+        if self.__materialized is not None:
+            return len(self.__materialized)
+        return len(self.__offsets) - 1
+
+    def __contains__(self, item):
+        return any(trace == item for trace in self)
+
+    def __hash__(self):
+        ret = 0
+        for trace in self:
+            ret += hash(trace)
+            ret = ret % 479001599
+        return ret
+
+    def __eq__(self, other):
+        if len(self) != len(other):
+            return False
+        elif self.attributes != other.attributes:
+            return False
+        elif self.extensions != other.extensions:
+            return False
+        elif self.omni_present != other.omni_present:
+            return False
+        elif self.classifiers != other.classifiers:
+            return False
+        for trace1, trace2 in zip(self, other):
+            if trace1 != trace2:
+                return False
+        return True
+
+    def __repr__(self):
+        if len(self) == 0:
+            ret = []
+        elif len(self) == 1:
+            ret = [self[0].__repr__(ret_list=True)]
+        else:
+            ret = [self[0].__repr__(ret_list=True), "....", self[-1].__repr__(ret_list=True)]
+        return str(ret)
+
+    def __deepcopy__(self, memodict={}):
+        if self.is_materialized():
+            return EventLog([copy.deepcopy(trace, memodict) for trace in self],
+                            attributes=copy.deepcopy(self._attributes, memodict),
+                            extensions=copy.deepcopy(self._extensions, memodict),
+                            omni_present=copy.deepcopy(self._omni, memodict),
+                            classifiers=copy.deepcopy(self._classifiers, memodict))
+        return ColumnarEventLog(copy.deepcopy(self.__event_store, memodict),
+                                copy.deepcopy(self.__trace_store, memodict), self.__offsets.copy(),
+                                attributes=copy.deepcopy(self._attributes, memodict),
+                                extensions=copy.deepcopy(self._extensions, memodict),
+                                omni_present=copy.deepcopy(self._omni, memodict),
+                                classifiers=copy.deepcopy(self._classifiers, memodict))
+
+
+def from_event_log(log):
+    """
+    Builds a columnar event log from a (traditional) event log
+
+    Parameters
+    --------------
+    log
+        Event log
+
+    Returns
+    --------------
+    columnar_log
+        Columnar event log
+    """
+    offsets = np.zeros(len(log) + 1, dtype=np.int64)
+    event_keys = {}
+    trace_keys = {}
+    for i, trace in enumerate(log):
+        offsets[i + 1] = offsets[i] + len(trace)
+        for key in trace.attributes:
+            trace_keys[key] = None
+        for event in trace:
+            for key in event:
+                event_keys[key] = None
+
+    event_store = ColumnStore(int(offsets[-1]))
+    for key in event_keys:
+        codes, categories = encode_values([ev[key] if key in ev else None for trace in log for ev in trace])
+        event_store.add_column(key, codes, categories)
+
+    trace_store = ColumnStore(len(log))
+    for key in trace_keys:
+        codes, categories = encode_values([trace.attributes[key] if key in trace.attributes else None
+                                           for trace in log])
+        trace_store.add_column(key, codes, categories)
+
+    return ColumnarEventLog(event_store, trace_store, offsets, attributes=copy.copy(log.attributes),
+                            extensions=copy.copy(log.extensions), omni_present=copy.copy(log.omni_present),
+                            classifiers=copy.copy(log.classifiers))
+
+
+def __encode_series(series):
+    import pandas as pd
+
+    if series.dtype == object:
+        return encode_values([None if pd.isna(v) else v for v in series.tolist()])
+    codes, uniques = pd.factorize(series, sort=False)
+    return codes.astype(np.int32), uniques.tolist()
+
+
+def from_dataframe(df, parameters=None):
+    """
+    Builds a columnar event log from a dataframe (the cases are ordered by their first occurrence,
+    the events by their position in the dataframe). The columns starting with the case attribute prefix
+    are stored as trace attributes. Missing values (NaN/NaT/None) are not set in the events.
+
+    Parameters
+    --------------
+    df
+        Dataframe
+    parameters
+        Parameters of the algorithm, including:
+        - pm4_constants.PARAMETER_CONSTANT_CASEID_KEY => the column containing the case identifier
+        - "case_attribute_prefix" => the prefix of the case attributes
+
+    Returns
+    --------------
+    columnar_log
+        Columnar event log
+    """
+    import pandas as pd
+
+    if parameters is None:
+        parameters = {}
+
+    case_glue = parameters.get(pm4_constants.PARAMETER_CONSTANT_CASEID_KEY, pm4_constants.CASE_CONCEPT_NAME)
+    case_pref = parameters.get("case_attribute_prefix", pm4_constants.CASE_ATTRIBUTE_PREFIX)
+
+    case_codes, cases = pd.factorize(df[case_glue], sort=False)
+    order = np.argsort(case_codes, kind="stable")
+    counts = np.bincount(case_codes, minlength=len(cases))
+    offsets = np.zeros(len(cases) + 1, dtype=np.int64)
+    offsets[1:] = np.cumsum(counts)
+    first_rows = order[offsets[:-1]]
+
+    event_store = ColumnStore(len(df))
+    trace_store = ColumnStore(len(cases))
+    for col in df.columns:
+        if col.startswith(case_pref):
+            codes, categories = __encode_series(df[col].iloc[first_rows])
+            trace_store.add_column(col[len(case_pref):], codes, categories)
+        else:
+            codes, categories = __encode_series(df[col])
+            event_store.add_column(col, codes[order], categories)
+
+    if xes.DEFAULT_TRACEID_KEY not in trace_store.keys():
+        trace_store.add_column(xes.DEFAULT_TRACEID_KEY, np.arange(len(cases), dtype=np.int32), cases.tolist())
+
+    extensions = {}
+    for ext in XESExtension:
+        if any(ext.prefix in col.split(':') for col in df.columns):
+            extensions[ext.name] = {xes.KEY_PREFIX: ext.prefix, xes.KEY_URI: ext.uri}
+
+    return ColumnarEventLog(event_store, trace_store, offsets, attributes={'origin': 'csv'}, extensions=extensions)
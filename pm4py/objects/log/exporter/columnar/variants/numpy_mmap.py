@@ -0,0 +1,104 @@
+'''
+    This file is part of PM4Py (More Info: https://pm4py.fit.fraunhofer.de).
+
+    PM4Py is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    PM4Py is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
+'''
+import json
+import os
+import pickle
+import pkgutil
+from enum import Enum
+
+import numpy as np
+
+from pm4py.objects.conversion.log import converter as log_converter
+from pm4py.objects.log import columnar_log
+from pm4py.objects.log.util import mapped_categories
+from pm4py.util import constants, exec_utils
+
+FORMAT_NAME = "pm4py-columnar"
+FORMAT_VERSION = 1
+
+METADATA_FILE = "metadata.json"
+LOG_ATTRIBUTES_FILE = "log.pkl"
+OFFSETS_FILE = "offsets.npy"
+
+EVENT_COLUMN_PREFIX = "event_"
+TRACE_COLUMN_PREFIX = "trace_"
+
+
+class Parameters(Enum):
+    CASE_ID_KEY = constants.PARAMETER_CONSTANT_CASEID_KEY
+    CASE_ATTRIBUTE_PREFIX = "case_attribute_prefix"
+
+
+def __write_store(store, directory, prefix):
+    """
+    Writes the columns of a column store, returning their description
+    """
+    columns = []
+    for index, key in enumerate(store.keys()):
+        path_prefix = os.path.join(directory, prefix + str(index))
+        np.save(path_prefix + "_codes.npy", np.asarray(store.get_codes(key)))
+        categories_type = mapped_categories.write(store.get_categories(key), path_prefix)
+        columns.append({"key": key, "file": prefix + str(index), "type": categories_type})
+    return columns
+
+
+def apply(log, output_path, parameters=None):
+    """
+    Exports a log (or a dataframe) in the columnar binary format: a directory containing the dictionary-encoded
+    columns of the events and of the traces as NumPy buffers, that can be memory-mapped when reading
+
+    Parameters
+    ------------
+    log
+        Event log / Pandas dataframe
+    output_path
+        Path of the directory (created if it does not exist)
+    parameters
+        Parameters of the algorithm, including:
+            Parameters.CASE_ID_KEY -> column containing the case identifier (dataframes)
+            Parameters.CASE_ATTRIBUTE_PREFIX -> prefix of the case attributes (dataframes)
+    """
+    if parameters is None:
+        parameters = {}
+
+    if not isinstance(log, columnar_log.ColumnarEventLog) or log.is_materialized():
+        if pkgutil.find_loader("pandas"):
+            import pandas as pd
+            if isinstance(log, pd.DataFrame):
+                log = columnar_log.from_dataframe(log, parameters={
+                    constants.PARAMETER_CONSTANT_CASEID_KEY: exec_utils.get_param_value(
+                        Parameters.CASE_ID_KEY, parameters, constants.CASE_CONCEPT_NAME),
+                    "case_attribute_prefix": exec_utils.get_param_value(
+                        Parameters.CASE_ATTRIBUTE_PREFIX, parameters, constants.CASE_ATTRIBUTE_PREFIX)})
+        if not isinstance(log, columnar_log.ColumnarEventLog) or log.is_materialized():
+            log = columnar_log.from_event_log(log_converter.apply(log, variant=log_converter.Variants.TO_EVENT_LOG,
+                                                                  parameters=parameters))
+
+    os.makedirs(output_path, exist_ok=True)
+
+    np.save(os.path.join(output_path, OFFSETS_FILE), log.offsets)
+    event_columns = __write_store(log.event_store, output_path, EVENT_COLUMN_PREFIX)
+    trace_columns = __write_store(log.trace_store, output_path, TRACE_COLUMN_PREFIX)
+
+    with open(os.path.join(output_path, LOG_ATTRIBUTES_FILE), "wb") as f:
+        pickle.dump({"attributes": dict(log.attributes), "extensions": dict(log.extensions),
+                     "omni_present": dict(log.omni_present), "classifiers": dict(log.classifiers)}, f)
+
+    with open(os.path.join(output_path, METADATA_FILE), "w") as f:
+        json.dump({"format": FORMAT_NAME, "version": FORMAT_VERSION, "no_traces": len(log.offsets) - 1,
+                   "no_events": int(log.offsets[-1]), "event_columns": event_columns,
+                   "trace_columns": trace_columns}, f, indent=2)
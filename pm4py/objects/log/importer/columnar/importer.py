@@ -0,0 +1,51 @@
+'''
+    This file is part of PM4Py (More Info: https://pm4py.fit.fraunhofer.de).
+
+    PM4Py is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    PM4Py is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
+'''
+from enum import Enum
+
+from pm4py.objects.log.importer.columnar.variants import numpy_mmap
+from pm4py.util import exec_utils
+
+
+class Variants(Enum):
+    NUMPY_MMAP = numpy_mmap
+
+
+DEFAULT_VARIANT = Variants.NUMPY_MMAP
+
+
+def apply(path, parameters=None, variant=DEFAULT_VARIANT):
+    """
+    Imports a log stored in the columnar binary format
+
+    Parameters
+    -----------
+    path
+        Path (directory)
+    parameters
+        Parameters of the algorithm, including:
+            Parameters.MMAP -> memory-maps the buffers (default: True)
+            Parameters.RETURN_DATAFRAME -> returns a Pandas dataframe instead of an event log (default: False)
+    variant
+        Variant of the algorithm to use, including:
+            - Variants.NUMPY_MMAP
+
+    Returns
+    -----------
+    log
+        Event log (or dataframe)
+    """
+    return exec_utils.get_variant(variant).apply(path, parameters=parameters)
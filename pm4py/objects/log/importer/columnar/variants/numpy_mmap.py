@@ -0,0 +1,178 @@
+'''
+    This file is part of PM4Py (More Info: https://pm4py.fit.fraunhofer.de).
+
+    PM4Py is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    PM4Py is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
+'''
+import json
+import os
+import pickle
+from datetime import timedelta, timezone
+from enum import Enum
+
+import numpy as np
+
+from pm4py.objects.log import columnar_log
+from pm4py.objects.log.exporter.columnar.variants.numpy_mmap import FORMAT_NAME, FORMAT_VERSION, METADATA_FILE, \
+    LOG_ATTRIBUTES_FILE, OFFSETS_FILE
+from pm4py.objects.log.util import mapped_categories
+from pm4py.util import constants, exec_utils
+
+
+class Parameters(Enum):
+    MMAP = "mmap"
+    RETURN_DATAFRAME = "return_dataframe"
+    CASE_ATTRIBUTE_PREFIX = "case_attribute_prefix"
+
+
+def __read_metadata(path):
+    with open(os.path.join(path, METADATA_FILE), "r") as f:
+        metadata = json.load(f)
+    if metadata.get("format") != FORMAT_NAME or metadata.get("version", 0) > FORMAT_VERSION:
+        raise Exception("the directory " + str(path) + " does not contain a supported columnar log")
+    return metadata
+
+
+def __read_columns(path, columns, mmap_mode):
+    """
+    Reads the codes and the (lazily decoded) categories of the given columns
+    """
+    ret = []
+    for column in columns:
+        path_prefix = os.path.join(path, column["file"])
+        codes = np.load(path_prefix + "_codes.npy", mmap_mode=mmap_mode)
+        ret.append((column["key"], codes, mapped_categories.read(column["type"], path_prefix, mmap_mode=mmap_mode)))
+    return ret
+
+
+def __decode_column(codes, categories):
+    """
+    Decodes a column into a NumPy array / Pandas series, using vectorized gathers on the buffers of the categories
+    """
+    import pandas as pd
+
+    codes = np.asarray(codes)
+    missing = codes == columnar_log.MISSING
+    has_missing = bool(missing.any())
+    categories_type = categories.categories_type if isinstance(categories,
+                                                               mapped_categories.MappedCategories) else None
+
+    if categories_type == mapped_categories.TYPE_DATETIME and len(categories) > 0:
+        offsets = np.unique(categories.buffers["tzoffsets"])
+        if len(offsets) == 1:
+            values = np.asarray(categories.buffers["values"])[codes]
+            values[missing] = np.iinfo(np.int64).min
+            if offsets[0] == mapped_categories.NAIVE:
+                return pd.Series(values.view("datetime64[ns]"))
+            return pd.Series(pd.to_datetime(values, utc=True)).dt.tz_convert(
+                timezone(timedelta(seconds=int(offsets[0]))))
+    elif categories_type in [mapped_categories.TYPE_INTEGER, mapped_categories.TYPE_FLOAT] and len(categories) > 0:
+        values = categories.to_array()[codes]
+        if has_missing:
+            values = values.astype(np.float64)
+            values[missing] = np.nan
+        return values
+
+    values = np.empty(len(categories) + 1, dtype=object)
+    if hasattr(categories, "to_array"):
+        values[:-1] = categories.to_array()
+    else:
+        values[:-1] = categories
+    # the code MISSING (-1) points to the last element, that is None
+    return values[codes]
+
+
+def import_dataframe(path, parameters=None):
+    """
+    Imports a log stored in the columnar binary format as a Pandas dataframe
+    (one row per event; the trace attributes are repeated in the columns with the case attribute prefix)
+
+    Parameters
+    -------------
+    path
+        Path of the directory
+    parameters
+        Parameters of the algorithm (see apply)
+
+    Returns
+    -------------
+    df
+        Dataframe
+    """
+    import pandas as pd
+
+    if parameters is None:
+        parameters = {}
+
+    mmap_mode = "r" if exec_utils.get_param_value(Parameters.MMAP, parameters, True) else None
+    case_attribute_prefix = exec_utils.get_param_value(Parameters.CASE_ATTRIBUTE_PREFIX, parameters,
+                                                       constants.CASE_ATTRIBUTE_PREFIX)
+
+    metadata = __read_metadata(path)
+    lengths = np.diff(np.load(os.path.join(path, OFFSETS_FILE), mmap_mode=mmap_mode))
+
+    data = {}
+    for key, codes, categories in __read_columns(path, metadata["trace_columns"], mmap_mode):
+        data[case_attribute_prefix + key] = np.repeat(np.asarray(__decode_column(codes, categories)), lengths)
+    for key, codes, categories in __read_columns(path, metadata["event_columns"], mmap_mode):
+        data[key] = __decode_column(codes, categories)
+
+    return pd.DataFrame(data)
+
+
+def apply(path, parameters=None):
+    """
+    Imports a log stored in the columnar binary format. The buffers are memory-mapped (so the import does not
+    parse anything, and the pages can be shared read-only among processes) and the values are decoded
+    only when they are accessed.
+
+    Parameters
+    -------------
+    path
+        Path of the directory
+    parameters
+        Parameters of the algorithm, including:
+            Parameters.MMAP -> memory-maps the buffers (default: True); otherwise, they are loaded in memory
+            Parameters.RETURN_DATAFRAME -> returns a Pandas dataframe instead of an event log (default: False)
+            Parameters.CASE_ATTRIBUTE_PREFIX -> prefix of the case attributes in the dataframe (default: case:)
+
+    Returns
+    -------------
+    log
+        Columnar event log (or dataframe)
+    """
+    if parameters is None:
+        parameters = {}
+
+    if exec_utils.get_param_value(Parameters.RETURN_DATAFRAME, parameters, False):
+        return import_dataframe(path, parameters=parameters)
+
+    mmap_mode = "r" if exec_utils.get_param_value(Parameters.MMAP, parameters, True) else None
+
+    metadata = __read_metadata(path)
+    offsets = np.load(os.path.join(path, OFFSETS_FILE), mmap_mode=mmap_mode)
+
+    event_store = columnar_log.ColumnStore(metadata["no_events"])
+    for key, codes, categories in __read_columns(path, metadata["event_columns"], mmap_mode):
+        event_store.add_column(key, codes, categories)
+    trace_store = columnar_log.ColumnStore(metadata["no_traces"])
+    for key, codes, categories in __read_columns(path, metadata["trace_columns"], mmap_mode):
+        trace_store.add_column(key, codes, categories)
+
+    with open(os.path.join(path, LOG_ATTRIBUTES_FILE), "rb") as f:
+        log_attributes = pickle.load(f)
+
+    return columnar_log.ColumnarEventLog(event_store, trace_store, offsets, attributes=log_attributes["attributes"],
+                                         extensions=log_attributes["extensions"],
+                                         omni_present=log_attributes["omni_present"],
+                                         classifiers=log_attributes["classifiers"])
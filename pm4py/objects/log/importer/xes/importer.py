@@ -17,13 +17,15 @@
 import pkgutil
 from enum import Enum
 
-from pm4py.objects.log.importer.xes.variants import iterparse, line_by_line, iterparse_mem_compressed
+from pm4py.objects.log.importer.xes.variants import iterparse, line_by_line, iterparse_mem_compressed, \
+    chunked_iterparse
 
 
 class Variants(Enum):
     ITERPARSE = iterparse
     LINE_BY_LINE = line_by_line
     ITERPARSE_MEM_COMPRESSED = iterparse_mem_compressed
+    CHUNKED_ITERPARSE = chunked_iterparse
 
 
 if pkgutil.find_loader("lxml"):
@@ -51,6 +53,8 @@ def apply(path, parameters=None, variant=DEFAULT_VARIANT):
         Variant of the algorithm to use, including:
             - Variants.ITERPARSE
             - Variants.LINE_BY_LINE
+            - Variants.ITERPARSE_MEM_COMPRESSED
+            - Variants.CHUNKED_ITERPARSE (splits the file at the trace boundaries and parses the chunks in parallel)
 
     Returns
     -----------
@@ -0,0 +1,360 @@
+'''
+    This file is part of PM4Py (More Info: https://pm4py.fit.fraunhofer.de).
+
+    PM4Py is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    PM4Py is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
+'''
+import gzip
+import mmap
+import multiprocessing
+import os
+import pkgutil
+import re
+import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from enum import Enum
+from io import BytesIO
+
+from pm4py.objects.log.importer.xes.variants import iterparse
+from pm4py.objects.log.util import sorting
+from pm4py.util import exec_utils, constants
+from pm4py.util import xes_constants
+
+
+class Parameters(Enum):
+    TIMESTAMP_SORT = "timestamp_sort"
+    TIMESTAMP_KEY = constants.PARAMETER_CONSTANT_TIMESTAMP_KEY
+    REVERSE_SORT = "reverse_sort"
+    MAX_TRACES = "max_traces"
+    SHOW_PROGRESS_BAR = "show_progress_bar"
+    DECOMPRESS_SERIALIZATION = "decompress_serialization"
+    ENCODING = "encoding"
+    CORES = "cores"
+    CHUNK_SIZE = "chunk_size"
+
+
+# regular expressions identifying the boundaries of the traces in the XES file
+_TRACE_START = re.compile(rb"<(?:[\w.-]+:)?trace[\s/>]")
+_TRACE_END = re.compile(rb"</(?:[\w.-]+:)?trace\s*>")
+_LOG_START = re.compile(rb"<(?:[\w.-]+:)?log[\s>]")
+
+_BYTES_PER_MB = 1024 * 1024
+
+
+def __get_trace_boundaries(content, max_traces):
+    """
+    Gets the starting positions of the traces, along with the ending position of the last trace
+
+    Parameters
+    --------------
+    content
+        Content of the XES file
+    max_traces
+        Maximum number of traces to consider
+
+    Returns
+    --------------
+    starts
+        Starting positions of the traces
+    end
+        Ending position of the last trace (None if the log has no traces)
+    """
+    starts = []
+    for match in _TRACE_START.finditer(content):
+        if len(starts) >= max_traces:
+            break
+        starts.append(match.start())
+    if not starts:
+        return starts, None
+    if max_traces < sys.maxsize and len(starts) == max_traces:
+        # the end of the last considered trace is the first closing tag after its start
+        next_start = _TRACE_START.search(content, starts[-1] + 1)
+        search_end = next_start.start() if next_start is not None else len(content)
+    else:
+        search_end = len(content)
+    end = None
+    for match in _TRACE_END.finditer(content, starts[-1], search_end):
+        end = match.end()
+    if end is None:
+        # the last trace is an empty <trace/> element
+        end = content.find(b">", starts[-1]) + 1
+    return starts, end
+
+
+def __get_chunks(starts, end, chunk_size):
+    """
+    Groups the traces in chunks of (approximately) chunk_size bytes
+
+    Returns
+    --------------
+    chunks
+        List of (start, end) positions of the chunks
+    """
+    chunks = []
+    chunk_start = starts[0]
+    for pos in starts[1:]:
+        if pos - chunk_start >= chunk_size:
+            chunks.append((chunk_start, pos))
+            chunk_start = pos
+    chunks.append((chunk_start, end))
+    return chunks
+
+
+def _parse_document(document, encoding):
+    """
+    Parses a well-formed XES document (using the iterparse variant)
+
+    Parameters
+    --------------
+    document
+        Bytes of the XES document
+    encoding
+        Encoding
+
+    Returns
+    --------------
+    log
+        Event log
+    """
+    from lxml import etree
+
+    context = etree.iterparse(BytesIO(document), events=[iterparse._EVENT_START, iterparse._EVENT_END],
+                              encoding=encoding)
+    return iterparse.import_from_context(context, 0, parameters={iterparse.Parameters.SHOW_PROGRESS_BAR: False})
+
+
+def _parse_chunk(document, encoding):
+    """
+    Parses a chunk of traces (wrapped in a well-formed XES document) in a worker process
+
+    Parameters
+    --------------
+    document
+        XES document containing the traces of the chunk
+    encoding
+        Encoding
+
+    Returns
+    --------------
+    traces
+        List of traces
+    """
+    return list(_parse_document(document, encoding))
+
+
+def __parse_chunks_in_order(executor, documents, encoding, max_in_flight):
+    """
+    Parses the chunks in a pool of processes, yielding their traces in the order of the chunks.
+    At most max_in_flight chunks are submitted and not yet consumed, so the copies of the chunks sent to the
+    workers (and the parsed traces waiting to be merged) do not grow with the size of the file
+
+    Parameters
+    --------------
+    executor
+        Pool of processes
+    documents
+        Iterator over the XES documents of the chunks
+    encoding
+        Encoding
+    max_in_flight
+        Maximum number of chunks submitted and not yet consumed
+
+    Returns
+    --------------
+    traces
+        Iterator over the lists of traces of the chunks
+    """
+    in_flight = deque()
+    for document in documents:
+        in_flight.append(executor.submit(_parse_chunk, document, encoding))
+        if len(in_flight) >= max_in_flight:
+            yield in_flight.popleft().result()
+    while in_flight:
+        yield in_flight.popleft().result()
+
+
+def import_from_bytes(content, parameters=None):
+    """
+    Imports a XES log from its (uncompressed) content, splitting it at the trace boundaries
+    and parsing the chunks in a pool of processes
+
+    Parameters
+    --------------
+    content
+        Bytes of the XES file (or a memory map of the file)
+    parameters
+        Parameters of the algorithm
+
+    Returns
+    --------------
+    log
+        Event log
+    """
+    if parameters is None:
+        parameters = {}
+
+    max_no_traces_to_import = exec_utils.get_param_value(Parameters.MAX_TRACES, parameters, sys.maxsize)
+    timestamp_sort = exec_utils.get_param_value(Parameters.TIMESTAMP_SORT, parameters, False)
+    timestamp_key = exec_utils.get_param_value(Parameters.TIMESTAMP_KEY, parameters,
+                                               xes_constants.DEFAULT_TIMESTAMP_KEY)
+    reverse_sort = exec_utils.get_param_value(Parameters.REVERSE_SORT, parameters, False)
+    show_progress_bar = exec_utils.get_param_value(Parameters.SHOW_PROGRESS_BAR, parameters, True)
+    encoding = exec_utils.get_param_value(Parameters.ENCODING, parameters, constants.DEFAULT_ENCODING)
+    cores = exec_utils.get_param_value(Parameters.CORES, parameters, multiprocessing.cpu_count())
+    chunk_size = exec_utils.get_param_value(Parameters.CHUNK_SIZE, parameters, 16 * _BYTES_PER_MB)
+
+    starts, end = __get_trace_boundaries(content, max_no_traces_to_import)
+    if not starts:
+        # nothing to split: the log is parsed as a whole
+        return _parse_document(content, encoding)
+
+    # the header (everything before the first trace) and the footer (everything after the last trace)
+    # form a well-formed document containing the log-level information
+    header = content[:starts[0]]
+    footer = content[end:]
+    if max_no_traces_to_import < sys.maxsize:
+        footer = b"</log>"
+    log_start = _LOG_START.search(header)
+    if log_start is None:
+        raise SyntaxError('trace found outside of <log> tag')
+    log_open_tag = header[:header.index(b">", log_start.start()) + 1]
+
+    log = _parse_document(header + footer, encoding)
+
+    chunks = __get_chunks(starts, end, chunk_size)
+    documents = (log_open_tag + content[x[0]:x[1]] + b"</log>" for x in chunks)
+
+    progress = None
+    if pkgutil.find_loader("tqdm") and show_progress_bar:
+        from tqdm.auto import tqdm
+        # the progress is expressed in bytes, so the bar reports the throughput in MB/s
+        progress = tqdm(total=len(content), unit="B", unit_scale=True, unit_divisor=1024,
+                        desc="parsing log, completed bytes :: ")
+        progress.update(len(content) - (end - starts[0]))
+
+    if cores > 1 and len(chunks) > 1:
+        workers = min(cores, len(chunks))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            # the traces are merged following the order of the chunks in the file
+            for index, traces in enumerate(__parse_chunks_in_order(executor, documents, encoding, 2 * workers)):
+                for trace in traces:
+                    log.append(trace)
+                if progress is not None:
+                    progress.update(chunks[index][1] - chunks[index][0])
+    else:
+        for index, document in enumerate(documents):
+            for trace in _parse_chunk(document, encoding):
+                log.append(trace)
+            if progress is not None:
+                progress.update(chunks[index][1] - chunks[index][0])
+
+    # gracefully close progress bar
+    if progress is not None:
+        progress.close()
+    del progress
+
+    if timestamp_sort:
+        log = sorting.sort_timestamp(log, timestamp_key=timestamp_key, reverse_sort=reverse_sort)
+
+    return log
+
+
+def apply(filename, parameters=None):
+    """
+    Imports an XES file into a log object, parsing chunks of traces in parallel
+
+    Parameters
+    ----------
+    filename:
+        Absolute filename
+    parameters
+        Parameters of the algorithm, including
+            Parameters.TIMESTAMP_SORT -> Specify if we should sort log by timestamp
+            Parameters.TIMESTAMP_KEY -> If sort is enabled, then sort the log by using this key
+            Parameters.REVERSE_SORT -> Specify in which direction the log should be sorted
+            Parameters.MAX_TRACES -> Specify the maximum number of traces to import from the log (read in order in the XML file)
+            Parameters.SHOW_PROGRESS_BAR -> Enables/disables the progress bar (default: True)
+            Parameters.ENCODING -> regulates the encoding (default: utf-8)
+            Parameters.CORES -> number of processes parsing the chunks (default: number of CPUs)
+            Parameters.CHUNK_SIZE -> approximate size (in bytes) of a chunk of traces (default: 16 MB)
+
+    Returns
+    -------
+    log : :class:`pm4py.log.log.EventLog`
+        A log
+    """
+    return import_log(filename, parameters)
+
+
+def import_log(filename, parameters=None):
+    """
+    Imports an XES file into a log object, parsing chunks of traces in parallel
+
+    Parameters
+    ----------
+    filename:
+        Absolute filename
+    parameters
+        Parameters of the algorithm (see apply)
+
+    Returns
+    -------
+    log : :class:`pm4py.log.log.EventLog`
+        A log
+    """
+    if parameters is None:
+        parameters = {}
+
+    if filename.lower().endswith(".gz"):
+        with gzip.open(filename, "rb") as f:
+            content = f.read()
+        return import_from_bytes(content, parameters=parameters)
+
+    with open(filename, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return import_from_bytes(f.read(), parameters=parameters)
+        # the file is mapped in memory instead of being read, so only the chunks being parsed are copied
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as content:
+            return import_from_bytes(content, parameters=parameters)
+
+
+def import_from_string(log_string, parameters=None):
+    """
+    Deserialize a text/binary string representing a XES log
+
+    Parameters
+    -----------
+    log_string
+        String that contains the XES
+    parameters
+        Parameters of the algorithm (see apply), including:
+            Parameters.DECOMPRESS_SERIALIZATION -> the string is compressed with GZIP
+
+    Returns
+    -----------
+    log
+        Trace log object
+    """
+    if parameters is None:
+        parameters = {}
+
+    decompress_serialization = exec_utils.get_param_value(Parameters.DECOMPRESS_SERIALIZATION, parameters, False)
+
+    if type(log_string) is str:
+        log_string = log_string.encode(constants.DEFAULT_ENCODING)
+
+    if decompress_serialization:
+        log_string = gzip.decompress(log_string)
+
+    return import_from_bytes(log_string, parameters=parameters)
@@ -0,0 +1,209 @@
+'''
+    This file is part of PM4Py (More Info: https://pm4py.fit.fraunhofer.de).
+
+    PM4Py is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    PM4Py is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
+'''
+import os
+import pickle
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+
+# types of the categories of a column, deciding how they are stored on disk
+TYPE_STRING = "string"
+TYPE_INTEGER = "integer"
+TYPE_FLOAT = "float"
+TYPE_BOOLEAN = "boolean"
+TYPE_DATETIME = "datetime"
+TYPE_PICKLE = "pickle"
+
+# offset stored for the naive datetimes
+NAIVE = np.iinfo(np.int32).min
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_EPOCH_NAIVE = datetime(1970, 1, 1)
+
+
+def get_type(categories):
+    """
+    Gets the (storage) type of a list of categories
+    """
+    if all(type(x) is str for x in categories):
+        return TYPE_STRING
+    if all(type(x) is bool or isinstance(x, np.bool_) for x in categories):
+        return TYPE_BOOLEAN
+    if all((type(x) is int and -2 ** 63 <= x < 2 ** 63) or isinstance(x, np.integer) for x in categories):
+        return TYPE_INTEGER
+    if all(type(x) is float or isinstance(x, np.floating) for x in categories):
+        return TYPE_FLOAT
+    if all(isinstance(x, datetime) for x in categories):
+        return TYPE_DATETIME
+    return TYPE_PICKLE
+
+
+def __to_nanoseconds(dt):
+    delta = dt - (_EPOCH if dt.tzinfo is not None else _EPOCH_NAIVE)
+    return (delta.days * 86400 + delta.seconds) * 10 ** 9 + delta.microseconds * 1000
+
+
+def __utc_offset(dt):
+    if dt.tzinfo is None:
+        return NAIVE
+    return int(dt.utcoffset().total_seconds())
+
+
+def write(categories, path_prefix):
+    """
+    Writes a list of categories to disk, as (memory-mappable) NumPy buffers whenever possible
+
+    Parameters
+    --------------
+    categories
+        List of categories
+    path_prefix
+        Prefix of the path of the files to write
+
+    Returns
+    --------------
+    categories_type
+        Type of the categories (it shall be provided to the reading method)
+    """
+    categories_type = get_type(categories)
+    if categories_type == TYPE_STRING:
+        encoded = [x.encode("utf-8") for x in categories]
+        offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+        offsets[1:] = np.cumsum([len(x) for x in encoded])
+        np.save(path_prefix + "_data.npy", np.frombuffer(b"".join(encoded), dtype=np.uint8))
+        np.save(path_prefix + "_offsets.npy", offsets)
+    elif categories_type == TYPE_BOOLEAN:
+        np.save(path_prefix + "_values.npy", np.array(categories, dtype=np.bool_))
+    elif categories_type == TYPE_INTEGER:
+        np.save(path_prefix + "_values.npy", np.array(categories, dtype=np.int64))
+    elif categories_type == TYPE_FLOAT:
+        np.save(path_prefix + "_values.npy", np.array(categories, dtype=np.float64))
+    elif categories_type == TYPE_DATETIME:
+        np.save(path_prefix + "_values.npy", np.array([__to_nanoseconds(x) for x in categories], dtype=np.int64))
+        np.save(path_prefix + "_tzoffsets.npy", np.array([__utc_offset(x) for x in categories], dtype=np.int32))
+    else:
+        with open(path_prefix + "_values.pkl", "wb") as f:
+            pickle.dump(list(categories), f)
+    return categories_type
+
+
+def read(categories_type, path_prefix, mmap_mode="r"):
+    """
+    Reads a list of categories (lazily, memory-mapping the buffers)
+
+    Parameters
+    --------------
+    categories_type
+        Type of the categories
+    path_prefix
+        Prefix of the path of the files
+    mmap_mode
+        Memory-mapping mode of the buffers (None to load them in memory)
+
+    Returns
+    --------------
+    categories
+        Sequence of categories
+    """
+    if categories_type == TYPE_PICKLE:
+        with open(path_prefix + "_values.pkl", "rb") as f:
+            return pickle.load(f)
+    buffers = {}
+    for suffix in ["_data", "_offsets", "_values", "_tzoffsets"]:
+        if os.path.exists(path_prefix + suffix + ".npy"):
+            buffers[suffix[1:]] = np.load(path_prefix + suffix + ".npy", mmap_mode=mmap_mode)
+    return MappedCategories(categories_type, buffers)
+
+
+class MappedCategories(object):
+    """
+    Sequence of categories backed by (memory-mapped) NumPy buffers. The categories are decoded only when accessed;
+    new categories can be appended (they are kept in memory).
+    """
+
+    def __init__(self, categories_type, buffers):
+        self.__type = categories_type
+        self.__buffers = buffers
+        if categories_type == TYPE_STRING:
+            self.__length = len(buffers["offsets"]) - 1
+        else:
+            self.__length = len(buffers["values"])
+        self.__appended = []
+
+    def __get_type(self):
+        return self.__type
+
+    def __get_buffers(self):
+        return self.__buffers
+
+    categories_type = property(__get_type)
+    buffers = property(__get_buffers)
+
+    def __len__(self):
+        return self.__length + len(self.__appended)
+
+    def __decode(self, i):
+        if self.__type == TYPE_STRING:
+            offsets = self.__buffers["offsets"]
+            return self.__buffers["data"][offsets[i]:offsets[i + 1]].tobytes().decode("utf-8")
+        value = self.__buffers["values"][i]
+        if self.__type == TYPE_BOOLEAN:
+            return bool(value)
+        elif self.__type == TYPE_INTEGER:
+            return int(value)
+        elif self.__type == TYPE_FLOAT:
+            return float(value)
+        offset = int(self.__buffers["tzoffsets"][i])
+        microseconds = timedelta(microseconds=int(value) // 1000)
+        if offset == NAIVE:
+            return _EPOCH_NAIVE + microseconds
+        return (_EPOCH + microseconds).astimezone(timezone(timedelta(seconds=offset)))
+
+    def __getitem__(self, item):
+        if isinstance(item, slice):
+            return [self[i] for i in range(len(self))[item]]
+        if item < 0:
+            item += len(self)
+        if item < 0 or item >= len(self):
+            raise IndexError(item)
+        if item >= self.__length:
+            return self.__appended[item - self.__length]
+        return self.__decode(item)
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def append(self, value):
+        self.__appended.append(value)
+
+    def to_array(self):
+        """
+        Decodes all the categories into a NumPy array (of objects, except for the numeric types)
+        """
+        if not self.__appended:
+            if self.__type in [TYPE_INTEGER, TYPE_FLOAT, TYPE_BOOLEAN]:
+                return np.asarray(self.__buffers["values"])
+            if self.__type == TYPE_STRING:
+                data = self.__buffers["data"].tobytes()
+                offsets = self.__buffers["offsets"]
+                ret = np.empty(self.__length, dtype=object)
+                ret[:] = [data[offsets[i]:offsets[i + 1]].decode("utf-8") for i in range(self.__length)]
+                return ret
+        ret = np.empty(len(self), dtype=object)
+        ret[:] = list(self)
+        return ret
@@ -81,7 +81,7 @@ def sample(log, n=100):
         Filtered log
     """
 
-    if type(log) is EventLog:
+    if isinstance(log, EventLog):
         return sample_log(log, no_traces=n)
 
     return sample_stream(log, no_events=n)
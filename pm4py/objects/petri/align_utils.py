@@ -16,12 +16,14 @@
 '''
 import heapq
 import sys
+import weakref
+from collections import OrderedDict, deque
 from copy import copy
 from typing import List, Tuple
 
 import numpy as np
 
-from pm4py.objects.petri import semantics
+from pm4py.objects.petri import compiled_net, semantics
 from pm4py.objects.petri.petrinet import Marking, PetriNet
 from pm4py.util.lp import solver as lp_solver
 
@@ -29,6 +31,11 @@ SKIP = '>>'
 STD_MODEL_LOG_MOVE_COST = 10000
 STD_TAU_COST = 1
 STD_SYNC_COST = 0
+# default maximum number of markings for which the visible transitions eventually enabled are kept (per Petri net)
+DEFAULT_VISIBLE_CLOSURE_CACHE_SIZE = 10000
+
+# caches of the visible transitions eventually enabled by the markings, kept as long as the Petri net is alive
+__VISIBLE_CLOSURE_CACHES = weakref.WeakKeyDictionary()
 
 
 def search_path_among_sol(sync_net: PetriNet, ini: Marking, fin: Marking,
@@ -397,9 +404,191 @@ class TweakedSearchTuple:
         return " ".join(string_build)
 
 
-def get_visible_transitions_eventually_enabled_by_marking(net, marking):
+class VisibleTransitionsClosureCache(object):
+    def __init__(self, net, max_size=DEFAULT_VISIBLE_CLOSURE_CACHE_SIZE):
+        """
+        Cache of the visible transitions eventually enabled by the markings of a Petri net. The cache contains at
+        most max_size markings, and the least recently used marking is removed when the cache is full.
+
+        Parameters
+        ----------
+        net
+            Petri net
+        max_size
+            Maximum number of markings in the cache
+        """
+        self.max_size = max_size
+        self.fingerprint = self.get_fingerprint(net)
+        self.closures = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def get_fingerprint(net):
+        """
+        Gets what identifies the structure of the Petri net, including the labels of the transitions and the arcs
+        (changing it invalidates the cache)
+        """
+        return compiled_net.get_fingerprint(net)
+
+    @staticmethod
+    def get_key(marking):
+        """
+        Gets the key of a marking in the cache (the markings are mutable)
+        """
+        return frozenset((p, n) for p, n in marking.items() if n > 0)
+
+    def __contains__(self, marking):
+        return self.get_key(marking) in self.closures
+
+    def get(self, net, marking):
+        """
+        Gets the visible transitions eventually enabled by the marking, computing them if not in the cache
+
+        Parameters
+        ----------
+        net
+            Petri net
+        marking
+            Marking
+
+        Returns
+        ----------
+        visible_transitions
+            Set of visible transitions
+        """
+        key = self.get_key(marking)
+        if key in self.closures:
+            self.closures.move_to_end(key)
+            self.hits += 1
+        else:
+            self.misses += 1
+            self.closures[key] = compute_visible_transitions_eventually_enabled_by_marking(net, marking)
+            while len(self.closures) > self.max_size:
+                self.closures.popitem(last=False)
+        return set(self.closures[key])
+
+    def get_statistics(self):
+        """
+        Gets the counters of the cache
+
+        Returns
+        ----------
+        statistics
+            Dictionary with the number of cached markings (size), of hits and of misses
+        """
+        return {"size": len(self.closures), "hits": self.hits, "misses": self.misses}
+
+
+def get_visible_transitions_closure_cache(net, max_size=None):
+    """
+    Gets the cache of the visible transitions eventually enabled by the markings of the Petri net. The cache is
+    kept as long as the Petri net is alive. The structure of the net (places, transitions, labels and arcs) is checked
+    at each call of this method, and the cache is emptied when it changed: the returned cache is meant to be used
+    while the net is not modified.
+
+    Parameters
+    ----------
+    net
+        Petri net
+    max_size
+        If provided, sets the maximum number of markings in the cache (default: DEFAULT_VISIBLE_CLOSURE_CACHE_SIZE)
+
+    Returns
+    ----------
+    cache
+        Cache of the Petri net
+    """
+    cache = __VISIBLE_CLOSURE_CACHES.get(net)
+    if cache is None or cache.fingerprint != VisibleTransitionsClosureCache.get_fingerprint(net):
+        cache = VisibleTransitionsClosureCache(net, max_size=max_size if max_size is not None else
+                                               DEFAULT_VISIBLE_CLOSURE_CACHE_SIZE)
+        __VISIBLE_CLOSURE_CACHES[net] = cache
+    elif max_size is not None:
+        cache.max_size = max_size
+        while len(cache.closures) > cache.max_size:
+            cache.closures.popitem(last=False)
+    return cache
+
+
+def clear_visible_transitions_closure_cache(net):
+    """
+    Removes the cache of the visible transitions eventually enabled by the markings of the Petri net
+    (releasing the memory before the net is garbage collected)
+
+    Parameters
+    ----------
+    net
+        Petri net
+    """
+    if net in __VISIBLE_CLOSURE_CACHES:
+        del __VISIBLE_CLOSURE_CACHES[net]
+
+
+def precompute_visible_transitions_eventually_enabled(net, marking, max_markings=None):
+    """
+    Fills the cache of the Petri net with the visible transitions eventually enabled by the markings reachable
+    from the provided marking through invisible transitions
+
+    Parameters
+    ----------
+    net
+        Petri net
+    marking
+        Marking
+    max_markings
+        Maximum number of markings to explore (default: the maximum size of the cache)
+
+    Returns
+    ----------
+    cache
+        Cache of the Petri net
+    """
+    cache = get_visible_transitions_closure_cache(net)
+    if max_markings is None:
+        max_markings = cache.max_size
+    invisible_transitions = [t for t in net.transitions if t.label is None]
+    seen = {VisibleTransitionsClosureCache.get_key(marking)}
+    to_visit = deque([marking])
+    explored = 0
+    while to_visit and explored < max_markings:
+        m = to_visit.popleft()
+        cache.get(net, m)
+        explored += 1
+        for t in invisible_transitions:
+            if semantics.is_enabled(t, net, m):
+                new_marking = semantics.execute(t, net, m)
+                key = VisibleTransitionsClosureCache.get_key(new_marking)
+                if key not in seen:
+                    seen.add(key)
+                    to_visit.append(new_marking)
+    return cache
+
+
+def get_visible_transitions_eventually_enabled_by_marking(net, marking, use_cache=False):
     """
     Get visible transitions eventually enabled by marking (passing possibly through hidden transitions)
+    Parameters
+    ----------
+    net
+        Petri net
+    marking
+        Current marking
+    use_cache
+        Uses (and fills) the cache of the markings of the Petri net. Checking the structure of the net has a cost
+        similar to a pass over its arcs, so repeated requests on the same net should rather get the cache once
+        (see get_visible_transitions_closure_cache) and call its get method
+    """
+    if use_cache:
+        return get_visible_transitions_closure_cache(net).get(net, marking)
+    return compute_visible_transitions_eventually_enabled_by_marking(net, marking)
+
+
+def compute_visible_transitions_eventually_enabled_by_marking(net, marking):
+    """
+    Computes (without using the cache) the visible transitions eventually enabled by marking
+    (passing possibly through hidden transitions)
+
     Parameters
     ----------
     net
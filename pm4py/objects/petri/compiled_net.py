@@ -0,0 +1,195 @@
+'''
+    This file is part of PM4Py (More Info: https://pm4py.fit.fraunhofer.de).
+
+    PM4Py is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    PM4Py is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
+'''
+import numpy as np
+
+from pm4py.objects.petri.petrinet import Marking
+
+
+class CompiledPetriNet(object):
+    """
+    Integer-indexed representation of a Petri net, meant for the hot paths (firing and enabledness checks)
+    of the state-space exploration techniques.
+
+    Places and transitions are identified by their index (the order is the same as the one of the incidence matrix),
+    markings are tuples of integers (one entry per place), and the pre/post incidence is stored both as NumPy arrays
+    (for vectorized computations) and as sparse tuples of (place index, weight) (for single firings).
+
+    It is used by the playout variants, the synchronous products and some alignment variants. The token-based replay
+    keeps working on Marking objects: it inserts the missing tokens in the marking during the replay, and returns
+    the markings and the transitions (as objects of the Petri net) in its results.
+    """
+
+    def __init__(self, net):
+        self.__places = sorted([x for x in net.places], key=lambda x: (str(x.name), id(x)))
+        self.__transitions = sorted([x for x in net.transitions], key=lambda x: (str(x.name), id(x)))
+        self.__place_indices = {p: i for i, p in enumerate(self.__places)}
+        self.__transition_indices = {t: i for i, t in enumerate(self.__transitions)}
+
+        self.__pre = np.zeros((len(self.__transitions), len(self.__places)), dtype=np.int64)
+        self.__post = np.zeros((len(self.__transitions), len(self.__places)), dtype=np.int64)
+        for t, i in self.__transition_indices.items():
+            for a in t.in_arcs:
+                self.__pre[i, self.__place_indices[a.source]] += a.weight
+            for a in t.out_arcs:
+                self.__post[i, self.__place_indices[a.target]] += a.weight
+
+        self.__pre_arcs = tuple(tuple((int(p), int(self.__pre[t, p])) for p in np.flatnonzero(self.__pre[t]))
+                                for t in range(len(self.__transitions)))
+        self.__post_arcs = tuple(tuple((int(p), int(self.__post[t, p])) for p in np.flatnonzero(self.__post[t]))
+                                 for t in range(len(self.__transitions)))
+        self.__consumers = tuple(tuple(int(t) for t in np.flatnonzero(self.__pre[:, p]))
+                                 for p in range(len(self.__places)))
+        self.__unconstrained = tuple(t for t in range(len(self.__transitions)) if not self.__pre_arcs[t])
+        self.__labels = tuple(t.label for t in self.__transitions)
+
+    def __get_places(self):
+        return self.__places
+
+    def __get_transitions(self):
+        return self.__transitions
+
+    def __get_place_indices(self):
+        return self.__place_indices
+
+    def __get_transition_indices(self):
+        return self.__transition_indices
+
+    def __get_pre(self):
+        return self.__pre
+
+    def __get_post(self):
+        return self.__post
+
+    def __get_incidence(self):
+        return self.__post - self.__pre
+
+    def __get_labels(self):
+        return self.__labels
+
+    def encode_marking(self, marking):
+        """
+        Transforms a marking of the original Petri net into a tuple of integers
+        """
+        x = [0] * len(self.__places)
+        for p in marking:
+            x[self.__place_indices[p]] = marking[p]
+        return tuple(x)
+
+    def decode_marking(self, m):
+        """
+        Transforms a tuple of integers into a marking of the original Petri net
+        """
+        marking = Marking()
+        for i, n in enumerate(m):
+            if n > 0:
+                marking[self.__places[i]] = n
+        return marking
+
+    def is_enabled(self, t, m):
+        """
+        Verifies whether the transition (index) is enabled in the given (encoded) marking
+        """
+        for p, w in self.__pre_arcs[t]:
+            if m[p] < w:
+                return False
+        return True
+
+    def execute(self, t, m):
+        """
+        Executes the transition (index) in the given (encoded) marking
+
+        Returns
+        -------
+        :return: newly reached (encoded) marking if the transition is enabled, None otherwise
+        """
+        if not self.is_enabled(t, m):
+            return None
+        m_out = list(m)
+        for p, w in self.__pre_arcs[t]:
+            m_out[p] -= w
+        for p, w in self.__post_arcs[t]:
+            m_out[p] += w
+        return tuple(m_out)
+
+    def weak_execute(self, t, m):
+        """
+        Executes the transition (index) even if it is not fully enabled
+        (the places that do not hold enough tokens are emptied)
+        """
+        m_out = list(m)
+        for p, w in self.__pre_arcs[t]:
+            m_out[p] = max(m_out[p] - w, 0)
+        for p, w in self.__post_arcs[t]:
+            m_out[p] += w
+        return tuple(m_out)
+
+    def enabled_transitions(self, m):
+        """
+        Returns the sorted list of the indices of the transitions that are enabled in the given (encoded) marking.
+        Only the transitions consuming from marked places (and the ones without input places) are checked.
+        """
+        candidates = set(self.__unconstrained)
+        for p, n in enumerate(m):
+            if n > 0:
+                candidates.update(self.__consumers[p])
+        return [t for t in sorted(candidates) if self.is_enabled(t, m)]
+
+    def enabled_transitions_vectorized(self, markings):
+        """
+        Computes the enabled transitions for a batch of (encoded) markings at once
+
+        Returns
+        -------
+        :return: boolean matrix (one row per marking, one column per transition)
+        """
+        markings = np.asarray(markings, dtype=np.int64).reshape((-1, len(self.__places)))
+        return np.all(markings[:, np.newaxis, :] >= self.__pre[np.newaxis, :, :], axis=2)
+
+    places = property(__get_places)
+    transitions = property(__get_transitions)
+    place_indices = property(__get_place_indices)
+    transition_indices = property(__get_transition_indices)
+    pre = property(__get_pre)
+    post = property(__get_post)
+    incidence = property(__get_incidence)
+    labels = property(__get_labels)
+
+
+def construct(net):
+    return CompiledPetriNet(net)
+
+
+def get_fingerprint(net):
+    """
+    Gets the structure of a Petri net as a hashable object: for every transition, its label and its preset/postset
+    (with the weights of the arcs). Places and transitions are identified by the objects, so the fingerprint of a net
+    changes when transitions are added, removed, relabelled or rewired, and is meant to validate cached data derived
+    from the compiled net (which keeps the places and the transitions alive).
+
+    Parameters
+    ----------------
+    net
+        Petri net
+
+    Returns
+    ----------------
+    fingerprint
+        Fingerprint of the structure of the net
+    """
+    return frozenset(id(p) for p in net.places), frozenset(
+        (id(t), t.label, frozenset((id(a.source), a.weight) for a in t.in_arcs),
+         frozenset((id(a.target), a.weight) for a in t.out_arcs)) for t in net.transitions)
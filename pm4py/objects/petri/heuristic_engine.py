@@ -0,0 +1,118 @@
+'''
+    This file is part of PM4Py (More Info: https://pm4py.fit.fraunhofer.de).
+
+    PM4Py is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    PM4Py is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
+'''
+import sys
+import time
+
+import numpy as np
+
+from pm4py.util.lp import solver as lp_solver
+
+
+class StateEquationHeuristic(object):
+    def __init__(self, a_matrix, fin_vec, cost_vec, variant=None):
+        """
+        Computes the state equation heuristics of the A* alignments (min cost * x s.t. A x = fin - m, x >= 0).
+
+        The LP problem is built once: when the variant of the solver supports it, the problem is kept by the solver
+        and only the right-hand side of the state equation changes between the solves (the solvers keeping the
+        basis, such as GLOP, warm-start each solve from the previous one). Otherwise, the matrices passed to the
+        solver are built once. The number of solved problems and the time spent are counted.
+
+        Parameters
+        --------------
+        a_matrix
+            Incidence matrix of the synchronous product net (places x transitions)
+        fin_vec
+            Encoding of the final marking
+        cost_vec
+            Costs of the transitions
+        variant
+            Variant of the LP solver (default: the default variant of the LP solver)
+        """
+        self.variant = variant if variant is not None else lp_solver.DEFAULT_LP_SOLVER_VARIANT
+        self.fin = np.asarray(fin_vec, dtype=np.float64)
+        self.num_transitions = len(cost_vec)
+        a_matrix = np.asmatrix(np.asarray(a_matrix, dtype=np.float64).reshape((len(fin_vec), len(cost_vec))))
+        g_matrix = -np.eye(len(cost_vec))
+        h_cvx = np.matrix(np.zeros(len(cost_vec))).transpose()
+        cost_vec = [x * 1.0 for x in cost_vec]
+        self.use_cvxopt = self.variant in (lp_solver.CVXOPT_SOLVER_CUSTOM_ALIGN,
+                                           lp_solver.CVXOPT_SOLVER_CUSTOM_ALIGN_ILP)
+        if self.use_cvxopt:
+            # not available in the latest version of PM4Py
+            from cvxopt import matrix
+            a_matrix = matrix(a_matrix)
+            g_matrix = matrix(g_matrix)
+            h_cvx = matrix(h_cvx)
+            cost_vec = matrix(cost_vec)
+        self.a_matrix = a_matrix
+        self.g_matrix = g_matrix
+        self.h_cvx = h_cvx
+        self.cost_vec = cost_vec
+        self.parameters_solving = {"solver": "glpk"}
+        self.problem = lp_solver.build_incremental(cost_vec, g_matrix, h_cvx, a_matrix,
+                                                   parameters=self.parameters_solving, variant=self.variant)
+        self.lp_solved = 0
+        self.lp_time = 0.0
+
+    def solve(self, m_vec):
+        """
+        Computes the heuristics of a marking
+
+        Parameters
+        --------------
+        m_vec
+            Encoding of the marking
+
+        Returns
+        --------------
+        h
+            Heuristics (cost of the optimal solution)
+        x
+            Optimal solution
+        """
+        start = time.time()
+        b_term = self.fin - np.asarray(m_vec, dtype=np.float64)
+        if self.problem is not None:
+            sol = self.problem.solve(b_term)
+        else:
+            b_term = np.matrix(b_term).transpose()
+            if self.use_cvxopt:
+                from cvxopt import matrix
+                b_term = matrix(b_term)
+            sol = lp_solver.apply(self.cost_vec, self.g_matrix, self.h_cvx, self.a_matrix, b_term,
+                                  parameters=self.parameters_solving, variant=self.variant)
+        prim_obj = lp_solver.get_prim_obj_from_sol(sol, variant=self.variant)
+        points = lp_solver.get_points_from_sol(sol, variant=self.variant)
+
+        prim_obj = prim_obj if prim_obj is not None else sys.maxsize
+        points = points if points is not None else [0.0] * self.num_transitions
+
+        self.lp_solved += 1
+        self.lp_time += time.time() - start
+        return prim_obj, points
+
+    def get_statistics(self):
+        """
+        Gets the counters of the computations of the heuristics
+
+        Returns
+        --------------
+        statistics
+            Dictionary with the number of solved LP problems (lp_solved) and the time spent solving them (lp_time)
+        """
+        return {"lp_solved": self.lp_solved, "lp_time": self.lp_time}
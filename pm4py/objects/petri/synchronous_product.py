@@ -14,9 +14,16 @@
     You should have received a copy of the GNU General Public License
     along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
 '''
+import weakref
+
+import numpy as np
+
 from pm4py.objects.petri.petrinet import PetriNet, Marking
 from pm4py.objects.petri.utils import add_arc_from_to
-from pm4py.objects.petri import properties
+from pm4py.objects.petri import properties, compiled_net
+
+# templates of the synchronous products, kept as long as the Petri net (of the model) is alive
+__TEMPLATES = weakref.WeakKeyDictionary()
 
 
 def construct(pn1, im1, fm1, pn2, im2, fm2, skip):
@@ -161,3 +168,194 @@ def __copy_into(source_net, target_net, upper, skip):
             add_arc_from_to(t_map[t], p_map[a.target], target_net)
 
     return t_map, p_map
+
+
+class SynchronousProductTemplate(object):
+    def __init__(self, net, im, fm, model_costs, sync_costs, skip):
+        """
+        Compiled part of the synchronous products of a Petri net (the model) with trace nets: the model part of the
+        incidence matrix, the encoded markings, the costs of the model/sync moves and the index of the model
+        transitions per label are computed once, and reused by the overlays of the traces (see overlay).
+
+        Parameters
+        ----------------
+        net
+            Petri net (model)
+        im
+            Initial marking of the model
+        fm
+            Final marking of the model
+        model_costs
+            Dictionary mapping the transitions of the model to the costs of the moves on model
+        sync_costs
+            Dictionary mapping the visible transitions of the model to the costs of the synchronous moves
+        skip
+            Symbol to be used as skip
+        """
+        self.net = compiled_net.construct(net)
+        self.skip = skip
+        self.im = self.net.encode_marking(im)
+        self.fm = self.net.encode_marking(fm)
+        self.incidence = self.net.incidence.transpose().astype(np.float64)
+        self.model_costs = [model_costs[t] for t in self.net.transitions]
+        self.sync_costs = [sync_costs[t] if t in sync_costs else 0 for t in self.net.transitions]
+        self.transitions_per_label = {}
+        for t, label in enumerate(self.net.labels):
+            if label is not None:
+                self.transitions_per_label.setdefault(label, []).append(t)
+        self.fingerprint = self.get_fingerprint(net, im, fm, model_costs, sync_costs, skip)
+
+    @staticmethod
+    def get_fingerprint(net, im, fm, model_costs, sync_costs, skip):
+        """
+        Gets what identifies the template of a Petri net (changing the structure of the net, including the labels
+        of the transitions and the arcs, the markings or the costs invalidates the template)
+        """
+        return (compiled_net.get_fingerprint(net), dict(im), dict(fm), dict(model_costs), dict(sync_costs), skip)
+
+    def overlay(self, labels, trace_costs):
+        """
+        Gets the synchronous product of the model with the trace net of the provided trace
+
+        Parameters
+        ----------------
+        labels
+            Activities of the trace
+        trace_costs
+            Costs of the moves on log (one per event of the trace)
+
+        Returns
+        ----------------
+        overlay
+            Synchronous product (as overlay of the template)
+        """
+        return SynchronousProductOverlay(self, labels, trace_costs)
+
+
+class SynchronousProductOverlay(object):
+    def __init__(self, template, labels, trace_costs):
+        """
+        Synchronous product of the model of a template with the trace net of a trace. Only the trace-dependent
+        arrays are built: the states are couples (position in the trace, encoded marking of the model),
+        and the moves are columns of the incidence matrix (the moves on model, then the moves on log,
+        then the synchronous moves in the order of the positions of the trace).
+
+        Parameters
+        ----------------
+        template
+            Template of the synchronous products of the model
+        labels
+            Activities of the trace
+        trace_costs
+            Costs of the moves on log (the first one per event of the trace are used)
+        """
+        self.template = template
+        self.labels = list(labels)
+        self.num_model_places = len(template.net.places)
+        self.num_model_transitions = len(template.net.transitions)
+        self.sync_transitions = [template.transitions_per_label.get(label, []) for label in self.labels]
+        self.sync_offsets = []
+        offset = self.num_model_transitions + len(self.labels)
+        for transitions in self.sync_transitions:
+            self.sync_offsets.append(offset)
+            offset += len(transitions)
+        sync_model = np.array([t for transitions in self.sync_transitions for t in transitions], dtype=np.int64)
+        sync_pos = np.array([i for i, transitions in enumerate(self.sync_transitions) for t in transitions],
+                            dtype=np.int64)
+        self.columns = [(t, None) for t in range(self.num_model_transitions)] + [
+            (None, i) for i in range(len(self.labels))] + list(zip(sync_model.tolist(), sync_pos.tolist()))
+        # the cost function of the trace could be longer than the trace (e.g. shared by the traces of a log)
+        if len(trace_costs) < len(self.labels):
+            raise Exception("the trace cost function has " + str(len(trace_costs)) + " costs, but the trace has " +
+                            str(len(self.labels)) + " events")
+        self.trace_costs = list(trace_costs[:len(self.labels)])
+        self.cost_vec = template.model_costs + self.trace_costs + [template.sync_costs[t] for t in sync_model]
+
+        num_trace_places = len(self.labels) + 1
+        log_pos = np.arange(len(self.labels), dtype=np.int64)
+        a_matrix = np.zeros((self.num_model_places + num_trace_places, len(self.columns)))
+        a_matrix[:self.num_model_places, :self.num_model_transitions] = template.incidence
+        for pos, cols in [(log_pos, log_pos + self.num_model_transitions),
+                          (sync_pos, np.arange(len(sync_pos), dtype=np.int64) + offset - len(sync_pos))]:
+            a_matrix[self.num_model_places + pos, cols] = -1
+            a_matrix[self.num_model_places + pos + 1, cols] = 1
+        a_matrix[:self.num_model_places, offset - len(sync_pos):] = template.incidence[:, sync_model]
+        self.a_matrix = a_matrix
+
+        self.ini = (0, template.im)
+        self.fin = (len(self.labels), template.fm)
+        self.fin_vec = self.encode_state(self.fin)
+
+    def encode_state(self, state):
+        """
+        Transforms a state (position in the trace, encoded marking of the model) into the marking vector of the
+        synchronous product
+        """
+        pos, m = state
+        vec = list(m) + [0] * (len(self.labels) + 1)
+        vec[self.num_model_places + pos] = 1
+        return vec
+
+    def successors(self, state):
+        """
+        Gets the moves enabled in the provided state
+
+        Returns
+        ----------------
+        successors
+            List of (column of the move, reached state, cost of the move)
+        """
+        pos, m = state
+        net = self.template.net
+        ret = [(t, (pos, net.execute(t, m)), self.template.model_costs[t]) for t in net.enabled_transitions(m)]
+        if pos < len(self.labels):
+            ret.append((self.num_model_transitions + pos, (pos + 1, m), self.trace_costs[pos]))
+            for k, t in enumerate(self.sync_transitions[pos]):
+                if net.is_enabled(t, m):
+                    ret.append((self.sync_offsets[pos] + k, (pos + 1, net.execute(t, m)), self.template.sync_costs[t]))
+        return ret
+
+    def get_move(self, col):
+        """
+        Gets the (name, label) description of the move of the provided column, as in the synchronous product net
+        """
+        skip = self.template.skip
+        t, pos = self.columns[col]
+        model_name = self.template.net.transitions[t].name if t is not None else skip
+        model_label = self.template.net.labels[t] if t is not None else skip
+        log_name = "t_" + self.labels[pos] + "_" + str(pos) if pos is not None else skip
+        log_label = self.labels[pos] if pos is not None else skip
+        return (log_name, model_name), (log_label, model_label)
+
+
+def construct_template(net, im, fm, model_costs, sync_costs, skip):
+    """
+    Gets the template of the synchronous products of a Petri net with the trace nets. The template is kept
+    (as long as the Petri net is alive) and reused while the net, its markings and the costs do not change.
+
+    Parameters
+    ----------------
+    net
+        Petri net (model)
+    im
+        Initial marking of the model
+    fm
+        Final marking of the model
+    model_costs
+        Dictionary mapping the transitions of the model to the costs of the moves on model
+    sync_costs
+        Dictionary mapping the visible transitions of the model to the costs of the synchronous moves
+    skip
+        Symbol to be used as skip
+
+    Returns
+    ----------------
+    template
+        Template of the synchronous products
+    """
+    template = __TEMPLATES.get(net)
+    if template is None or template.fingerprint != SynchronousProductTemplate.get_fingerprint(net, im, fm, model_costs,
+                                                                                             sync_costs, skip):
+        template = SynchronousProductTemplate(net, im, fm, model_costs, sync_costs, skip)
+        __TEMPLATES[net] = template
+    return template
@@ -127,3 +127,21 @@ class Exponential(BasicStructureRandomVariable):
         from scipy.stats import expon
 
         return expon.rvs(self.loc, self.scale)
+
+    def get_values(self, no_values=400):
+        """
+        Get some random values following the distribution
+
+        Parameters
+        -----------
+        no_values
+            Number of values to return
+
+        Returns
+        ----------
+        values
+            Values extracted according to the probability distribution
+        """
+        from scipy.stats import expon
+
+        return list(expon.rvs(self.loc, self.scale, size=no_values))
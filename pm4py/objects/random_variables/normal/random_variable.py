@@ -125,3 +125,21 @@ class Normal(BasicStructureRandomVariable):
         from scipy.stats import norm
 
         return norm.rvs(self.mu, self.sigma)
+
+    def get_values(self, no_values=400):
+        """
+        Get some random values following the distribution
+
+        Parameters
+        -----------
+        no_values
+            Number of values to return
+
+        Returns
+        ----------
+        values
+            Values extracted according to the probability distribution
+        """
+        from scipy.stats import norm
+
+        return list(norm.rvs(self.mu, self.sigma, size=no_values))
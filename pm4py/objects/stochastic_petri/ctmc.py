@@ -23,6 +23,13 @@ from pm4py.objects.stochastic_petri import tangible_reachability
 from pm4py.objects.conversion.dfg import converter as dfg_converter
 from pm4py.objects.random_variables import exponential, random_variable
 
+# sparse transient analysis: maximum value of (norm of the Q matrix) * (time interval) for which the action of the
+# matrix exponential is computed directly (its cost grows linearly with such value); beyond it, the chain is
+# considered stiff and the forward equations are integrated with an implicit method (with the given tolerances)
+EXPM_MULTIPLY_MAX_NORM = 1000.0
+IVP_RTOL = 1e-8
+IVP_ATOL = 1e-12
+
 
 def get_corr_hex(num):
     """
@@ -83,7 +90,8 @@ def get_color_from_probabilities(prob_dictionary):
     return color_dictionary
 
 
-def get_tangible_reachability_and_q_matrix_from_dfg_performance(dfg_performance, invisible_firing_rate=1000.0, parameters=None):
+def get_tangible_reachability_and_q_matrix_from_dfg_performance(dfg_performance, invisible_firing_rate=1000.0, parameters=None,
+                                                                 sparse=False):
     """
     Get the tangible reachability graph and the Q matrix from the performance DFG
 
@@ -95,6 +103,8 @@ def get_tangible_reachability_and_q_matrix_from_dfg_performance(dfg_performance,
         Firing rate for invisible transitions
     parameters
         Parameters
+    sparse
+        If True, the Q matrix is returned as a SciPy CSR matrix (suggested for big reachability graphs)
 
     Returns
     -------------
@@ -133,11 +143,14 @@ def get_tangible_reachability_and_q_matrix_from_dfg_performance(dfg_performance,
             rv.random_variable = exp
             stochastic_map[tr] = rv
     tang_reach_graph = construct_reachability_graph(net, im, use_trans_name=True)
-    q_matrix = get_q_matrix_from_tangible_exponential(tang_reach_graph, stochastic_map)
+    if sparse:
+        q_matrix = get_sparse_q_matrix_from_tangible_exponential(tang_reach_graph, stochastic_map)
+    else:
+        q_matrix = get_q_matrix_from_tangible_exponential(tang_reach_graph, stochastic_map)
     return tang_reach_graph, tang_reach_graph, stochastic_map, q_matrix
 
 
-def get_tangible_reachability_and_q_matrix_from_log_net(log, net, im, fm, parameters=None):
+def get_tangible_reachability_and_q_matrix_from_log_net(log, net, im, fm, parameters=None, sparse=False):
     """
     Gets the tangible reachability graph from a log and an accepting Petri net
 
@@ -151,6 +164,8 @@ def get_tangible_reachability_and_q_matrix_from_log_net(log, net, im, fm, parame
         Initial marking
     fm
         Final marking
+    sparse
+        If True, the Q matrix is returned as a SciPy CSR matrix (suggested for big reachability graphs)
 
     Returns
     ------------
@@ -168,11 +183,14 @@ def get_tangible_reachability_and_q_matrix_from_log_net(log, net, im, fm, parame
     reachability_graph, tangible_reachability_graph, stochastic_info = tangible_reachability.get_tangible_reachability_from_log_net_im_fm(
         log, net, im, fm, parameters=parameters)
     # gets the Q matrix assuming exponential distributions
-    q_matrix = get_q_matrix_from_tangible_exponential(tangible_reachability_graph, stochastic_info)
+    if sparse:
+        q_matrix = get_sparse_q_matrix_from_tangible_exponential(tangible_reachability_graph, stochastic_info)
+    else:
+        q_matrix = get_q_matrix_from_tangible_exponential(tangible_reachability_graph, stochastic_info)
     return reachability_graph, tangible_reachability_graph, stochastic_info, q_matrix
 
 
-def transient_analysis_from_petri_net_and_smap(net, im, s_map, delay, parameters=None):
+def transient_analysis_from_petri_net_and_smap(net, im, s_map, delay, parameters=None, sparse=False):
     """
     Gets the transient analysis from a Petri net, a stochastic map and a delay
 
@@ -184,6 +202,8 @@ def transient_analysis_from_petri_net_and_smap(net, im, s_map, delay, parameters
         Time delay
     parameters
         Parameters of the algorithm
+    sparse
+        If True, the analysis is performed on a sparse Q matrix
 
     Returns
     -------------
@@ -201,7 +221,10 @@ def transient_analysis_from_petri_net_and_smap(net, im, s_map, delay, parameters
     # get the tangible reachability graph from the reachability graph and the stochastic map
     tang_reach_graph = tangible_reachability.get_tangible_reachability_from_reachability(reachab_graph, s_map)
     # gets the Q matrix assuming exponential distributions
-    q_matrix = get_q_matrix_from_tangible_exponential(tang_reach_graph, s_map)
+    if sparse:
+        q_matrix = get_sparse_q_matrix_from_tangible_exponential(tang_reach_graph, s_map)
+    else:
+        q_matrix = get_q_matrix_from_tangible_exponential(tang_reach_graph, s_map)
     states = sorted(list(tang_reach_graph.states), key=lambda x: x.name)
     states_vector = np.zeros((1, len(states)))
 
@@ -238,6 +261,7 @@ def get_q_matrix_from_tangible_exponential(tangible_reach_graph, stochastic_info
         stochastic_info_name[s.name] = stochastic_info[s]
 
     states = sorted(list(tangible_reach_graph.states), key=lambda x: x.name)
+    states_indices = {s: i for i, s in enumerate(states)}
     no_states = len(states)
     q_matrix = np.zeros((no_states, no_states))
 
@@ -245,7 +269,7 @@ def get_q_matrix_from_tangible_exponential(tangible_reach_graph, stochastic_info
         sum_lambda = 0.0
         for trans in states[i].outgoing:
             target_state = trans.to_state
-            target_state_index = states.index(target_state)
+            target_state_index = states_indices[target_state]
             if not target_state_index == i:
                 sinfo = stochastic_info_name[trans.name]
                 lambda_value = 1.0 / float(sinfo.random_variable.scale)
@@ -256,6 +280,56 @@ def get_q_matrix_from_tangible_exponential(tangible_reach_graph, stochastic_info
     return q_matrix
 
 
+def get_sparse_q_matrix_from_tangible_exponential(tangible_reach_graph, stochastic_info):
+    """
+    Gets the Q matrix, as a SciPy CSR matrix, from tangible reachability graph and stochastic map where the
+    distribution type has been forced to be exponential (the memory occupation is linear in the number of arcs
+    of the graph, instead of quadratic in the number of states)
+
+    Parameters
+    -----------
+    tangible_reach_graph
+        Tangible reachability graph
+    stochastic_info
+        Stochastic map for each transition
+
+    Returns
+    -----------
+    q_matrix
+        (Sparse) Q-matrix from the tangible reachability graph
+    """
+    from scipy.sparse import csr_matrix
+
+    stochastic_info_name = {}
+    for s in stochastic_info:
+        stochastic_info_name[s.name] = stochastic_info[s]
+
+    states = sorted(list(tangible_reach_graph.states), key=lambda x: x.name)
+    states_indices = {s: i for i, s in enumerate(states)}
+    no_states = len(states)
+
+    rows = []
+    cols = []
+    values = []
+    for i in range(no_states):
+        sum_lambda = 0.0
+        for trans in states[i].outgoing:
+            target_state_index = states_indices[trans.to_state]
+            if not target_state_index == i:
+                sinfo = stochastic_info_name[trans.name]
+                lambda_value = 1.0 / float(sinfo.random_variable.scale)
+                sum_lambda = sum_lambda + lambda_value
+                rows.append(i)
+                cols.append(target_state_index)
+                values.append(lambda_value)
+        rows.append(i)
+        cols.append(i)
+        values.append(-sum_lambda)
+
+    # the duplicate entries (parallel arcs between the same states) are summed
+    return csr_matrix((values, (rows, cols)), shape=(no_states, no_states))
+
+
 def transient_analysis_from_tangible_q_matrix_and_single_state(tangible_reach_graph, q_matrix, source_state, time_diff):
     """
     Do transient analysis from tangible reachability graph, Q matrix and a single state to start from
@@ -296,32 +370,90 @@ def transient_analysis_from_tangible_q_matrix_and_states_vector(tangible_reach_g
     tangible_reach_graph
         Tangible reachability graph
     q_matrix
-        Q matrix
+        Q matrix (dense, or a SciPy sparse matrix; in the latter case, the action of the matrix exponential
+        on the vector of probabilities is computed, without building the exponential of the matrix)
     states_vector
         Vector of states probabilities to start from
     time_diff
-        Time interval we want to investigate
+        Time interval we want to investigate, or list of time intervals (they are evaluated in a single batch)
 
     Returns
     -----------
     transient_result
-        Transient analysis result
+        Transient analysis result (a list of results, one for each time interval, if a list has been provided)
     """
-    from scipy.linalg import expm
+    from scipy.sparse import issparse
 
-    transient_result = Counter()
     states = sorted(list(tangible_reach_graph.states), key=lambda x: x.name)
 
-    ht_matrix = expm(q_matrix * time_diff)
+    is_batch = isinstance(time_diff, (list, tuple, np.ndarray))
+    time_diffs = [float(x) for x in time_diff] if is_batch else [float(time_diff)]
 
-    res = np.matmul(states_vector, ht_matrix)
-    # normalize to 1 the vector of probabilities
-    res = res / np.sum(res)
+    if issparse(q_matrix):
+        res_vectors = __transient_vectors_sparse(q_matrix, states_vector, time_diffs)
+    else:
+        from scipy.linalg import expm
 
-    for i in range(len(states)):
-        transient_result[states[i]] = res[0, i]
+        states_vector = np.asarray(states_vector).reshape((1, -1))
+        res_vectors = [np.matmul(states_vector, expm(q_matrix * t))[0] for t in time_diffs]
 
-    return transient_result
+    results = []
+    for res in res_vectors:
+        # normalize to 1 the vector of probabilities
+        res = res / np.sum(res)
+        transient_result = Counter()
+        for i in range(len(states)):
+            transient_result[states[i]] = res[i]
+        results.append(transient_result)
+
+    return results if is_batch else results[0]
+
+
+def __transient_vectors_sparse(q_matrix, states_vector, time_diffs):
+    """
+    Computes the vectors of probabilities of the states after the given time intervals, starting from the
+    given vector, using the action of the exponential of the (sparse) Q matrix.
+
+    When the product between the norm of the Q matrix and the time intervals is small, the action of the exponential is
+    computed directly (equally spaced intervals are evaluated in a single call; otherwise, each interval starts from
+    the result of the previous one). Otherwise (stiff chains, e.g. with fast invisible transitions and long intervals)
+    the Kolmogorov forward equations are integrated with an implicit (BDF) method, evaluating all the intervals
+    in a single integration.
+    """
+    from scipy.integrate import solve_ivp
+    from scipy.sparse.linalg import expm_multiply
+
+    q_matrix_trans = q_matrix.transpose().tocsr()
+    start_vector = np.asarray(states_vector, dtype=np.float64).ravel()
+
+    order = sorted(range(len(time_diffs)), key=lambda i: time_diffs[i])
+    sorted_times = [time_diffs[i] for i in order]
+    res_vectors = [None] * len(time_diffs)
+
+    norm = abs(q_matrix_trans).sum(axis=0).max() if q_matrix_trans.nnz > 0 else 0.0
+    if norm * sorted_times[-1] > EXPM_MULTIPLY_MAX_NORM:
+        solution = solve_ivp(lambda t, y: q_matrix_trans @ y, (0.0, sorted_times[-1]), start_vector, method="BDF",
+                             jac=q_matrix_trans, t_eval=sorted_times, rtol=IVP_RTOL, atol=IVP_ATOL)
+        for j, i in enumerate(order):
+            res_vectors[i] = np.maximum(solution.y[:, j], 0.0)
+        return res_vectors
+
+    if len(sorted_times) > 2 and np.allclose(np.diff(sorted_times), sorted_times[1] - sorted_times[0]) and \
+            sorted_times[1] > sorted_times[0]:
+        vectors = expm_multiply(q_matrix_trans, start_vector, start=sorted_times[0], stop=sorted_times[-1],
+                                num=len(sorted_times), endpoint=True)
+        for j, i in enumerate(order):
+            res_vectors[i] = np.asarray(vectors[j])
+        return res_vectors
+
+    current_vector = start_vector
+    current_time = 0.0
+    for i in order:
+        if time_diffs[i] > current_time:
+            current_vector = expm_multiply(q_matrix_trans * (time_diffs[i] - current_time), current_vector)
+            current_time = time_diffs[i]
+        res_vectors[i] = np.asarray(current_vector)
+    return res_vectors
 
 
 def nullspace(a_matrix, atol=1e-13, rtol=0):
@@ -368,9 +500,13 @@ def nullspace(a_matrix, atol=1e-13, rtol=0):
 def perform_steadystate(q_matrix, tangible_reach_graph):
     """
     Performs steady state analysis given the
-    :param q_matrix:
+    :param q_matrix: Q matrix (dense, or a SciPy sparse matrix; in the latter case, an iterative solver is used)
     :return:
     """
+    from scipy.sparse import issparse
+
+    if issparse(q_matrix):
+        return __steadystate_sparse(q_matrix)
     transient_result = Counter()
     states = sorted(list(tangible_reach_graph.states), key=lambda x: x.name)
     q_matrix_trans = np.matrix.transpose(q_matrix)
@@ -386,3 +522,46 @@ def perform_steadystate(q_matrix, tangible_reach_graph):
             transient_result[states[i]] = vec[i]
         return vec
     return transient_result
+
+
+def __steadystate_sparse(q_matrix, tol=1e-12):
+    """
+    Solves the steady state equations (pi Q = 0, sum(pi) = 1) for a sparse Q matrix with the GMRES iterative solver.
+    The unknowns are scaled by the exit rate of the states (i.e. the system of the embedded jump chain is solved,
+    that is better conditioned when the rates differ by orders of magnitude); a sparse direct solver is used
+    if GMRES does not converge. A unique stationary distribution is assumed.
+
+    Parameters
+    -------------
+    q_matrix
+        Sparse Q matrix
+    tol
+        Tolerance of the iterative solver
+
+    Returns
+    -------------
+    vec
+        Vector of the steady-state probabilities (one for each state, in the order of the Q matrix)
+    """
+    import inspect
+    from scipy.sparse import diags
+    from scipy.sparse.linalg import gmres, spsolve
+
+    no_states = q_matrix.shape[0]
+    exit_rates = -q_matrix.diagonal()
+    exit_rates[exit_rates <= 0] = 1.0
+    a_matrix = (q_matrix.transpose() @ diags(1.0 / exit_rates)).tolil()
+    # one of the balance equations is redundant: it is replaced by the normalization constraint
+    a_matrix[no_states - 1, :] = 1.0 / exit_rates
+    a_matrix = a_matrix.tocsr()
+    b_vector = np.zeros(no_states)
+    b_vector[no_states - 1] = 1.0
+
+    tol_argument = "rtol" if "rtol" in inspect.signature(gmres).parameters else "tol"
+    x_vector, info = gmres(a_matrix, b_vector, atol=tol, restart=min(no_states, 50), maxiter=1000,
+                           **{tol_argument: tol})
+    if info != 0:
+        x_vector = spsolve(a_matrix.tocsc(), b_vector)
+
+    vec = np.maximum(x_vector / exit_rates, 0.0)
+    return vec / np.sum(vec)
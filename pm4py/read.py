@@ -15,9 +15,10 @@
     along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
 '''
 import warnings
-from typing import Tuple
+from typing import Tuple, Union
 
 import deprecation
+import pandas as pd
 
 from pm4py.objects.bpmn.bpmn_graph import BPMN
 from pm4py.objects.log.log import EventLog
@@ -176,3 +177,26 @@ def read_bpmn(file_path: str) -> BPMN:
     from pm4py.objects.bpmn.importer import importer as bpmn_importer
     bpmn_graph = bpmn_importer.apply(file_path)
     return bpmn_graph
+
+
+def read_columnar(file_path: str, return_dataframe: bool = False) -> Union[EventLog, pd.DataFrame]:
+    """
+    Reads a log stored in the columnar binary format (see write_columnar).
+    The buffers are memory-mapped, so the log is available almost instantly and the values are decoded
+    only when they are accessed
+
+    Parameters
+    ---------------
+    file_path
+        Path of the directory containing the log
+    return_dataframe
+        Returns a Pandas dataframe instead of an event log
+
+    Returns
+    ---------------
+    log
+        Event log (or dataframe)
+    """
+    from pm4py.objects.log.importer.columnar import importer as columnar_importer
+    return columnar_importer.apply(file_path, parameters={
+        columnar_importer.Variants.NUMPY_MMAP.value.Parameters.RETURN_DATAFRAME: return_dataframe})
@@ -163,7 +163,7 @@ def get_kde_numeric_attribute(log, attribute, parameters=None):
         Y-axis values to represent
     """
 
-    if type(log) is EventLog:
+    if isinstance(log, EventLog):
         event_log = log_conversion.apply(log, variant=log_conversion.TO_EVENT_STREAM)
     else:
         event_log = log
@@ -197,7 +197,7 @@ def get_kde_numeric_attribute_json(log, attribute, parameters=None):
         Y-axis values to represent
     """
 
-    if type(log) is EventLog:
+    if isinstance(log, EventLog):
         event_log = log_conversion.apply(log, variant=log_conversion.TO_EVENT_STREAM)
     else:
         event_log = log
@@ -230,7 +230,7 @@ def get_kde_date_attribute(log, attribute=DEFAULT_TIMESTAMP_KEY, parameters=None
         Y-axis values to represent
     """
 
-    if type(log) is EventLog:
+    if isinstance(log, EventLog):
         event_log = log_conversion.apply(log, variant=log_conversion.TO_EVENT_STREAM)
     else:
         event_log = log
@@ -264,7 +264,7 @@ def get_kde_date_attribute_json(log, attribute=DEFAULT_TIMESTAMP_KEY, parameters
         Y-axis values to represent
     """
 
-    if type(log) is EventLog:
+    if isinstance(log, EventLog):
         event_log = log_conversion.apply(log, variant=log_conversion.TO_EVENT_STREAM)
     else:
         event_log = log
@@ -18,7 +18,7 @@ from pm4py.statistics.variants.log import get as variants_get
 from pm4py.util.xes_constants import DEFAULT_TIMESTAMP_KEY
 from pm4py.util.xes_constants import DEFAULT_TRACEID_KEY
 from pm4py.statistics.traces.common import case_duration as case_duration_commons
-from pm4py.util.business_hours import BusinessHours
+from pm4py.util import business_hours as bh_util
 import numpy as np
 from enum import Enum
 from pm4py.util import exec_utils
@@ -42,6 +42,7 @@ class Parameters(Enum):
     BUSINESS_HOURS = "business_hours"
     WORKTIMING = "worktiming"
     WEEKENDS = "weekends"
+    HOLIDAYS = "holidays"
 
     INDEXED_LOG = "indexed_log"
 
@@ -109,6 +110,10 @@ def get_cases_description(log, parameters=None):
         Parameters.SORT_ASCENDING -> Set sort direction (boolean; it true then the sort direction is ascending, otherwise
         descending)
         Parameters.MAX_RET_CASES -> Set the maximum number of returned traces
+        Parameters.BUSINESS_HOURS -> Computes the durations considering only the business hours
+        Parameters.WORKTIMING -> Working hours of the working days (default: [7, 17])
+        Parameters.WEEKENDS -> Non-working days of the week (default: [6, 7])
+        Parameters.HOLIDAYS -> (if provided) list of non-working dates
 
     Returns
     -----------
@@ -128,24 +133,31 @@ def get_cases_description(log, parameters=None):
     business_hours = exec_utils.get_param_value(Parameters.BUSINESS_HOURS, parameters, False)
     worktiming = exec_utils.get_param_value(Parameters.WORKTIMING, parameters, [7, 17])
     weekends = exec_utils.get_param_value(Parameters.WEEKENDS, parameters, [6, 7])
+    holidays = exec_utils.get_param_value(Parameters.HOLIDAYS, parameters, None)
 
     statistics_list = []
+    start_timestamps = []
+    end_timestamps = []
 
     for index, trace in enumerate(log):
         if trace:
             ci = trace.attributes[case_id_key] if case_id_key in trace.attributes else "EMPTY" + str(index)
             st = trace[0][timestamp_key]
             et = trace[-1][timestamp_key]
-            if business_hours:
-                bh = BusinessHours(st.replace(tzinfo=None), et.replace(tzinfo=None), worktiming=worktiming,
-                                   weekends=weekends)
-                diff = bh.getseconds()
-            else:
-                diff = et.timestamp() - st.timestamp()
+            start_timestamps.append(st)
+            end_timestamps.append(et)
+            diff = et.timestamp() - st.timestamp()
             st = st.timestamp()
             et = et.timestamp()
             statistics_list.append([ci, st, et, diff])
 
+    if business_hours and statistics_list:
+        # the business durations of all the cases are computed at once (durations truncated to the minute)
+        business_seconds = bh_util.get_business_seconds(start_timestamps, end_timestamps, worktiming=worktiming,
+                                                        weekends=weekends, holidays=holidays)
+        for i in range(len(statistics_list)):
+            statistics_list[i][3] = int(business_seconds[i] / 60) * 60
+
     if enable_sort:
         statistics_list = sorted(statistics_list, key=lambda x: x[sort_by_index], reverse=not sort_ascending)
 
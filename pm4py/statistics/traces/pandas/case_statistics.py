@@ -19,6 +19,7 @@ from pm4py.util.xes_constants import DEFAULT_TIMESTAMP_KEY
 from pm4py.statistics.traces.common import case_duration as case_duration_commons
 from pm4py.util.constants import CASE_CONCEPT_NAME
 from pm4py.util import exec_utils, constants, pandas_utils
+from pm4py.util import business_hours as business_hours_util
 from enum import Enum
 import pandas as pd
 from pm4py.util import variants_util
@@ -36,6 +37,10 @@ class Parameters(Enum):
     SORT_BY_COLUMN = "sort_by_column"
     SORT_ASCENDING = "sort_ascending"
     MAX_RET_CASES = "max_ret_cases"
+    BUSINESS_HOURS = "business_hours"
+    WORKTIMING = "worktiming"
+    WEEKENDS = "weekends"
+    HOLIDAYS = "holidays"
 
 
 def get_variant_statistics(df, parameters=None):
@@ -127,6 +132,10 @@ def get_cases_description(df, parameters=None):
             Parameters.SORT_ASCENDING -> Set sort direction (boolean; it true then the sort direction is ascending,
             otherwise descending)
             Parameters.MAX_RET_CASES -> Set the maximum number of returned traces
+            Parameters.BUSINESS_HOURS -> Computes the durations considering only the business hours
+            Parameters.WORKTIMING -> Working hours of the working days (default: [7, 17])
+            Parameters.WEEKENDS -> Non-working days of the week (default: [6, 7])
+            Parameters.HOLIDAYS -> (if provided) list of non-working dates
 
     Returns
     -----------
@@ -143,6 +152,10 @@ def get_cases_description(df, parameters=None):
     sort_by_column = exec_utils.get_param_value(Parameters.SORT_BY_COLUMN, parameters, "startTime")
     sort_ascending = exec_utils.get_param_value(Parameters.SORT_ASCENDING, parameters, True)
     max_ret_cases = exec_utils.get_param_value(Parameters.MAX_RET_CASES, parameters, None)
+    business_hours = exec_utils.get_param_value(Parameters.BUSINESS_HOURS, parameters, False)
+    worktiming = exec_utils.get_param_value(Parameters.WORKTIMING, parameters, [7, 17])
+    weekends = exec_utils.get_param_value(Parameters.WEEKENDS, parameters, [6, 7])
+    holidays = exec_utils.get_param_value(Parameters.HOLIDAYS, parameters, None)
 
     grouped_df = df[[case_id_glue, timestamp_key]].groupby(df[case_id_glue])
     # grouped_df = df[[case_id_glue, timestamp_key]].groupby(df[case_id_glue])
@@ -155,8 +168,16 @@ def get_cases_description(df, parameters=None):
     del last_eve_df
     del stacked_df[case_id_glue]
     del stacked_df[case_id_glue + "_2"]
-    stacked_df['caseDuration'] = stacked_df[timestamp_key + "_2"] - stacked_df[timestamp_key]
-    stacked_df['caseDuration'] = stacked_df['caseDuration'].astype('timedelta64[s]')
+    if business_hours:
+        # durations truncated to the minute, as in the business hours computation on event logs
+        business_seconds = business_hours_util.get_business_seconds(stacked_df[timestamp_key],
+                                                                     stacked_df[timestamp_key + "_2"],
+                                                                     worktiming=worktiming, weekends=weekends,
+                                                                     holidays=holidays)
+        stacked_df['caseDuration'] = (business_seconds // 60) * 60
+    else:
+        stacked_df['caseDuration'] = stacked_df[timestamp_key + "_2"] - stacked_df[timestamp_key]
+        stacked_df['caseDuration'] = stacked_df['caseDuration'].astype('timedelta64[s]')
     stacked_df[timestamp_key + "_2"] = stacked_df[timestamp_key + "_2"].astype('int64') // 10 ** 9
     stacked_df[timestamp_key] = stacked_df[timestamp_key].astype('int64') // 10 ** 9
     stacked_df = stacked_df.rename(columns={timestamp_key: 'startTime', timestamp_key + "_2": 'endTime'})
@@ -0,0 +1,280 @@
+'''
+    This file is part of PM4Py (More Info: https://pm4py.fit.fraunhofer.de).
+
+    PM4Py is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    PM4Py is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
+'''
+import os
+import pickle
+import time
+import traceback
+import zlib
+from enum import Enum
+
+from pm4py.streaming.algo.interface import StreamingAlgorithm
+from pm4py.util import exec_utils
+
+
+class Parameters(Enum):
+    CHECKPOINT_DIR = "checkpoint_dir"
+    CHECKPOINT_EVENTS = "checkpoint_events"
+    CHECKPOINT_TIME = "checkpoint_time"
+    FSYNC = "fsync"
+
+
+SNAPSHOT_FILE = "snapshot.bin"
+WAL_FILE = "wal.bin"
+SNAPSHOT_VERSION = 1
+
+# records of the write-ahead log
+REC_EVENT = "e"
+REC_CALL = "c"
+
+
+def save_state(algorithm):
+    """
+    Serializes the state of a streaming algorithm (the content of its dictionaries, whatever the backend)
+    in a compact binary form
+
+    Parameters
+    --------------
+    algorithm
+        Streaming algorithm
+
+    Returns
+    --------------
+    state
+        Bytes
+    """
+    dictionaries = {}
+    for name, dictio in algorithm._state_dictionaries().items():
+        dictionaries[name] = [(k, dictio[k]) for k in list(dictio.keys())]
+    return zlib.compress(pickle.dumps(dictionaries, protocol=pickle.HIGHEST_PROTOCOL), 1)
+
+
+def load_state(algorithm, state):
+    """
+    Restores the state of a streaming algorithm, replacing the content of its dictionaries
+
+    Parameters
+    --------------
+    algorithm
+        Streaming algorithm (built with the same parameters as the one that was saved)
+    state
+        Bytes (returned by save_state)
+    """
+    dictionaries = pickle.loads(zlib.decompress(state))
+    target = algorithm._state_dictionaries()
+    for name, items in dictionaries.items():
+        if name not in target:
+            raise Exception("the dictionary " + name + " is not part of the state of the algorithm")
+        dictio = target[name]
+        for k in list(dictio.keys()):
+            del dictio[k]
+        for k, v in items:
+            dictio[k] = v
+
+
+class CheckpointedStreamingAlgorithm(StreamingAlgorithm):
+    def __init__(self, algorithm, parameters=None):
+        """
+        Wraps a streaming algorithm, saving periodically its state to the disk (the algorithm should expose its
+        state through the _state_dictionaries method). A checkpoint consists of
+        a snapshot of the dictionaries of the algorithm and of a write-ahead log of the events received after
+        the snapshot. When the object is created on a directory containing a checkpoint, the state of the
+        algorithm is restored from the snapshot and the events of the log are replayed.
+
+        Parameters
+        --------------
+        algorithm
+            Streaming algorithm
+        parameters
+            Parameters, including:
+            - Parameters.CHECKPOINT_DIR => directory hosting the checkpoint (required)
+            - Parameters.CHECKPOINT_EVENTS => number of events after which a new snapshot is taken (default: 10000)
+            - Parameters.CHECKPOINT_TIME => seconds after which a new snapshot is taken (default: None)
+            - Parameters.FSYNC => forces the write-ahead log to the disk after every record (default: False)
+        """
+        if parameters is None:
+            parameters = {}
+        if not algorithm._state_dictionaries():
+            # the snapshots of the algorithm would be empty, and the restore would silently lose its state
+            raise Exception("the streaming algorithm does not expose its state, and cannot be checkpointed")
+        self.algorithm = algorithm
+        self.checkpoint_dir = exec_utils.get_param_value(Parameters.CHECKPOINT_DIR, parameters, None)
+        if self.checkpoint_dir is None:
+            raise Exception("the checkpoint directory should be provided")
+        self.checkpoint_events = exec_utils.get_param_value(Parameters.CHECKPOINT_EVENTS, parameters, 10000)
+        self.checkpoint_time = exec_utils.get_param_value(Parameters.CHECKPOINT_TIME, parameters, None)
+        self.fsync = exec_utils.get_param_value(Parameters.FSYNC, parameters, False)
+        self.snapshot_path = os.path.join(self.checkpoint_dir, SNAPSHOT_FILE)
+        self.wal_path = os.path.join(self.checkpoint_dir, WAL_FILE)
+        os.makedirs(self.checkpoint_dir, exist_ok=True)
+        # sequence number of the last record, and of the last record included in the snapshot
+        self.seq = 0
+        self.snapshot_seq = 0
+        self.restore()
+        self.last_checkpoint_time = time.time()
+        self.wal = open(self.wal_path, "ab")
+        StreamingAlgorithm.__init__(self)
+
+    def restore(self):
+        """
+        Restores the state of the algorithm from the snapshot, and replays the records of the write-ahead log
+        """
+        if os.path.exists(self.snapshot_path):
+            with open(self.snapshot_path, "rb") as f:
+                version, self.snapshot_seq, state = pickle.load(f)
+            load_state(self.algorithm, state)
+            self.seq = self.snapshot_seq
+        if os.path.exists(self.wal_path):
+            with open(self.wal_path, "r+b") as f:
+                valid_size = 0
+                while True:
+                    try:
+                        seq, record = pickle.load(f)
+                    except Exception:
+                        # end of the log (possibly a record truncated by a crash)
+                        break
+                    valid_size = f.tell()
+                    if seq > self.seq:
+                        # the records already included in the snapshot are skipped
+                        self.__apply(record)
+                        self.seq = seq
+                # removes the truncated record, so the new records can be appended
+                f.truncate(valid_size)
+
+    def __apply(self, record):
+        if record[0] == REC_EVENT:
+            self.algorithm._process(record[1])
+        else:
+            getattr(self.algorithm, record[1])(*record[2])
+
+    def __log(self, record):
+        self.seq += 1
+        pickle.dump((self.seq, record), self.wal, protocol=pickle.HIGHEST_PROTOCOL)
+
+    def __sync(self):
+        self.wal.flush()
+        if self.fsync:
+            os.fsync(self.wal.fileno())
+
+    def __checkpoint_if_needed(self):
+        if self.seq - self.snapshot_seq >= self.checkpoint_events or (
+                self.checkpoint_time is not None and time.time() - self.last_checkpoint_time >= self.checkpoint_time):
+            self._checkpoint()
+
+    def _process(self, event):
+        self.__log((REC_EVENT, event))
+        self.__sync()
+        self.algorithm._process(event)
+        self.__checkpoint_if_needed()
+
+    def _process_batch(self, events):
+        # the batch is written to the log before being processed
+        for event in events:
+            self.__log((REC_EVENT, event))
+        self.__sync()
+        for event in events:
+            try:
+                self.algorithm._process(event)
+            except:
+                traceback.print_exc()
+        self.__checkpoint_if_needed()
+
+    def _current_result(self):
+        return self.algorithm._current_result()
+
+    def _checkpoint(self):
+        """
+        Writes a new snapshot (atomically replacing the previous one), and empties the write-ahead log
+        """
+        tmp_path = self.snapshot_path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            pickle.dump((SNAPSHOT_VERSION, self.seq, save_state(self.algorithm)), f, protocol=pickle.HIGHEST_PROTOCOL)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.snapshot_path)
+        # a crash before the truncation is harmless: the records of the log are already in the snapshot
+        self.wal.truncate(0)
+        self.wal.seek(0)
+        self.snapshot_seq = self.seq
+        self.last_checkpoint_time = time.time()
+
+    def checkpoint(self):
+        """
+        Forces a new snapshot of the state of the algorithm
+        """
+        self._lock.acquire()
+        try:
+            self._checkpoint()
+        finally:
+            self._lock.release()
+
+    def call(self, method, *args):
+        """
+        Calls a method of the algorithm that changes its state (e.g., terminate on the token-based replay),
+        recording the call in the write-ahead log
+
+        Parameters
+        --------------
+        method
+            Name of the method
+        args
+            Arguments of the method
+
+        Returns
+        --------------
+        ret
+            Value returned by the method
+        """
+        self._lock.acquire()
+        try:
+            self.__log((REC_CALL, method, args))
+            self.__sync()
+            ret = getattr(self.algorithm, method)(*args)
+            self.__checkpoint_if_needed()
+        finally:
+            self._lock.release()
+        return ret
+
+    def close(self):
+        """
+        Takes a final snapshot and closes the write-ahead log
+        """
+        self._lock.acquire()
+        try:
+            self._checkpoint()
+            self.wal.close()
+        finally:
+            self._lock.release()
+
+
+def apply(algorithm, parameters=None):
+    """
+    Wraps a streaming algorithm, checkpointing its state to the disk (and restoring it from an
+    existing checkpoint)
+
+    Parameters
+    --------------
+    algorithm
+        Streaming algorithm
+    parameters
+        Parameters of the checkpointing
+
+    Returns
+    --------------
+    checkpointed_algo
+        Checkpointed streaming algorithm
+    """
+    return CheckpointedStreamingAlgorithm(algorithm, parameters=parameters)
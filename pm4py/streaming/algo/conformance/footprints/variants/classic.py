@@ -16,6 +16,7 @@
 '''
 from pm4py.util import constants, exec_utils, xes_constants
 from pm4py.streaming.util.dictio import generator
+from pm4py.streaming.util import case_eviction
 from pm4py.streaming.algo.interface import StreamingAlgorithm
 import logging
 from copy import copy
@@ -29,6 +30,9 @@ class Parameters:
     DEV_DICT_ID = "dev_dict_id"
     CASE_ID_KEY = constants.PARAMETER_CONSTANT_CASEID_KEY
     ACTIVITY_KEY = constants.PARAMETER_CONSTANT_ACTIVITY_KEY
+    CASE_TTL = case_eviction.Parameters.CASE_TTL.value
+    MAX_OPEN_CASES = case_eviction.Parameters.MAX_OPEN_CASES.value
+    EVICTION_CALLBACK = case_eviction.Parameters.EVICTION_CALLBACK.value
 
 
 START_ACTIVITIES = "start_activities"
@@ -48,8 +52,15 @@ class FootprintsStreamingConformance(StreamingAlgorithm):
         footprints
             Footprints
         parameters
-            Parameters of the algorithm
-        """
+            Parameters of the algorithm, including:
+             - Parameters.CASE_TTL => idle time (in seconds) after which a case is terminated (default: None)
+             - Parameters.MAX_OPEN_CASES => maximum number of open cases; when exceeded, the least recently
+             updated case is terminated (default: None)
+             - Parameters.EVICTION_CALLBACK => function called as callback(case, is_fit) when a case is terminated
+             because of the two previous parameters
+        """
+        if parameters is None:
+            parameters = {}
         self.footprints = footprints
         self.case_id_key = exec_utils.get_param_value(Parameters.CASE_ID_KEY, parameters, constants.CASE_CONCEPT_NAME)
         self.activity_key = exec_utils.get_param_value(Parameters.ACTIVITY_KEY, parameters,
@@ -59,6 +70,7 @@ class FootprintsStreamingConformance(StreamingAlgorithm):
         self.activities = footprints[ACTIVITIES]
         self.all_fps = set(footprints[SEQUENCE]).union(set(footprints[PARALLEL]))
         self.build_dictionaries(parameters=parameters)
+        self.case_eviction = case_eviction.CaseEviction(parameters=parameters)
         StreamingAlgorithm.__init__(self)
 
     def build_dictionaries(self, parameters):
@@ -83,6 +95,10 @@ class FootprintsStreamingConformance(StreamingAlgorithm):
         self.case_dict = generator.apply(variant=dict_variant, parameters=parameters_case_dict)
         self.dev_dict = generator.apply(variant=dict_variant, parameters=parameters_dev_dict)
 
+    def _state_dictionaries(self):
+        return {"case_dict": self.case_dict, "dev_dict": self.dev_dict,
+                "case_eviction": self.case_eviction.last_update}
+
     def encode_str(self, stru):
         """
         Encodes a string for storage in generic dictionaries
@@ -101,7 +117,10 @@ class FootprintsStreamingConformance(StreamingAlgorithm):
         case = event[self.case_id_key] if self.case_id_key in event else None
         activity = event[self.activity_key] if self.activity_key in event else None
         if case is not None and activity is not None:
-            self.verify_footprints(self.encode_str(case), self.encode_str(activity))
+            case = self.encode_str(case)
+            self.verify_footprints(case, self.encode_str(activity))
+            if case in self.case_dict:
+                self.case_eviction.touch(case, self.terminate)
         else:
             self.message_case_or_activity_not_in_event(event)
 
@@ -206,6 +225,7 @@ class FootprintsStreamingConformance(StreamingAlgorithm):
             num_dev = int(self.dev_dict[case])
             del self.case_dict[case]
             del self.dev_dict[case]
+            self.case_eviction.remove(case)
             if num_dev == 0:
                 return True
             else:
@@ -221,6 +241,17 @@ class FootprintsStreamingConformance(StreamingAlgorithm):
         for case in cases:
             self.terminate(case)
 
+    def evict_expired(self):
+        """
+        Terminates the cases that have been idle for more than the TTL (this happens also
+        at the reception of every event)
+        """
+        self._lock.acquire()
+        try:
+            self.case_eviction.evict_expired(self.terminate)
+        finally:
+            self._lock.release()
+
     def message_case_or_activity_not_in_event(self, event):
         """
         Sends a message if the case or the activity are not
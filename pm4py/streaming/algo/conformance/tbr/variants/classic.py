@@ -16,6 +16,7 @@
 '''
 from pm4py.util import constants, exec_utils, xes_constants
 from pm4py.streaming.util.dictio import generator
+from pm4py.streaming.util import case_eviction
 import logging
 from pm4py.objects.petri.petrinet import PetriNet, Marking
 from pm4py.streaming.algo.interface import StreamingAlgorithm
@@ -33,6 +34,9 @@ class Parameters:
     CASE_ID_KEY = constants.PARAMETER_CONSTANT_CASEID_KEY
     ACTIVITY_KEY = constants.PARAMETER_CONSTANT_ACTIVITY_KEY
     MAXIMUM_ITERATIONS_INVISIBLES = "maximum_iterations_invisibles"
+    CASE_TTL = case_eviction.Parameters.CASE_TTL.value
+    MAX_OPEN_CASES = case_eviction.Parameters.MAX_OPEN_CASES.value
+    EVICTION_CALLBACK = case_eviction.Parameters.EVICTION_CALLBACK.value
 
 
 class TbrStreamingConformance(StreamingAlgorithm):
@@ -48,6 +52,13 @@ class TbrStreamingConformance(StreamingAlgorithm):
             Initial marking
         fm
             Final marking
+        parameters
+            Parameters of the algorithm, including:
+             - Parameters.CASE_TTL => idle time (in seconds) after which a case is terminated (default: None)
+             - Parameters.MAX_OPEN_CASES => maximum number of open cases; when exceeded, the least recently
+             updated case is terminated (default: None)
+             - Parameters.EVICTION_CALLBACK => function called as callback(case, diagnostics) when a case is
+             terminated because of the two previous parameters (the diagnostics are the ones returned by terminate)
         """
         if parameters is None:
             parameters = {}
@@ -63,6 +74,7 @@ class TbrStreamingConformance(StreamingAlgorithm):
         self.activities = list(set(x.label for x in self.net.transitions))
         self.dictio_spaths = self.get_paths_net()
         self.build_dictionaries(parameters=parameters)
+        self.case_eviction = case_eviction.CaseEviction(parameters=parameters)
         StreamingAlgorithm.__init__(self)
 
     def build_dictionaries(self, parameters):
@@ -92,6 +104,10 @@ class TbrStreamingConformance(StreamingAlgorithm):
         self.missing = generator.apply(variant=dict_variant, parameters=parameters_missing)
         self.remaining = generator.apply(variant=dict_variant, parameters=parameters_remaining)
 
+    def _state_dictionaries(self):
+        return {"case_dict": self.case_dict, "missing": self.missing, "remaining": self.remaining,
+                "case_eviction": self.case_eviction.last_update}
+
     def get_paths_net(self):
         """
         Gets the dictionary of shortest paths using invisibles transitions
@@ -143,7 +159,10 @@ class TbrStreamingConformance(StreamingAlgorithm):
         case = event[self.case_id_key] if self.case_id_key in event else None
         activity = event[self.activity_key] if self.activity_key in event else None
         if case is not None and activity is not None:
-            self.verify_tbr(self.encode_str(case), activity)
+            case = self.encode_str(case)
+            self.verify_tbr(case, activity)
+            if case in self.case_dict:
+                self.case_eviction.touch(case, self.terminate)
         else:
             self.message_case_or_activity_not_in_event(event)
 
@@ -314,6 +333,7 @@ class TbrStreamingConformance(StreamingAlgorithm):
             del self.case_dict[case]
             del self.missing[case]
             del self.remaining[case]
+            self.case_eviction.remove(case)
             return ret
         else:
             self.message_case_not_in_dictionary(case)
@@ -326,6 +346,17 @@ class TbrStreamingConformance(StreamingAlgorithm):
         for case in cases:
             self.terminate(case)
 
+    def evict_expired(self):
+        """
+        Terminates the cases that have been idle for more than the TTL (this happens also
+        at the reception of every event)
+        """
+        self._lock.acquire()
+        try:
+            self.case_eviction.evict_expired(self.terminate)
+        finally:
+            self._lock.release()
+
     def reach_fm_with_invisibles(self, marking):
         """
         Reaches the final marking using invisible transitions
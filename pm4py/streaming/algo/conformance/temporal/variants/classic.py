@@ -18,11 +18,12 @@ import logging
 import sys
 from copy import copy
 from enum import Enum
-from typing import Optional, Dict, Any, Tuple
+from typing import Optional, Dict, Any, Tuple, List
 
 from pm4py.objects.log.log import Event
 from pm4py.streaming.algo.interface import StreamingAlgorithm
 from pm4py.streaming.util.dictio import generator
+from pm4py.streaming.util import case_eviction
 from pm4py.util import exec_utils, constants, xes_constants
 from pm4py.util import typing
 import json
@@ -38,6 +39,9 @@ class Parameters(Enum):
     DICT_ID = "dict_id"
     CASE_DICT_ID = "case_dict_id"
     DEV_DICT_ID = "dev_dict_id"
+    CASE_TTL = case_eviction.Parameters.CASE_TTL.value
+    MAX_OPEN_CASES = case_eviction.Parameters.MAX_OPEN_CASES.value
+    EVICTION_CALLBACK = case_eviction.Parameters.EVICTION_CALLBACK.value
 
 
 class TemporalProfileStreamingConformance(StreamingAlgorithm):
@@ -62,6 +66,11 @@ class TemporalProfileStreamingConformance(StreamingAlgorithm):
              - Parameters.DICT_VARIANT => the variant of dictionary to use
              - Parameters.CASE_DICT_ID => the identifier of the case dictionary
              - Parameters.DEV_DICT_ID => the identifier of the deviations dictionary
+             - Parameters.CASE_TTL => idle time (in seconds) after which a case is terminated
+             - Parameters.MAX_OPEN_CASES => maximum number of open cases; when exceeded, the least recently
+             updated case is terminated
+             - Parameters.EVICTION_CALLBACK => function called as callback(case, deviations) when a case is
+             terminated because of the two previous parameters
         """
         if parameters is None:
             parameters = {}
@@ -84,8 +93,13 @@ class TemporalProfileStreamingConformance(StreamingAlgorithm):
         dev_dict_id = exec_utils.get_param_value(Parameters.DEV_DICT_ID, parameters, 1)
         parameters_dev[Parameters.DICT_ID] = dev_dict_id
         self.deviations_dict = generator.apply(variant=dict_variant, parameters=parameters_dev)
+        self.case_eviction = case_eviction.CaseEviction(parameters=parameters)
         StreamingAlgorithm.__init__(self)
 
+    def _state_dictionaries(self) -> Dict[str, Dict[Any, Any]]:
+        return {"case_dictionary": self.case_dictionary, "deviations_dict": self.deviations_dict,
+                "case_eviction": self.case_eviction.last_update}
+
     def _process(self, event: Event):
         """
         Checks the incoming event, and stores it in the cases dictionary
@@ -110,6 +124,50 @@ class TemporalProfileStreamingConformance(StreamingAlgorithm):
             this_case = json.loads(self.case_dictionary[case])
             this_case.append(ev_red)
             self.case_dictionary[case] = json.dumps(this_case)
+            self.case_eviction.touch(case, self.terminate)
+
+    def terminate(self, case: str) -> List[Tuple[str, str, str, float, float]]:
+        """
+        Terminates a case, removing its events and deviations from the dictionaries
+
+        Parameters
+        ---------------
+        case
+            Case
+
+        Returns
+        ---------------
+        deviations
+            Deviations of the case
+        """
+        case = str(case)
+        if case in self.case_dictionary.keys():
+            deviations = [tuple(x) for x in json.loads(self.deviations_dict[case])]
+            del self.case_dictionary[case]
+            del self.deviations_dict[case]
+            self.case_eviction.remove(case)
+            return deviations
+        else:
+            self.message_case_not_in_dictionary(case)
+
+    def terminate_all(self):
+        """
+        Terminates all the open cases
+        """
+        cases = list(self.case_dictionary.keys())
+        for case in cases:
+            self.terminate(case)
+
+    def evict_expired(self):
+        """
+        Terminates the cases that have been idle for more than the TTL (this happens also
+        at the reception of every event)
+        """
+        self._lock.acquire()
+        try:
+            self.case_eviction.evict_expired(self.terminate)
+        finally:
+            self._lock.release()
 
     def check_conformance(self, event: Tuple[str, float, float, str]):
         """
@@ -159,6 +217,17 @@ class TemporalProfileStreamingConformance(StreamingAlgorithm):
         """
         logging.error("the temporal profile is broken in the following setting: " + str(dev_descr))
 
+    def message_case_not_in_dictionary(self, case: str):
+        """
+        Method that is called when the provided case is not in the dictionary
+
+        Parameters
+        --------------
+        case
+            Case
+        """
+        logging.error("the case " + str(case) + " is not in the dictionary!")
+
     def _current_result(self) -> typing.TemporalProfileStreamingConfResults:
         """
         Gets the current deviations identified by conformance checking
@@ -197,6 +266,9 @@ def apply(temporal_profile: typing.TemporalProfile, parameters: Optional[Dict[An
          - Parameters.DICT_VARIANT => the variant of dictionary to use
          - Parameters.CASE_DICT_ID => the identifier of the case dictionary
          - Parameters.DEV_DICT_ID => the identifier of the deviations dictionary
+         - Parameters.CASE_TTL => idle time (in seconds) after which a case is terminated
+         - Parameters.MAX_OPEN_CASES => maximum number of open cases
+         - Parameters.EVICTION_CALLBACK => function called as callback(case, deviations) at the eviction of a case
     """
     if parameters is None:
         parameters = {}
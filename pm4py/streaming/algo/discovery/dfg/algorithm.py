@@ -14,13 +14,15 @@
     You should have received a copy of the GNU General Public License
     along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
 '''
-from pm4py.streaming.algo.discovery.dfg.variants import frequency
+from pm4py.streaming.algo.discovery.dfg.variants import frequency, windowed, decayed
 from enum import Enum
 from pm4py.util import exec_utils
 
 
 class Variants(Enum):
     FREQUENCY = frequency
+    WINDOWED = windowed
+    DECAYED = decayed
 
 
 DEFAULT_VARIANT = Variants.FREQUENCY
@@ -33,7 +35,12 @@ def apply(variant=DEFAULT_VARIANT, parameters=None):
     Parameters
     --------------
     variant
-        Variant of the algorithm (default: Variants.FREQUENCY)
+        Variant of the algorithm:
+        - Variants.FREQUENCY: counts all the observations (default)
+        - Variants.WINDOWED: counts the observations of a sliding window (of events, or of time)
+        - Variants.DECAYED: exponentially decays the weight of the observations with their age
+    parameters
+        Parameters of the variant
 
     Returns
     --------------
@@ -0,0 +1,214 @@
+'''
+    This file is part of PM4Py (More Info: https://pm4py.fit.fraunhofer.de).
+
+    PM4Py is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    PM4Py is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
+'''
+import logging
+import math
+from collections import Counter
+from enum import Enum
+
+from pm4py.streaming.algo.interface import StreamingAlgorithm
+from pm4py.util import exec_utils, constants, xes_constants
+
+
+class Parameters(Enum):
+    HALF_LIFE = "half_life"
+    USE_TIMESTAMPS = "use_timestamps"
+    MIN_WEIGHT = "min_weight"
+    ACTIVITY_KEY = constants.PARAMETER_CONSTANT_ACTIVITY_KEY
+    CASE_ID_KEY = constants.PARAMETER_CONSTANT_CASEID_KEY
+    TIMESTAMP_KEY = constants.PARAMETER_CONSTANT_TIMESTAMP_KEY
+
+
+# when the scale of the stored weights exceeds e^MAX_EXPONENT, the weights are rescaled (and the negligible ones are
+# removed)
+MAX_EXPONENT = 50.0
+
+
+class DecayedStreamingDfgDiscovery(StreamingAlgorithm):
+    def __init__(self, parameters=None):
+        """
+        Discovers a DFG in which the weight of the observations decays exponentially with their age
+        (an observation that is HALF_LIFE old weights 0.5). The age is measured in number of events, or in seconds
+        (using the timestamps of the events).
+
+        Instead of decaying all the weights at every event, the weights are stored relatively to a landmark time
+        (an observation at time t is stored as e^(lambda * (t - landmark))), so the update is O(1). When the stored
+        weights grow too large, the landmark is moved and the weights below MIN_WEIGHT are removed,
+        which keeps the memory proportional to the number of active edges and cases.
+
+        Parameters
+        ---------------
+        parameters
+            Parameters of the algorithm, including:
+             - Parameters.HALF_LIFE => half life of the observations (number of events, or seconds) (default: 10000)
+             - Parameters.USE_TIMESTAMPS => measures the age in seconds, using the timestamps of the events
+             (default: False)
+             - Parameters.MIN_WEIGHT => weight under which an edge, an activity or a case is forgotten
+             (default: 0.001)
+             - Parameters.ACTIVITY_KEY => the key of the event to use as activity
+             - Parameters.CASE_ID_KEY => the key of the event to use as case identifier
+             - Parameters.TIMESTAMP_KEY => the key of the event to use as timestamp
+        """
+        if parameters is None:
+            parameters = {}
+
+        half_life = exec_utils.get_param_value(Parameters.HALF_LIFE, parameters, 10000)
+        self.decay_rate = math.log(2) / half_life
+        self.use_timestamps = exec_utils.get_param_value(Parameters.USE_TIMESTAMPS, parameters, False)
+        self.min_weight = exec_utils.get_param_value(Parameters.MIN_WEIGHT, parameters, 0.001)
+        self.activity_key = exec_utils.get_param_value(Parameters.ACTIVITY_KEY, parameters,
+                                                       xes_constants.DEFAULT_NAME_KEY)
+        self.case_id_key = exec_utils.get_param_value(Parameters.CASE_ID_KEY, parameters,
+                                                      constants.CASE_CONCEPT_NAME)
+        self.timestamp_key = exec_utils.get_param_value(Parameters.TIMESTAMP_KEY, parameters,
+                                                        xes_constants.DEFAULT_TIMESTAMP_KEY)
+        # number of received events, time of the last event, and landmark time of the stored weights
+        self.status = {"num_events": 0, "current_time": None, "landmark": None}
+        # stored (relative to the landmark) weights
+        self.dfg = Counter()
+        self.activities = Counter()
+        self.start_activities = Counter()
+        self.end_activities = Counter()
+        # case -> (last activity, stored weight of the last event)
+        self.case_dict = {}
+        StreamingAlgorithm.__init__(self)
+
+    def _state_dictionaries(self):
+        return {"status": self.status, "dfg": self.dfg, "activities": self.activities,
+                "start_activities": self.start_activities, "end_activities": self.end_activities,
+                "case_dict": self.case_dict}
+
+    def event_without_activity_or_case(self, event):
+        """
+        Print an error message when an event is without the
+        activity or the case identifier (or the timestamp, when it is used)
+
+        Parameters
+        ----------------
+        event
+            Event
+        """
+        logging.warning("event without activity or case: " + str(event))
+
+    def get_time(self, event):
+        """
+        Gets the time of the event (the time never goes back, late events are considered at the current time)
+        """
+        if self.use_timestamps:
+            timestamp = event[self.timestamp_key]
+            if hasattr(timestamp, "timestamp"):
+                timestamp = timestamp.timestamp()
+        else:
+            timestamp = self.status["num_events"]
+        if self.status["current_time"] is not None and timestamp < self.status["current_time"]:
+            timestamp = self.status["current_time"]
+        return timestamp
+
+    def rescale(self, time):
+        """
+        Moves the landmark to the provided time, rescaling the stored weights and removing the negligible ones
+        """
+        factor = math.exp(-self.decay_rate * (time - self.status["landmark"]))
+        for counter in [self.dfg, self.activities, self.start_activities, self.end_activities]:
+            for k in list(counter):
+                counter[k] *= factor
+                if counter[k] < self.min_weight:
+                    del counter[k]
+        for case in list(self.case_dict):
+            activity, weight = self.case_dict[case]
+            weight *= factor
+            if weight < self.min_weight:
+                del self.case_dict[case]
+                if activity in self.end_activities:
+                    self.end_activities[activity] -= weight
+                    if self.end_activities[activity] < self.min_weight:
+                        del self.end_activities[activity]
+            else:
+                self.case_dict[case] = (activity, weight)
+        self.status["landmark"] = time
+
+    def _process(self, event):
+        """
+        Receives an event from the live event stream,
+        and updates the decayed DFG
+
+        Parameters
+        ---------------
+        event
+            Event
+        """
+        if self.case_id_key not in event or self.activity_key not in event or (
+                self.use_timestamps and self.timestamp_key not in event):
+            self.event_without_activity_or_case(event)
+            return
+        case = event[self.case_id_key]
+        activity = event[self.activity_key]
+        time = self.get_time(event)
+        if self.status["landmark"] is None:
+            self.status["landmark"] = time
+        elif self.decay_rate * (time - self.status["landmark"]) > MAX_EXPONENT:
+            self.rescale(time)
+        self.status["current_time"] = time
+        weight = math.exp(self.decay_rate * (time - self.status["landmark"]))
+        if case in self.case_dict:
+            prev_activity, prev_weight = self.case_dict[case]
+            self.dfg[(prev_activity, activity)] += weight
+            if prev_activity in self.end_activities:
+                self.end_activities[prev_activity] -= prev_weight
+        else:
+            self.start_activities[activity] += weight
+        self.activities[activity] += weight
+        self.end_activities[activity] += weight
+        self.case_dict[case] = (activity, weight)
+        self.status["num_events"] += 1
+
+    def _current_result(self):
+        """
+        Gets the decayed DFG, at the time of the last event
+
+        Returns
+        ----------------
+        dfg
+            Directly-Follows Graph (decayed weights)
+        activities
+            Activities (decayed weights)
+        start_activities
+            Start activities (decayed weights)
+        end_activities
+            End activities (decayed weights of the last event of the cases)
+        """
+        if self.status["landmark"] is None:
+            return {}, {}, {}, {}
+        factor = math.exp(-self.decay_rate * (self.status["current_time"] - self.status["landmark"]))
+        ret = []
+        for counter in [self.dfg, self.activities, self.start_activities, self.end_activities]:
+            ret.append({k: v * factor for k, v in counter.items() if v * factor >= self.min_weight})
+        return tuple(ret)
+
+
+def apply(parameters=None):
+    """
+    Creates a DecayedStreamingDfgDiscovery object
+
+    Parameters
+    --------------
+    parameters
+        Parameters of the algorithm
+    """
+    if parameters is None:
+        parameters = {}
+
+    return DecayedStreamingDfgDiscovery(parameters=parameters)
@@ -90,6 +90,10 @@ class StreamingDfgDiscovery(StreamingAlgorithm):
         self.activities = generator.apply(variant=dict_variant, parameters=parameters_activities)
         self.start_activities = generator.apply(variant=dict_variant, parameters=parameters_start_activities)
 
+    def _state_dictionaries(self):
+        return {"case_dict": self.case_dict, "dfg": self.dfg, "activities": self.activities,
+                "start_activities": self.start_activities}
+
     def event_without_activity_or_case(self, event):
         """
         Print an error message when an event is without the
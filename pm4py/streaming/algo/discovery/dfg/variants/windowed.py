@@ -0,0 +1,229 @@
+'''
+    This file is part of PM4Py (More Info: https://pm4py.fit.fraunhofer.de).
+
+    PM4Py is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    PM4Py is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
+'''
+import logging
+from collections import Counter
+from enum import Enum
+
+from pm4py.streaming.algo.interface import StreamingAlgorithm
+from pm4py.util import exec_utils, constants, xes_constants
+
+
+class Parameters(Enum):
+    WINDOW_TYPE = "window_type"
+    WINDOW_SIZE = "window_size"
+    NUM_BUCKETS = "num_buckets"
+    ACTIVITY_KEY = constants.PARAMETER_CONSTANT_ACTIVITY_KEY
+    CASE_ID_KEY = constants.PARAMETER_CONSTANT_CASEID_KEY
+    TIMESTAMP_KEY = constants.PARAMETER_CONSTANT_TIMESTAMP_KEY
+
+
+class WindowType(Enum):
+    # the window contains the last WINDOW_SIZE events
+    COUNT = "count"
+    # the window contains the events of the last WINDOW_SIZE seconds
+    TIME = "time"
+
+
+class Bucket(object):
+    def __init__(self, index):
+        self.index = index
+        self.dfg = Counter()
+        self.activities = Counter()
+        self.start_activities = Counter()
+        # cases having their last event in the bucket
+        self.cases = set()
+
+
+def decrement(counter, other):
+    """
+    Subtracts the counts of a counter from another one, removing the keys reaching zero
+    """
+    for k, v in other.items():
+        if counter[k] == v:
+            del counter[k]
+        else:
+            counter[k] -= v
+
+
+class WindowedStreamingDfgDiscovery(StreamingAlgorithm):
+    def __init__(self, parameters=None):
+        """
+        Discovers a DFG on a sliding window of the stream (containing the last N events, or the events of the last
+        N seconds). The window is divided in buckets: each bucket keeps the counts of its events, and the totals
+        of the window are updated when an event is received (adding it) and when the oldest bucket expires
+        (subtracting its counts). Hence, the update is O(1) amortized, and the memory is proportional to the
+        number of edges, activities and cases that are active in the window.
+
+        A case is forgotten when its last event leaves the window (its next event counts as start activity).
+
+        Parameters
+        ---------------
+        parameters
+            Parameters of the algorithm, including:
+             - Parameters.WINDOW_TYPE => WindowType.COUNT (default) or WindowType.TIME
+             - Parameters.WINDOW_SIZE => size of the window (number of events, or seconds) (default: 10000)
+             - Parameters.NUM_BUCKETS => number of buckets in which the window is divided; the window slides of
+             one bucket at a time (default: 10)
+             - Parameters.ACTIVITY_KEY => the key of the event to use as activity
+             - Parameters.CASE_ID_KEY => the key of the event to use as case identifier
+             - Parameters.TIMESTAMP_KEY => the key of the event to use as timestamp (time window)
+        """
+        if parameters is None:
+            parameters = {}
+
+        self.window_type = WindowType(exec_utils.get_param_value(Parameters.WINDOW_TYPE, parameters,
+                                                                 WindowType.COUNT))
+        self.window_size = exec_utils.get_param_value(Parameters.WINDOW_SIZE, parameters, 10000)
+        self.num_buckets = exec_utils.get_param_value(Parameters.NUM_BUCKETS, parameters, 10)
+        self.activity_key = exec_utils.get_param_value(Parameters.ACTIVITY_KEY, parameters,
+                                                       xes_constants.DEFAULT_NAME_KEY)
+        self.case_id_key = exec_utils.get_param_value(Parameters.CASE_ID_KEY, parameters,
+                                                      constants.CASE_CONCEPT_NAME)
+        self.timestamp_key = exec_utils.get_param_value(Parameters.TIMESTAMP_KEY, parameters,
+                                                        xes_constants.DEFAULT_TIMESTAMP_KEY)
+        self.bucket_width = self.window_size / self.num_buckets
+        # number of received events, and index of the last bucket
+        self.status = {"num_events": 0, "last_bucket": None}
+        # index -> bucket (in increasing order of index)
+        self.buckets = {}
+        # totals of the window
+        self.dfg = Counter()
+        self.activities = Counter()
+        self.start_activities = Counter()
+        self.end_activities = Counter()
+        # case -> (last activity, index of the bucket of the last event)
+        self.case_dict = {}
+        StreamingAlgorithm.__init__(self)
+
+    def _state_dictionaries(self):
+        return {"status": self.status, "buckets": self.buckets, "dfg": self.dfg, "activities": self.activities,
+                "start_activities": self.start_activities, "end_activities": self.end_activities,
+                "case_dict": self.case_dict}
+
+    def event_without_activity_or_case(self, event):
+        """
+        Print an error message when an event is without the
+        activity or the case identifier (or the timestamp, for the time window)
+
+        Parameters
+        ----------------
+        event
+            Event
+        """
+        logging.warning("event without activity or case: " + str(event))
+
+    def get_bucket_index(self, event):
+        """
+        Gets the index of the bucket of the event. For the time window, late events are assigned to the
+        current bucket (the window never goes back in time)
+        """
+        if self.window_type == WindowType.COUNT:
+            index = int(self.status["num_events"] // self.bucket_width)
+        else:
+            timestamp = event[self.timestamp_key]
+            if hasattr(timestamp, "timestamp"):
+                timestamp = timestamp.timestamp()
+            index = int(timestamp // self.bucket_width)
+        if self.buckets and index < self.status["last_bucket"]:
+            index = self.status["last_bucket"]
+        return index
+
+    def expire(self, index):
+        """
+        Removes the buckets falling out of the window, when the current bucket is the one with the provided index
+        """
+        while self.buckets:
+            oldest = next(iter(self.buckets))
+            if oldest > index - self.num_buckets:
+                break
+            bucket = self.buckets.pop(oldest)
+            decrement(self.dfg, bucket.dfg)
+            decrement(self.activities, bucket.activities)
+            decrement(self.start_activities, bucket.start_activities)
+            for case in bucket.cases:
+                decrement(self.end_activities, {self.case_dict[case][0]: 1})
+                del self.case_dict[case]
+
+    def _process(self, event):
+        """
+        Receives an event from the live event stream,
+        and updates the DFG of the window
+
+        Parameters
+        ---------------
+        event
+            Event
+        """
+        if self.case_id_key not in event or self.activity_key not in event or (
+                self.window_type == WindowType.TIME and self.timestamp_key not in event):
+            self.event_without_activity_or_case(event)
+            return
+        case = event[self.case_id_key]
+        activity = event[self.activity_key]
+        index = self.get_bucket_index(event)
+        self.expire(index)
+        if index not in self.buckets:
+            self.buckets[index] = Bucket(index)
+            self.status["last_bucket"] = index
+        bucket = self.buckets[index]
+        if case in self.case_dict:
+            prev_activity, prev_index = self.case_dict[case]
+            self.buckets[prev_index].cases.discard(case)
+            decrement(self.end_activities, {prev_activity: 1})
+            bucket.dfg[(prev_activity, activity)] += 1
+            self.dfg[(prev_activity, activity)] += 1
+        else:
+            bucket.start_activities[activity] += 1
+            self.start_activities[activity] += 1
+        bucket.activities[activity] += 1
+        self.activities[activity] += 1
+        bucket.cases.add(case)
+        self.end_activities[activity] += 1
+        self.case_dict[case] = (activity, index)
+        self.status["num_events"] += 1
+
+    def _current_result(self):
+        """
+        Gets the DFG of the current window
+
+        Returns
+        ----------------
+        dfg
+            Directly-Follows Graph
+        activities
+            Activities
+        start_activities
+            Start activities
+        end_activities
+            End activities (last activity of the cases of the window)
+        """
+        return dict(self.dfg), dict(self.activities), dict(self.start_activities), dict(self.end_activities)
+
+
+def apply(parameters=None):
+    """
+    Creates a WindowedStreamingDfgDiscovery object
+
+    Parameters
+    --------------
+    parameters
+        Parameters of the algorithm
+    """
+    if parameters is None:
+        parameters = {}
+
+    return WindowedStreamingDfgDiscovery(parameters=parameters)
@@ -32,6 +32,11 @@ class StreamingAlgorithm(abc.ABC):
     def _current_result(self):
         pass
 
+    def _state_dictionaries(self):
+        # dictionaries (name -> dictionary) hosting the state of the algorithm, which are saved by the checkpoints
+        # (an algorithm not exposing its state cannot be checkpointed)
+        return {}
+
     def get(self):
         self._lock.acquire()
         try:
@@ -42,6 +47,13 @@ class StreamingAlgorithm(abc.ABC):
         self._lock.release()
         return ret
 
+    def _process_batch(self, events):
+        for event in events:
+            try:
+                self._process(event)
+            except:
+                traceback.print_exc()
+
     def receive(self, event):
         self._lock.acquire()
         try:
@@ -49,3 +61,12 @@ class StreamingAlgorithm(abc.ABC):
         except:
             traceback.print_exc()
         self._lock.release()
+
+    def receive_batch(self, events):
+        # the whole batch is processed acquiring the lock once
+        self._lock.acquire()
+        try:
+            self._process_batch(events)
+        except:
+            traceback.print_exc()
+        self._lock.release()
@@ -0,0 +1,286 @@
+'''
+    This file is part of PM4Py (More Info: https://pm4py.fit.fraunhofer.de).
+
+    PM4Py is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    PM4Py is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
+'''
+import multiprocessing
+import pickle
+import queue
+import traceback
+import zlib
+from collections import Counter
+from enum import Enum
+
+from pm4py.streaming.algo.interface import StreamingAlgorithm
+from pm4py.util import exec_utils, constants
+
+
+class Parameters(Enum):
+    NUM_SHARDS = "num_shards"
+    CASE_ID_KEY = constants.PARAMETER_CONSTANT_CASEID_KEY
+    CHUNK_SIZE = "chunk_size"
+    MERGE_FUNCTION = "merge_function"
+
+
+# messages exchanged with the worker processes
+MSG_EVENTS = "events"
+MSG_GET = "get"
+MSG_CALL = "call"
+MSG_STOP = "stop"
+# replies of the worker processes
+MSG_RESULT = "result"
+MSG_ERROR = "error"
+
+# seconds after which the sharded algorithm, waiting for a reply, checks that the worker process is alive
+LIVENESS_CHECK_INTERVAL = 1.0
+
+
+def merge_results(results):
+    """
+    Merges the results of the shards. Since every case is handled by exactly one shard:
+    - the dataframes are concatenated
+    - the dictionaries of counts (e.g., the DFG) are summed, the other dictionaries are united
+    - the lists are concatenated
+    - the tuples are merged position by position
+
+    Parameters
+    --------------
+    results
+        List of results (one for each shard)
+
+    Returns
+    --------------
+    result
+        Merged result
+    """
+    results = [r for r in results if r is not None]
+    if not results:
+        return None
+    first = results[0]
+    if isinstance(first, tuple):
+        return tuple(merge_results([r[i] for r in results]) for i in range(len(first)))
+    if isinstance(first, dict):
+        if all(isinstance(v, int) for r in results for v in r.values()):
+            ret = Counter()
+            for r in results:
+                ret.update(r)
+            return dict(ret)
+        ret = {}
+        for r in results:
+            ret.update(r)
+        return ret
+    if isinstance(first, list):
+        return [x for r in results for x in r]
+    import pandas as pd
+    if isinstance(first, pd.DataFrame):
+        return pd.concat(results, ignore_index=True)
+    raise Exception("unsupported result type: " + str(type(first)))
+
+
+def _reply(outbox, function, *args):
+    """
+    Sends back to the sharded algorithm the value returned by a function, or the error raised by the function
+    (so the sharded algorithm does not wait for a reply that never comes)
+    """
+    try:
+        outbox.put((MSG_RESULT, pickle.dumps(function(*args), protocol=pickle.HIGHEST_PROTOCOL)))
+    except:
+        outbox.put((MSG_ERROR, traceback.format_exc()))
+
+
+def _shard_worker(factory, inbox, outbox):
+    """
+    Loop executed by a worker process: it hosts an instance of the streaming algorithm, and processes the
+    messages received from the sharded algorithm
+
+    Parameters
+    --------------
+    factory
+        Callable (without arguments) returning the streaming algorithm
+    inbox
+        Queue of the incoming messages
+    outbox
+        Queue of the results
+    """
+    try:
+        algo = factory()
+    except:
+        # the error is the reply to the first request of the sharded algorithm
+        outbox.put((MSG_ERROR, traceback.format_exc()))
+        return
+    while True:
+        message = inbox.get()
+        if message[0] == MSG_EVENTS:
+            algo.receive_batch(message[1])
+        elif message[0] == MSG_GET:
+            _reply(outbox, algo.get)
+        elif message[0] == MSG_CALL:
+            _reply(outbox, getattr(algo, message[1]), *message[2])
+        else:
+            return
+
+
+class ShardedStreamingAlgorithm(StreamingAlgorithm):
+    def __init__(self, factory, parameters=None):
+        """
+        Executes a streaming algorithm on several processes (shards). The events are hash-partitioned by case
+        identifier, so every case is handled by a single shard (that hosts its own instance of the algorithm).
+        The object can be registered as observer of a live event stream.
+
+        Parameters
+        --------------
+        factory
+            Callable (without arguments) returning the streaming algorithm, e.g.,
+            functools.partial(tbr_algorithm.apply, net, im, fm)
+        parameters
+            Parameters, including:
+            - Parameters.NUM_SHARDS => number of worker processes (default: number of CPUs)
+            - Parameters.CASE_ID_KEY => the attribute to use as case identifier
+            - Parameters.CHUNK_SIZE => number of events of a shard sent together to the worker (default: 100)
+            - Parameters.MERGE_FUNCTION => function merging the list of results of the shards (default:
+            merge_results)
+        """
+        if parameters is None:
+            parameters = {}
+        self.num_shards = exec_utils.get_param_value(Parameters.NUM_SHARDS, parameters, multiprocessing.cpu_count())
+        self.case_id_key = exec_utils.get_param_value(Parameters.CASE_ID_KEY, parameters, constants.CASE_CONCEPT_NAME)
+        self.chunk_size = exec_utils.get_param_value(Parameters.CHUNK_SIZE, parameters, 100)
+        self.merge_function = exec_utils.get_param_value(Parameters.MERGE_FUNCTION, parameters, merge_results)
+        self.buffers = [[] for i in range(self.num_shards)]
+        self.inboxes = [multiprocessing.Queue() for i in range(self.num_shards)]
+        self.outboxes = [multiprocessing.Queue() for i in range(self.num_shards)]
+        self.workers = [multiprocessing.Process(target=_shard_worker, args=(factory, self.inboxes[i], self.outboxes[i]),
+                                                daemon=True) for i in range(self.num_shards)]
+        for worker in self.workers:
+            worker.start()
+        StreamingAlgorithm.__init__(self)
+
+    def get_shard(self, event):
+        """
+        Gets the shard of an event (stable hash of the case identifier)
+        """
+        case = event[self.case_id_key] if self.case_id_key in event else None
+        return zlib.crc32(str(case).encode("utf-8")) % self.num_shards
+
+    def flush(self, shard):
+        if self.buffers[shard]:
+            self.inboxes[shard].put((MSG_EVENTS, self.buffers[shard]))
+            self.buffers[shard] = []
+
+    def _process(self, event):
+        shard = self.get_shard(event)
+        self.buffers[shard].append(event)
+        if len(self.buffers[shard]) >= self.chunk_size:
+            self.flush(shard)
+
+    def _process_batch(self, events):
+        for event in events:
+            self.buffers[self.get_shard(event)].append(event)
+        for shard in range(self.num_shards):
+            if len(self.buffers[shard]) >= self.chunk_size:
+                self.flush(shard)
+
+    def _current_result(self):
+        """
+        Gets the merged result of the shards (after all the received events have been processed)
+        """
+        for shard in range(self.num_shards):
+            self.flush(shard)
+            self.inboxes[shard].put((MSG_GET,))
+        return self.merge_function(self.receive_replies())
+
+    def receive_reply(self, shard):
+        """
+        Waits for the reply of a shard, checking periodically that its worker process is alive
+        """
+        while True:
+            try:
+                return self.outboxes[shard].get(timeout=LIVENESS_CHECK_INTERVAL)
+            except queue.Empty:
+                if not self.workers[shard].is_alive():
+                    try:
+                        # reply sent just before the termination of the worker
+                        return self.outboxes[shard].get(timeout=LIVENESS_CHECK_INTERVAL)
+                    except queue.Empty:
+                        return MSG_ERROR, "the worker process terminated (exit code: " + str(
+                            self.workers[shard].exitcode) + ")"
+
+    def receive_replies(self):
+        """
+        Receives the replies of all the shards. If a shard failed, an exception is raised after receiving all the
+        replies (so they are not mixed up with the replies to the next requests)
+        """
+        replies = [self.receive_reply(shard) for shard in range(self.num_shards)]
+        for shard, (status, value) in enumerate(replies):
+            if status == MSG_ERROR:
+                raise Exception("the shard " + str(shard) + " failed:\n" + value)
+        return [pickle.loads(value) for status, value in replies]
+
+    def call(self, method, *args):
+        """
+        Calls a method of the algorithm on every shard (e.g., terminate_all on the token-based replay),
+        after all the received events have been processed
+
+        Parameters
+        --------------
+        method
+            Name of the method
+        args
+            Arguments of the method
+
+        Returns
+        --------------
+        results
+            List of the values returned by the shards (an exception is raised if the method failed on a shard)
+        """
+        self._lock.acquire()
+        try:
+            for shard in range(self.num_shards):
+                self.flush(shard)
+                self.inboxes[shard].put((MSG_CALL, method, args))
+            ret = self.receive_replies()
+        finally:
+            self._lock.release()
+        return ret
+
+    def close(self):
+        """
+        Stops the worker processes (the pending events are processed before)
+        """
+        self._lock.acquire()
+        for shard in range(self.num_shards):
+            self.flush(shard)
+            self.inboxes[shard].put((MSG_STOP,))
+        for worker in self.workers:
+            worker.join()
+        self._lock.release()
+
+
+def apply(factory, parameters=None):
+    """
+    Creates a sharded streaming algorithm, executing the algorithm returned by the factory on several processes
+
+    Parameters
+    --------------
+    factory
+        Callable (without arguments) returning the streaming algorithm
+    parameters
+        Parameters of the sharded algorithm
+
+    Returns
+    --------------
+    sharded_algo
+        Sharded streaming algorithm
+    """
+    return ShardedStreamingAlgorithm(factory, parameters=parameters)
@@ -16,7 +16,8 @@
 '''
 import collections
 import threading
-from concurrent.futures import ThreadPoolExecutor
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
 from enum import Enum
 from pm4py.util import exec_utils
 
@@ -27,13 +28,50 @@ class StreamState(Enum):
     FINISHED = 3
 
 
+class DeliveryMode(Enum):
+    # each event is delivered to each observer in a separate task
+    EVENT = "event"
+    # the events are delivered in batches (StreamingAlgorithm.receive_batch); at most one batch per observer is
+    # in delivery at any time
+    BATCH = "batch"
+
+
+class BackpressurePolicy(Enum):
+    # append waits until there is room in the queue
+    BLOCK = "block"
+    # the events that do not fit in the queue are discarded
+    DROP = "drop"
+
+
 class Parameters(Enum):
     THREAD_POOL_SIZE = "thread_pool_size"
+    DELIVERY_MODE = "delivery_mode"
+    MAX_QUEUE_SIZE = "max_queue_size"
+    BACKPRESSURE_POLICY = "backpressure_policy"
+    BATCH_SIZE = "batch_size"
+    LINGER_TIME = "linger_time"
 
 
 class LiveEventStream:
 
     def __init__(self, parameters=None):
+        """
+        Initialize the live event stream
+
+        Parameters
+        --------------
+        parameters
+            Parameters of the stream, including:
+            - Parameters.THREAD_POOL_SIZE => number of threads delivering the events to the observers (default: 6)
+            - Parameters.DELIVERY_MODE => DeliveryMode.EVENT (default) or DeliveryMode.BATCH
+            The following parameters are considered in the DeliveryMode.BATCH mode:
+            - Parameters.MAX_QUEUE_SIZE => maximum number of events waiting for delivery (default: 0, unbounded)
+            - Parameters.BACKPRESSURE_POLICY => behavior when the queue is full: BackpressurePolicy.BLOCK (default)
+            or BackpressurePolicy.DROP
+            - Parameters.BATCH_SIZE => maximum number of events delivered in a batch (default: 100)
+            - Parameters.LINGER_TIME => maximum time (in seconds) waiting for a batch (or the bounded queue) to fill
+            before delivering it (default: 0, the available events are delivered immediately)
+        """
         self._dq = collections.deque()
         self._state = StreamState.INACTIVE
         self._lock = threading.Lock()
@@ -41,14 +79,43 @@ class LiveEventStream:
         self._observers = set()
         self._mail_man = None
         self._tp = ThreadPoolExecutor(exec_utils.get_param_value(Parameters.THREAD_POOL_SIZE, parameters, 6))
+        # the modes and the policies can be provided also as strings ("batch", "drop", ...)
+        self._delivery_mode = DeliveryMode(
+            exec_utils.get_param_value(Parameters.DELIVERY_MODE, parameters, DeliveryMode.EVENT))
+        self._max_queue_size = exec_utils.get_param_value(Parameters.MAX_QUEUE_SIZE, parameters, 0)
+        self._backpressure_policy = BackpressurePolicy(
+            exec_utils.get_param_value(Parameters.BACKPRESSURE_POLICY, parameters, BackpressurePolicy.BLOCK))
+        self._batch_size = exec_utils.get_param_value(Parameters.BATCH_SIZE, parameters, 100)
+        self._linger_time = exec_utils.get_param_value(Parameters.LINGER_TIME, parameters, 0)
+        self._in_delivery = False
+        self._dropped = 0
 
     def append(self, event):
+        if self._delivery_mode == DeliveryMode.BATCH:
+            self._append_bounded(event)
+            return
         self._cond.acquire()
         if self._state != StreamState.FINISHED:
             self._dq.append(event)
             self._cond.notify()
         self._cond.release()
 
+    def _append_bounded(self, event):
+        self._cond.acquire()
+        if self._max_queue_size > 0:
+            if self._backpressure_policy == BackpressurePolicy.DROP:
+                if len(self._dq) >= self._max_queue_size:
+                    self._dropped += 1
+                    self._cond.release()
+                    return
+            else:
+                while len(self._dq) >= self._max_queue_size and self._state != StreamState.FINISHED:
+                    self._cond.wait()
+        if self._state != StreamState.FINISHED:
+            self._dq.append(event)
+            self._cond.notify_all()
+        self._cond.release()
+
     def _deliver(self):
         while self._state != StreamState.INACTIVE:
             self._cond.acquire()
@@ -64,21 +131,58 @@ class LiveEventStream:
                 self._tp.submit(algo.receive, event)
             self._cond.release()
 
+    def _is_batch_ready(self):
+        # the batch is full, or cannot grow anymore since the (bounded) queue is full
+        return len(self._dq) >= self._batch_size or 0 < self._max_queue_size <= len(self._dq)
+
+    def _deliver_batches(self):
+        while True:
+            self._cond.acquire()
+            while len(self._dq) == 0:
+                if self._state == StreamState.FINISHED:
+                    self._cond.release()
+                    return
+                self._cond.wait()
+            if not self._is_batch_ready() and self._linger_time > 0:
+                # waits (at most the linger time) for the batch to fill
+                deadline = time.monotonic() + self._linger_time
+                while not self._is_batch_ready() and self._state != StreamState.FINISHED:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._cond.wait(remaining)
+            batch = [self._dq.popleft() for i in range(min(self._batch_size, len(self._dq)))]
+            observers = list(self._observers)
+            self._in_delivery = True
+            # there is room again in the queue
+            self._cond.notify_all()
+            self._cond.release()
+            # the batch is delivered without holding the lock; the next batch is taken only after the observers have
+            # processed the current one, so the pool never contains more than a batch per observer
+            wait([self._tp.submit(algo.receive_batch, batch) for algo in observers])
+            self._cond.acquire()
+            self._in_delivery = False
+            self._cond.notify_all()
+            self._cond.release()
+
     def start(self):
         self._cond.acquire()
         self._state = StreamState.ACTIVE
-        self._mail_man = threading.Thread(target=self._deliver)
+        if self._delivery_mode == DeliveryMode.BATCH:
+            self._mail_man = threading.Thread(target=self._deliver_batches)
+        else:
+            self._mail_man = threading.Thread(target=self._deliver)
         self._mail_man.start()
         self._cond.release()
 
     def stop(self):
         self._cond.acquire()
-        while len(self._dq) > 0:
+        while len(self._dq) > 0 or self._in_delivery:
             self._cond.wait()
         self._tp.shutdown()
         if self._state == StreamState.ACTIVE:
             self._state = StreamState.FINISHED
-            self._cond.notify()
+            self._cond.notify_all()
         self._cond.release()
 
     def register(self, algo):
@@ -94,6 +198,11 @@ class LiveEventStream:
     def _get_state(self):
         return self._state
 
+    def _get_dropped(self):
+        return self._dropped
+
     state = property(_get_state)
+    # number of events discarded by the BackpressurePolicy.DROP policy
+    dropped = property(_get_dropped)
 
 
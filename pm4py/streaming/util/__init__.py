@@ -14,4 +14,4 @@
     You should have received a copy of the GNU General Public License
     along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
 '''
-from pm4py.streaming.util import dictio, event_stream_printer, trace_stream_printer
+from pm4py.streaming.util import dictio, event_stream_printer, trace_stream_printer, case_eviction
@@ -0,0 +1,109 @@
+'''
+    This file is part of PM4Py (More Info: https://pm4py.fit.fraunhofer.de).
+
+    PM4Py is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    PM4Py is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
+'''
+import time
+import traceback
+from collections import OrderedDict
+from enum import Enum
+
+from pm4py.util import exec_utils
+
+
+class Parameters(Enum):
+    CASE_TTL = "case_ttl"
+    MAX_OPEN_CASES = "max_open_cases"
+    EVICTION_CALLBACK = "eviction_callback"
+
+
+class CaseEviction(object):
+    def __init__(self, parameters=None):
+        """
+        Keeps track of the open cases of a streaming algorithm (in least-recently-updated order), deciding
+        which cases should be evicted to keep the memory bounded. The tracking is done in memory, independently
+        from the dictionaries (classic, thread-safe, Redis) storing the state of the cases.
+
+        Parameters
+        --------------
+        parameters
+            Parameters, including:
+            - Parameters.CASE_TTL => idle time (in seconds) after which a case is evicted (default: None, never)
+            - Parameters.MAX_OPEN_CASES => maximum number of open cases; when exceeded, the least recently updated
+            case is evicted (default: None, unbounded)
+            - Parameters.EVICTION_CALLBACK => function called as callback(case, diagnostics) when a case is evicted,
+            with the final diagnostics of the case (default: None)
+        """
+        if parameters is None:
+            parameters = {}
+        self.case_ttl = exec_utils.get_param_value(Parameters.CASE_TTL, parameters, None)
+        self.max_open_cases = exec_utils.get_param_value(Parameters.MAX_OPEN_CASES, parameters, None)
+        self.eviction_callback = exec_utils.get_param_value(Parameters.EVICTION_CALLBACK, parameters, None)
+        self.enabled = self.case_ttl is not None or self.max_open_cases is not None
+        # case -> time of the last update
+        self.last_update = OrderedDict()
+
+    def touch(self, case, terminate):
+        """
+        Signals an update of a case, and evicts the cases exceeding the maximum number of open cases or the TTL
+
+        Parameters
+        --------------
+        case
+            Case (as stored in the dictionaries of the algorithm)
+        terminate
+            Method of the algorithm terminating a case and returning its final diagnostics
+        """
+        if not self.enabled:
+            return
+        self.last_update[case] = time.time()
+        self.last_update.move_to_end(case)
+        if self.max_open_cases is not None:
+            while len(self.last_update) > self.max_open_cases:
+                self.__evict(next(iter(self.last_update)), terminate)
+        self.evict_expired(terminate)
+
+    def evict_expired(self, terminate):
+        """
+        Evicts the cases that have been idle for more than the TTL
+
+        Parameters
+        --------------
+        terminate
+            Method of the algorithm terminating a case and returning its final diagnostics
+        """
+        if self.case_ttl is None:
+            return
+        threshold = time.time() - self.case_ttl
+        while self.last_update:
+            case = next(iter(self.last_update))
+            if self.last_update[case] > threshold:
+                break
+            self.__evict(case, terminate)
+
+    def remove(self, case):
+        """
+        Stops tracking a case (e.g., terminated explicitly)
+        """
+        if case in self.last_update:
+            del self.last_update[case]
+
+    def __evict(self, case, terminate):
+        del self.last_update[case]
+        diagnostics = terminate(case)
+        if self.eviction_callback is not None:
+            try:
+                self.eviction_callback(case, diagnostics)
+            except:
+                traceback.print_exc()
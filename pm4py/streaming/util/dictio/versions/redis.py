@@ -41,6 +41,13 @@ class ThreadSafeRedisDict(dict):
         super(ThreadSafeRedisDict, self).__setitem__(key, value)
         self.lock.release()
 
+    def __delitem__(self, key):
+        self.lock.acquire()
+        self.redis_connection.delete(key)
+        if super(ThreadSafeRedisDict, self).__contains__(key):
+            super(ThreadSafeRedisDict, self).__delitem__(key)
+        self.lock.release()
+
     def __iter__(self):
         self.lock.acquire()
         ret = iter(list(self.redis_connection.keys()))
@@ -31,6 +31,13 @@ class ThreadSafeDict(dict):
         super(ThreadSafeDict, self).__setitem__(key, value)
         self.lock.release()
 
+    def __delitem__(self, key):
+        self.lock.acquire()
+        try:
+            super(ThreadSafeDict, self).__delitem__(key)
+        finally:
+            self.lock.release()
+
     def __iter__(self):
         self.lock.acquire()
         ret = iter(self.itemlist)
@@ -16,13 +16,129 @@
 '''
 import datetime
 
+import numpy as np
+
+
+def __to_naive_datetime64(values):
+    """
+    Transforms the provided timestamps (datetime objects, pandas Series/DatetimeIndex, NumPy arrays)
+    into a NumPy datetime64 array expressed in the local (wall clock) time
+    """
+    if isinstance(values, datetime.datetime):
+        values = [values]
+    if isinstance(values, (list, tuple)) and all(isinstance(x, datetime.datetime) for x in values):
+        # fast path (no pandas) for datetime objects
+        return np.array([np.datetime64(x.replace(tzinfo=None), "ns") for x in values], dtype="datetime64[ns]")
+
+    import pandas as pd
+
+    values = pd.to_datetime(values)
+    if isinstance(values, pd.Series):
+        if values.dt.tz is not None:
+            values = values.dt.tz_localize(None)
+    elif values.tz is not None:
+        values = values.tz_localize(None)
+    return np.asarray(values, dtype="datetime64[ns]")
+
+
+def __get_weekmask(weekends):
+    # the weekends are expressed as ISO weekdays (1 = Monday, 7 = Sunday)
+    return [0 if (i + 1) in weekends else 1 for i in range(7)]
+
+
+def __cumulative_business_seconds(timestamps, reference_day, worktiming, weekmask, holidays):
+    """
+    Computes, for each timestamp, the amount of business seconds elapsed from the reference day
+    """
+    days = timestamps.astype("datetime64[D]")
+    time_of_day = (timestamps - days) / np.timedelta64(1, "s")
+    day_seconds = (worktiming[1] - worktiming[0]) * 3600
+    full_days = np.busday_count(reference_day, days, weekmask=weekmask, holidays=holidays)
+    is_business_day = np.is_busday(days, weekmask=weekmask, holidays=holidays)
+    return full_days * day_seconds + is_business_day * np.clip(time_of_day - worktiming[0] * 3600, 0, day_seconds)
+
+
+def get_business_seconds(start_timestamps, end_timestamps, worktiming=[7, 17], weekends=[6, 7], holidays=None):
+    """
+    Computes (in a vectorized way) the business seconds elapsed between the start and the end timestamps,
+    i.e., the length of the intersection of the interval with the working hours of the working days.
+    The computation is done in closed form (it does not depend on the length of the interval).
+
+    Parameters
+    ---------------
+    start_timestamps
+        Start timestamps (datetime, list of datetimes, pandas Series or NumPy datetime64 array)
+    end_timestamps
+        End timestamps (same length of the start timestamps)
+    worktiming
+        Opening and closing hour of the working days
+    weekends
+        Non-working days of the week (ISO weekdays: 6 = Saturday, 7 = Sunday)
+    holidays
+        (if provided) list of non-working dates
+
+    Returns
+    ---------------
+    seconds
+        NumPy array containing the business seconds of each interval (0 if the end precedes the start)
+    """
+    start_timestamps = __to_naive_datetime64(start_timestamps)
+    end_timestamps = __to_naive_datetime64(end_timestamps)
+    weekmask = __get_weekmask(weekends)
+    holidays = np.asarray([] if holidays is None else holidays, dtype="datetime64[D]")
+
+    if len(start_timestamps) == 0:
+        return np.zeros(0)
+
+    reference_day = min(start_timestamps.min(), end_timestamps.min()).astype("datetime64[D]")
+    start_cum = __cumulative_business_seconds(start_timestamps, reference_day, worktiming, weekmask, holidays)
+    end_cum = __cumulative_business_seconds(end_timestamps, reference_day, worktiming, weekmask, holidays)
+
+    return np.maximum(end_cum - start_cum, 0)
+
+
+def _get_business_seconds_scalar(dt_start, dt_end, worktiming, weekends, holidays):
+    """
+    Closed-form computation of the business seconds between two datetimes (avoiding the overhead of NumPy
+    for a single interval)
+    """
+    dt_start = dt_start.replace(tzinfo=None)
+    dt_end = dt_end.replace(tzinfo=None)
+    if dt_end <= dt_start:
+        return 0
+    holidays = set() if holidays is None else {np.datetime64(x, "D").astype(datetime.date) for x in holidays}
+    day_seconds = (worktiming[1] - worktiming[0]) * 3600
+
+    def is_business_day(day):
+        return day.isoweekday() not in weekends and day not in holidays
+
+    def partial_day_seconds(dt):
+        if not is_business_day(dt.date()):
+            return 0
+        time_of_day = dt.hour * 3600 + dt.minute * 60 + dt.second + dt.microsecond / 10 ** 6
+        return min(max(time_of_day - worktiming[0] * 3600, 0), day_seconds)
+
+    start_day = dt_start.date()
+    end_day = dt_end.date()
+    # business days in [start_day, end_day)
+    no_days = (end_day - start_day).days
+    workdays_per_week = len([i for i in range(1, 8) if i not in weekends])
+    full_days = (no_days // 7) * workdays_per_week
+    for i in range(no_days % 7):
+        if (start_day + datetime.timedelta(days=i)).isoweekday() not in weekends:
+            full_days += 1
+    full_days -= len([x for x in holidays if start_day <= x < end_day and x.isoweekday() not in weekends])
+
+    return full_days * day_seconds + partial_day_seconds(dt_end) - partial_day_seconds(dt_start)
+
 
 class BusinessHours:
 
     def __init__(self, datetime1, datetime2, worktiming=[7, 17],
-                 weekends=[6, 7]):
+                 weekends=[6, 7], holidays=None):
         self.weekends = weekends
         self.worktiming = worktiming
+        self.holidays = holidays
         self.datetime1 = datetime1
         self.datetime2 = datetime2
         self.day_hours = (self.worktiming[1] - self.worktiming[0])
@@ -41,92 +157,8 @@ class BusinessHours:
         """
         Return the difference in minutes.
         """
-        # Set initial default variables
-        dt_start = self.datetime1  # datetime of start
-        dt_end = self.datetime2  # datetime of end
-        worktime_in_seconds = 0
-
-        if dt_start.date() == dt_end.date():
-            # starts and ends on same workday
-            full_days = 0
-            if self.is_weekend(dt_start):
-                return 0
-            else:
-                if dt_start.hour < self.worktiming[0]:
-                    # set start time to opening hour
-                    dt_start = datetime.datetime(
-                        year=dt_start.year,
-                        month=dt_start.month,
-                        day=dt_start.day,
-                        hour=self.worktiming[0],
-                        minute=0)
-                if dt_start.hour >= self.worktiming[1] or \
-                        dt_end.hour < self.worktiming[0]:
-                    return 0
-                if dt_end.hour >= self.worktiming[1]:
-                    dt_end = datetime.datetime(
-                        year=dt_end.year,
-                        month=dt_end.month,
-                        day=dt_end.day,
-                        hour=self.worktiming[1],
-                        minute=0)
-                worktime_in_seconds = (dt_end - dt_start).total_seconds()
-        elif (dt_end - dt_start).days < 0:
-            # ends before start
-            return 0
-        else:
-            # start and ends on different days
-            current_day = dt_start  # marker for counting workdays
-            while not current_day.date() == dt_end.date():
-                if not self.is_weekend(current_day):
-                    if current_day == dt_start:
-                        # increment hours of first day
-                        if current_day.hour < self.worktiming[0]:
-                            # starts before the work day
-                            worktime_in_seconds += self.day_minutes * 60  # add 1 full work day
-                        elif current_day.hour >= self.worktiming[1]:
-                            pass  # no time on first day
-                        else:
-                            # starts during the working day
-                            if self.worktiming[1] < 24:
-                                # if we have a target that is below 24:00:00 (the next day)
-                                # we can use the existing code
-                                dt_currentday_close = datetime.datetime(
-                                    year=dt_start.year,
-                                    month=dt_start.month,
-                                    day=dt_start.day,
-                                    hour=self.worktiming[1],
-                                    minute=0)
-                            else:
-                                # otherwise, make the stop date as 23:59:59
-                                dt_currentday_close = datetime.datetime(
-                                    year=dt_start.year,
-                                    month=dt_start.month,
-                                    day=dt_start.day,
-                                    hour=23,
-                                    minute=59, second=59)
-                            worktime_in_seconds += (dt_currentday_close
-                                                    - dt_start).total_seconds()
-                    else:
-                        # increment one full day
-                        worktime_in_seconds += self.day_minutes * 60
-                current_day += datetime.timedelta(days=1)  # next day
-            # Time on the last day
-            if not self.is_weekend(dt_end):
-                if dt_end.hour >= self.worktiming[1]:  # finish after close
-                    # Add a full day
-                    worktime_in_seconds += self.day_minutes * 60
-                elif dt_end.hour < self.worktiming[0]:  # close before opening
-                    pass  # no time added
-                else:
-                    # Add time since opening
-                    dt_end_open = datetime.datetime(
-                        year=dt_end.year,
-                        month=dt_end.month,
-                        day=dt_end.day,
-                        hour=self.worktiming[0],
-                        minute=0)
-                    worktime_in_seconds += (dt_end - dt_end_open).total_seconds()
+        worktime_in_seconds = _get_business_seconds_scalar(self.datetime1, self.datetime2, self.worktiming,
+                                                            self.weekends, self.holidays)
         return int(worktime_in_seconds / 60)
 
     def is_weekend(self, datetime):
@@ -136,4 +168,4 @@ class BusinessHours:
         for weekend in self.weekends:
             if datetime.isoweekday() == weekend:
                 return True
-        return False
\ No newline at end of file
+        return False
@@ -16,6 +16,8 @@
 '''
 from enum import Enum
 
+from pm4py.util import instrumentation
+
 
 def unroll(value):
     if isinstance(value, Enum):
@@ -41,6 +43,26 @@ def get_param_value(p, parameters, default):
 
 
 def get_variant(variant):
+    """
+    Gets the variant (module or function) of an algorithm from the value of the enum
+
+    While the instrumentation is enabled (see pm4py.util.instrumentation), the calls to the variant are timed:
+    a proxy of the variant is returned, that is equal (==, and with the same hash) to the variant but is not the
+    same object. Hence, the variants should be compared by equality (or by their enum), not by identity.
+
+    Parameters
+    --------------
+    variant
+        Variant (or enum whose value is the variant)
+
+    Returns
+    --------------
+    variant
+        Variant (or its instrumented proxy)
+    """
     if isinstance(variant, Enum):
-        return variant.value
+        variant = variant.value
+    if instrumentation.is_enabled():
+        # the calls to the functions of the variant are timed
+        return instrumentation.instrument_variant(variant)
     return variant
@@ -0,0 +1,222 @@
+'''
+    This file is part of PM4Py (More Info: https://pm4py.fit.fraunhofer.de).
+
+    PM4Py is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    PM4Py is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
+'''
+import functools
+import time
+from collections import namedtuple
+from contextlib import contextmanager
+from types import FunctionType
+
+TIMER = "timer"
+COUNTER = "counter"
+
+# kind: TIMER or COUNTER; name: name of the measure; value: seconds (timers) or count (counters);
+# tags: dictionary of further information (e.g. the case identifier)
+InstrumentationEvent = namedtuple("InstrumentationEvent", ["kind", "name", "value", "tags"])
+
+# the instrumentation is enabled when at least one callback is registered
+_callbacks = []
+
+
+def register_callback(callback):
+    """
+    Registers a callback, that is invoked with an InstrumentationEvent for each timer/counter emitted
+    by the algorithms (this enables the instrumentation)
+
+    Parameters
+    --------------
+    callback
+        Function accepting an InstrumentationEvent
+    """
+    _callbacks.append(callback)
+
+
+def unregister_callback(callback):
+    """
+    Unregisters a previously registered callback
+
+    Parameters
+    --------------
+    callback
+        Callback
+    """
+    if callback in _callbacks:
+        _callbacks.remove(callback)
+
+
+def is_enabled():
+    """
+    Checks if the instrumentation is enabled (i.e. at least a callback is registered)
+    """
+    return len(_callbacks) > 0
+
+
+def emit(kind, name, value, **tags):
+    """
+    Emits a timer/counter to the registered callbacks
+
+    Parameters
+    --------------
+    kind
+        TIMER or COUNTER
+    name
+        Name of the measure
+    value
+        Value of the measure
+    tags
+        Further information about the measure
+    """
+    event = InstrumentationEvent(kind, name, value, tags)
+    for callback in list(_callbacks):
+        callback(event)
+
+
+def emit_timer(name, seconds, **tags):
+    emit(TIMER, name, seconds, **tags)
+
+
+def emit_counter(name, value, **tags):
+    emit(COUNTER, name, value, **tags)
+
+
+@contextmanager
+def timer(name, **tags):
+    """
+    Context manager that emits the execution time of the enclosed block (if the instrumentation is enabled)
+    """
+    if not _callbacks:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        emit_timer(name, time.perf_counter() - start, **tags)
+
+
+class Recorder(object):
+    """
+    Callback collecting the emitted events, with some aggregation utilities
+    """
+
+    def __init__(self):
+        self.events = []
+
+    def __call__(self, event):
+        self.events.append(event)
+
+    def get_timers(self):
+        """
+        Gets the list of the measured durations for each timer
+        """
+        timers = {}
+        for event in self.events:
+            if event.kind == TIMER:
+                timers.setdefault(event.name, []).append(event.value)
+        return timers
+
+    def get_counters(self):
+        """
+        Gets the total value of each counter
+        """
+        counters = {}
+        for event in self.events:
+            if event.kind == COUNTER:
+                counters[event.name] = counters.get(event.name, 0) + event.value
+        return counters
+
+
+@contextmanager
+def instrument(callback=None):
+    """
+    Context manager enabling the instrumentation for the enclosed block
+
+    Parameters
+    --------------
+    callback
+        (Optional) callback to register; if not provided, a Recorder is used
+
+    Returns
+    --------------
+    callback
+        The registered callback (the Recorder, if no callback was provided)
+
+    Example
+    --------------
+    with instrumentation.instrument() as recorder:
+        alignments = alignments_algorithm.apply(log, net, im, fm)
+    print(recorder.get_timers(), recorder.get_counters())
+    """
+    if callback is None:
+        callback = Recorder()
+    register_callback(callback)
+    try:
+        yield callback
+    finally:
+        unregister_callback(callback)
+
+
+class InstrumentedVariant(object):
+    """
+    Proxy of a variant (module) of an algorithm, that emits a timer for each call to its functions
+    (named after the module and the function, e.g. 'pm4py.algo.discovery.alpha.variants.classic.apply').
+    When the variant is a function, the calls to the proxy are timed.
+
+    The proxy is equal (and has the same hash) to the variant, but it is not the same object.
+    """
+
+    def __init__(self, variant):
+        self.__variant = variant
+
+    def __getattr__(self, item):
+        value = getattr(self.__variant, item)
+        if isinstance(value, FunctionType):
+            return _timed_function(value, self.__variant.__name__ + "." + item)
+        return value
+
+    def __call__(self, *args, **kwargs):
+        with timer(self.__variant.__module__ + "." + self.__variant.__name__):
+            return self.__variant(*args, **kwargs)
+
+    def __eq__(self, other):
+        if isinstance(other, InstrumentedVariant):
+            other = other.__variant
+        return self.__variant == other
+
+    def __hash__(self):
+        return hash(self.__variant)
+
+    def __repr__(self):
+        return repr(self.__variant)
+
+
+def _timed_function(function, name):
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        with timer(name):
+            return function(*args, **kwargs)
+
+    return wrapper
+
+
+def instrument_variant(variant):
+    """
+    Wraps the variant of an algorithm in order to time the calls to its functions (or, when the variant is a
+    function, the calls to the variant itself)
+    """
+    if isinstance(variant, InstrumentedVariant):
+        return variant
+    return InstrumentedVariant(variant)
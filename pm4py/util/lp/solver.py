@@ -17,6 +17,8 @@
 import pkgutil
 import os
 
+from pm4py.util.lp.parameters import Parameters
+
 # not available in the latest version of PM4Py
 CVXOPT = "cvxopt"
 PULP = "pulp"
@@ -24,6 +26,7 @@ PULP = "pulp"
 CVXOPT_SOLVER_CUSTOM_ALIGN = "cvxopt_solver_custom_align"
 CVXOPT_SOLVER_CUSTOM_ALIGN_ILP = "cvxopt_solver_custom_align_ilp"
 ORTOOLS_SOLVER = "ortools_solver"
+SCIPY = "scipy"
 
 # max allowed heuristics value (27/10/2019, due to the numerical instability of some of our solvers)
 MAX_ALLOWED_HEURISTICS = 10 ** 15
@@ -31,6 +34,8 @@ MAX_ALLOWED_HEURISTICS = 10 ** 15
 VERSIONS_APPLY = {}
 VERSIONS_GET_PRIM_OBJ = {}
 VERSIONS_GET_POINTS_FROM_SOL = {}
+# variants able to keep a problem, changing only the right-hand side of its equality constraints between solves
+VERSIONS_INCREMENTAL = {}
 DEFAULT_LP_SOLVER_VARIANT = None
 
 if pkgutil.find_loader("pulp"):
@@ -40,9 +45,25 @@ if pkgutil.find_loader("pulp"):
     VERSIONS_APPLY[PULP] = pulp_solver.apply
     VERSIONS_GET_PRIM_OBJ[PULP] = pulp_solver.get_prim_obj_from_sol
     VERSIONS_GET_POINTS_FROM_SOL[PULP] = pulp_solver.get_points_from_sol
+    VERSIONS_INCREMENTAL[PULP] = pulp_solver.IncrementalProblem
 
     DEFAULT_LP_SOLVER_VARIANT = PULP
 
+if pkgutil.find_loader("scipy"):
+    # HiGHS (shipped with SciPy) is preferred to the PuLP (CBC) solver, which is called as external process
+    try:
+        # the HiGHS interface (linprog/milp) requires SciPy >= 1.9
+        from pm4py.util.lp.variants import scipy_solver
+
+        VERSIONS_APPLY[SCIPY] = scipy_solver.apply
+        VERSIONS_GET_PRIM_OBJ[SCIPY] = scipy_solver.get_prim_obj_from_sol
+        VERSIONS_GET_POINTS_FROM_SOL[SCIPY] = scipy_solver.get_points_from_sol
+        VERSIONS_INCREMENTAL[SCIPY] = scipy_solver.IncrementalProblem
+
+        DEFAULT_LP_SOLVER_VARIANT = SCIPY
+    except ImportError:
+        pass
+
 if pkgutil.find_loader("ortools"):
     # in the case ortools is installed, it works
     from pm4py.util.lp.variants import ortools_solver
@@ -50,6 +71,7 @@ if pkgutil.find_loader("ortools"):
     VERSIONS_APPLY[ORTOOLS_SOLVER] = ortools_solver.apply
     VERSIONS_GET_PRIM_OBJ[ORTOOLS_SOLVER] = ortools_solver.get_prim_obj_from_sol
     VERSIONS_GET_POINTS_FROM_SOL[ORTOOLS_SOLVER] = ortools_solver.get_points_from_sol
+    VERSIONS_INCREMENTAL[ORTOOLS_SOLVER] = ortools_solver.IncrementalProblem
 
     DEFAULT_LP_SOLVER_VARIANT = ORTOOLS_SOLVER
 
@@ -105,7 +127,7 @@ def apply(c, Aub, bub, Aeq, beq, parameters=None, variant=DEFAULT_LP_SOLVER_VARI
     parameters
         Possible parameters of the algorithm
     variant
-        Variant of the algorithm, possible values: pulp, ortools
+        Variant of the algorithm, possible values: pulp, scipy, ortools
 
     Returns
     -------------
@@ -115,6 +137,37 @@ def apply(c, Aub, bub, Aeq, beq, parameters=None, variant=DEFAULT_LP_SOLVER_VARI
     return VERSIONS_APPLY[variant](c, Aub, bub, Aeq, beq, parameters=parameters)
 
 
+def build_incremental(c, Aub, bub, Aeq, parameters=None, variant=DEFAULT_LP_SOLVER_VARIANT):
+    """
+    Builds a problem that is solved several times, changing only the right-hand side of the equality
+    constraints (the solution of each solve is read with get_prim_obj_from_sol and get_points_from_sol)
+
+    Parameters
+    ------------
+    c
+        c parameter of the algorithm
+    Aub
+        A_ub parameter of the algorithm
+    bub
+        b_ub parameter of the algorithm
+    Aeq
+        A_eq parameter of the algorithm
+    parameters
+        Possible parameters of the algorithm
+    variant
+        Variant of the algorithm, possible values: pulp, scipy, ortools
+
+    Returns
+    -------------
+    problem
+        Object providing a solve(beq) method returning the solution, or None if the variant
+        does not support incremental solving
+    """
+    if variant not in VERSIONS_INCREMENTAL:
+        return None
+    return VERSIONS_INCREMENTAL[variant](c, Aub, bub, Aeq, parameters=parameters)
+
+
 def get_prim_obj_from_sol(sol, parameters=None, variant=DEFAULT_LP_SOLVER_VARIANT):
     """
     Gets the primal objective from the solution of the LP problem
@@ -126,7 +179,7 @@ def get_prim_obj_from_sol(sol, parameters=None, variant=DEFAULT_LP_SOLVER_VARIAN
     parameters
         Possible parameters of the algorithm
     variant
-        Variant of the algorithm, possible values: pulp, ortools
+        Variant of the algorithm, possible values: pulp, scipy, ortools
 
     Returns
     -------------
@@ -147,7 +200,7 @@ def get_points_from_sol(sol, parameters=None, variant=DEFAULT_LP_SOLVER_VARIANT)
     parameters
         Possible parameters of the algorithm
     variant
-        Variant of the algorithm, possible values: pulp, ortools
+        Variant of the algorithm, possible values: pulp, scipy, ortools
 
     Returns
     -------------
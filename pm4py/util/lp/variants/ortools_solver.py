@@ -114,6 +114,90 @@ def apply(c, Aub, bub, Aeq, beq, parameters=None):
     return {"c": c, "x_list": x_list, "sol_value": sol_value, "points": points}
 
 
+class IncrementalProblem(object):
+    def __init__(self, c, Aub, bub, Aeq, parameters=None):
+        """
+        Builds (once) a problem whose equality constraints have a variable right-hand side,
+        which is provided to each call of the solve method. The solver keeps the basis of the last solution,
+        so every solve is warm-started from the previous one
+
+        Parameters
+        ------------
+        c
+            c parameter of the algorithm
+        Aub
+            A_ub parameter of the algorithm
+        bub
+            b_ub parameter of the algorithm
+        Aeq
+            A_eq parameter of the algorithm
+        parameters
+            Possible parameters of the algorithm
+        """
+        if parameters is None:
+            parameters = {}
+
+        require_ilp = exec_utils.get_param_value(Parameters.REQUIRE_ILP, parameters, False)
+
+        Aub = np.asarray(Aub, dtype=np.float64)
+        Aeq = np.asarray(Aeq, dtype=np.float64)
+        self.c = c
+        self.solver = pywraplp.Solver('LinearProgrammingExample',
+                                      pywraplp.Solver.GLOP_LINEAR_PROGRAMMING)
+        self.solver.SuppressOutput()
+        inf = self.solver.infinity()
+        if require_ilp:
+            self.x_list = [self.solver.IntVar(-inf, inf, "x_" + str(i)) for i in range(Aub.shape[1])]
+        else:
+            self.x_list = [self.solver.NumVar(-inf, inf, "x_" + str(i)) for i in range(Aub.shape[1])]
+        objective = self.solver.Objective()
+        for j in range(len(c)):
+            if abs(c[j]) > MIN_THRESHOLD:
+                objective.SetCoefficient(self.x_list[j], c[j])
+        objective.SetMinimization()
+        for i in range(Aub.shape[0]):
+            columns = np.flatnonzero(np.abs(Aub[i]) > MIN_THRESHOLD)
+            if len(columns) > 0:
+                constraint = self.solver.Constraint(-inf, float(bub[i]))
+                for j in columns:
+                    constraint.SetCoefficient(self.x_list[j], Aub[i, j])
+        # index of the right-hand side -> constraint
+        self.eq_constraints = []
+        for i in range(Aeq.shape[0]):
+            columns = np.flatnonzero(np.abs(Aeq[i]) > MIN_THRESHOLD)
+            if len(columns) > 0:
+                constraint = self.solver.Constraint(0.0, 0.0)
+                for j in columns:
+                    constraint.SetCoefficient(self.x_list[j], Aeq[i, j])
+                self.eq_constraints.append((i, constraint))
+
+    def solve(self, beq):
+        """
+        Solves the problem with the provided right-hand side of the equality constraints
+
+        Parameters
+        ------------
+        beq
+            b_eq parameter of the algorithm
+
+        Returns
+        -------------
+        sol
+            Solution of the LP problem
+        """
+        for i, constraint in self.eq_constraints:
+            constraint.SetBounds(float(beq[i]), float(beq[i]))
+        status = self.solver.Solve()
+        if status != 0:
+            return None
+        points = [x.solution_value() for x in self.x_list]
+        sol_value = 0.0
+        for j in range(len(self.c)):
+            if abs(self.c[j]) > MIN_THRESHOLD:
+                sol_value = sol_value + self.c[j] * points[j]
+        return {"c": self.c, "x_list": self.x_list, "sol_value": sol_value, "points": points}
+
+
 def get_prim_obj_from_sol(sol, parameters=None):
     """
     Gets the primal objective from the solution of the LP problem
@@ -19,7 +19,8 @@ import tempfile
 
 import numpy as np
 import pulp
-from pulp import LpProblem, LpMinimize, LpVariable, LpStatus, value
+from pulp import LpProblem, LpMinimize, LpVariable, LpStatus, value, LpAffineExpression, LpConstraint, \
+    LpConstraintEQ, LpConstraintLE
 
 from pm4py.util import exec_utils
 from pm4py.util.lp.parameters import Parameters
@@ -150,6 +151,73 @@ def apply(c, Aub, bub, Aeq, beq, parameters=None):
     return prob
 
 
+class IncrementalProblem(object):
+    def __init__(self, c, Aub, bub, Aeq, parameters=None):
+        """
+        Builds (once) a problem whose equality constraints have a variable right-hand side,
+        which is provided to each call of the solve method
+
+        Parameters
+        ------------
+        c
+            c parameter of the algorithm
+        Aub
+            A_ub parameter of the algorithm
+        bub
+            b_ub parameter of the algorithm
+        Aeq
+            A_eq parameter of the algorithm
+        parameters
+            Possible parameters of the algorithm
+        """
+        if parameters is None:
+            parameters = {}
+
+        require_ilp = exec_utils.get_param_value(Parameters.REQUIRE_ILP, parameters, False)
+
+        Aub = np.asarray(Aub, dtype=np.float64)
+        Aeq = np.asarray(Aeq, dtype=np.float64)
+        self.prob = LpProblem("", LpMinimize)
+        x_list = [LpVariable("x_" + get_terminal_part_name_num(i), cat='Integer' if require_ilp else 'Continuous')
+                  for i in range(Aub.shape[1])]
+        self.prob += LpAffineExpression([(x_list[j], float(c[j])) for j in range(len(c)) if abs(c[j]) > MIN_THRESHOLD]), \
+                     "objective"
+        for i in range(Aub.shape[0]):
+            columns = np.flatnonzero(np.abs(Aub[i]) > MIN_THRESHOLD)
+            if len(columns) > 0:
+                self.prob += LpConstraint(LpAffineExpression([(x_list[j], Aub[i, j]) for j in columns]),
+                                          sense=LpConstraintLE, rhs=float(bub[i]),
+                                          name="vinc_" + get_terminal_part_name_num(i))
+        # index of the right-hand side -> name of the constraint
+        self.eq_constraints = []
+        for i in range(Aeq.shape[0]):
+            columns = np.flatnonzero(np.abs(Aeq[i]) > MIN_THRESHOLD)
+            if len(columns) > 0:
+                name = "vinceq_" + get_terminal_part_name_num(i + 1 + Aub.shape[0])
+                self.prob += LpConstraint(LpAffineExpression([(x_list[j], Aeq[i, j]) for j in columns]),
+                                          sense=LpConstraintEQ, rhs=0.0, name=name)
+                self.eq_constraints.append((i, name))
+
+    def solve(self, beq):
+        """
+        Solves the problem with the provided right-hand side of the equality constraints
+
+        Parameters
+        ------------
+        beq
+            b_eq parameter of the algorithm
+
+        Returns
+        -------------
+        sol
+            Solution of the LP problem
+        """
+        for i, name in self.eq_constraints:
+            self.prob.constraints[name].constant = -float(beq[i])
+        solver(self.prob)
+        return self.prob
+
+
 def get_prim_obj_from_sol(sol, parameters=None):
     """
     Gets the primal objective from the solution of the LP problem
@@ -0,0 +1,251 @@
+'''
+    This file is part of PM4Py (More Info: https://pm4py.fit.fraunhofer.de).
+
+    PM4Py is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    PM4Py is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
+'''
+import sys
+
+import numpy as np
+from scipy import sparse
+from scipy.optimize import linprog, milp, LinearConstraint, Bounds
+
+from pm4py.util import exec_utils
+from pm4py.util.lp.parameters import Parameters
+
+MIN_THRESHOLD = 10 ** -12
+
+
+def to_sparse(matrix, num_columns):
+    """
+    Transforms a matrix (NumPy matrix/array, list of lists or SciPy sparse matrix) into a CSR sparse matrix,
+    dropping the (numerically) zero entries
+
+    Parameters
+    ------------
+    matrix
+        Matrix
+    num_columns
+        Number of columns (used when the matrix is empty)
+
+    Returns
+    ------------
+    sparse_matrix
+        CSR sparse matrix
+    """
+    if matrix is None:
+        return sparse.csr_matrix((0, num_columns))
+    if sparse.issparse(matrix):
+        matrix = sparse.csr_matrix(matrix, dtype=np.float64)
+    else:
+        matrix = np.asarray(matrix, dtype=np.float64)
+        if matrix.size == 0:
+            return sparse.csr_matrix((0, num_columns))
+        matrix = sparse.csr_matrix(matrix.reshape((-1, num_columns)))
+    matrix.data[np.abs(matrix.data) <= MIN_THRESHOLD] = 0
+    matrix.eliminate_zeros()
+    return matrix
+
+
+def to_vector(vector):
+    """
+    Transforms a vector (or a column matrix) into a flat NumPy array
+    """
+    if vector is None:
+        return np.zeros(0)
+    return np.asarray(vector, dtype=np.float64).flatten()
+
+
+def split_bounds(Aub, bub):
+    """
+    Moves the inequality constraints involving a single variable (as x >= 0, expressed as -x <= 0) to the bounds of
+    the variables, which the solver handles without adding rows to the problem
+
+    Parameters
+    ------------
+    Aub
+        A_ub parameter of the algorithm (CSR sparse matrix)
+    bub
+        b_ub parameter of the algorithm
+
+    Returns
+    ------------
+    Aub
+        Inequality constraints involving more than one variable
+    bub
+        Right-hand side of the remaining inequality constraints
+    lower
+        Lower bounds of the variables
+    upper
+        Upper bounds of the variables
+    """
+    lower = np.full(Aub.shape[1], -np.inf)
+    upper = np.full(Aub.shape[1], np.inf)
+    row_nnz = np.diff(Aub.indptr)
+    single = np.flatnonzero(row_nnz == 1)
+    for i in single:
+        j = Aub.indices[Aub.indptr[i]]
+        a = Aub.data[Aub.indptr[i]]
+        if a > 0:
+            upper[j] = min(upper[j], bub[i] / a)
+        else:
+            lower[j] = max(lower[j], bub[i] / a)
+    keep = np.flatnonzero(row_nnz > 1)
+    return Aub[keep], bub[keep], lower, upper
+
+
+def apply(c, Aub, bub, Aeq, beq, parameters=None):
+    """
+    Gets the overall solution of the problem (solved by HiGHS, through SciPy)
+
+    Parameters
+    ------------
+    c
+        c parameter of the algorithm
+    Aub
+        A_ub parameter of the algorithm
+    bub
+        b_ub parameter of the algorithm
+    Aeq
+        A_eq parameter of the algorithm
+    beq
+        b_eq parameter of the algorithm
+    parameters
+        Possible parameters of the algorithm, including:
+            Parameters.REQUIRE_ILP => the variables are required to be integer (default: False)
+
+    Returns
+    -------------
+    sol
+        Solution of the LP problem by the given algorithm
+    """
+    return IncrementalProblem(c, Aub, bub, Aeq, parameters=parameters).solve(beq)
+
+
+class IncrementalProblem(object):
+    def __init__(self, c, Aub, bub, Aeq, parameters=None):
+        """
+        Builds (once) the sparse matrices of a problem whose equality constraints have a variable right-hand side,
+        which is provided to each call of the solve method
+
+        Parameters
+        ------------
+        c
+            c parameter of the algorithm
+        Aub
+            A_ub parameter of the algorithm
+        bub
+            b_ub parameter of the algorithm
+        Aeq
+            A_eq parameter of the algorithm
+        parameters
+            Possible parameters of the algorithm, including:
+                Parameters.REQUIRE_ILP => the variables are required to be integer (default: False)
+        """
+        if parameters is None:
+            parameters = {}
+
+        self.require_ilp = exec_utils.get_param_value(Parameters.REQUIRE_ILP, parameters, False)
+
+        self.c = to_vector(c)
+        self.Aub, self.bub, self.lower, self.upper = split_bounds(to_sparse(Aub, len(self.c)), to_vector(bub))
+        self.Aeq = to_sparse(Aeq, len(self.c))
+
+    def solve(self, beq):
+        """
+        Solves the problem with the provided right-hand side of the equality constraints
+
+        Parameters
+        ------------
+        beq
+            b_eq parameter of the algorithm
+
+        Returns
+        -------------
+        sol
+            Solution of the LP problem (None if the problem has no optimal solution)
+        """
+        beq = to_vector(beq)
+        if self.require_ilp:
+            constraints = []
+            if self.Aub.shape[0] > 0:
+                constraints.append(LinearConstraint(self.Aub, -np.inf, self.bub))
+            if self.Aeq.shape[0] > 0:
+                constraints.append(LinearConstraint(self.Aeq, beq, beq))
+            res = milp(self.c, constraints=constraints, integrality=np.ones(len(self.c)),
+                       bounds=Bounds(self.lower, self.upper))
+        else:
+            res = linprog(self.c, A_ub=self.Aub if self.Aub.shape[0] > 0 else None,
+                          b_ub=self.bub if self.Aub.shape[0] > 0 else None,
+                          A_eq=self.Aeq if self.Aeq.shape[0] > 0 else None,
+                          b_eq=beq if self.Aeq.shape[0] > 0 else None,
+                          bounds=np.column_stack([self.lower, self.upper]), method="highs")
+        if res.status != 0:
+            return None
+        points = res.x.tolist()
+        return {"c": self.c, "sol_value": float(res.fun), "points": points}
+
+
+def get_prim_obj_from_sol(sol, parameters=None):
+    """
+    Gets the primal objective from the solution of the LP problem
+
+    Parameters
+    -------------
+    sol
+        Solution of the ILP problem by the given algorithm
+    parameters
+        Possible parameters of the algorithm
+
+    Returns
+    -------------
+    prim_obj
+        Primal objective
+    """
+    if parameters is None:
+        parameters = {}
+
+    if sol is not None:
+        return sol["sol_value"]
+
+
+def get_points_from_sol(sol, parameters=None):
+    """
+    Gets the points from the solution
+
+    Parameters
+    -------------
+    sol
+        Solution of the LP problem by the given algorithm
+    parameters
+        Possible parameters of the algorithm
+
+    Returns
+    -------------
+    points
+        Point of the solution
+    """
+    if parameters is None:
+        parameters = {}
+
+    maximize = parameters["maximize"] if "maximize" in parameters else False
+    return_when_none = parameters["return_when_none"] if "return_when_none" in parameters else False
+    var_corr = parameters["var_corr"] if "var_corr" in parameters else {}
+
+    if sol is not None:
+        return sol["points"]
+    else:
+        if return_when_none:
+            if maximize:
+                return [sys.float_info.max] * len(list(var_corr.keys()))
+            return [sys.float_info.min] * len(list(var_corr.keys()))
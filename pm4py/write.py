@@ -15,8 +15,10 @@
     along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
 '''
 import warnings
+from typing import Union
 
 import deprecation
+import pandas as pd
 
 from pm4py.objects.bpmn.bpmn_graph import BPMN
 from pm4py.objects.log.log import EventLog
@@ -176,3 +178,23 @@ def write_bpmn(bpmn_graph: BPMN, file_path: str, enable_layout: bool = True):
         bpmn_graph = layouter.apply(bpmn_graph)
     from pm4py.objects.bpmn.exporter import exporter
     exporter.apply(bpmn_graph, file_path)
+
+
+def write_columnar(log: Union[EventLog, pd.DataFrame], file_path: str) -> None:
+    """
+    Exports a log (or a dataframe) in the columnar binary format: a directory containing the
+    dictionary-encoded columns as NumPy buffers, that are memory-mapped when the log is read (see read_columnar)
+
+    Parameters
+    --------------
+    log
+        Event log / Pandas dataframe
+    file_path
+        Destination path (directory)
+
+    Returns
+    -------------
+    void
+    """
+    from pm4py.objects.log.exporter.columnar import exporter as columnar_exporter
+    columnar_exporter.apply(log, file_path)
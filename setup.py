@@ -108,8 +108,11 @@ setup(
               'pm4py.objects.dfg.importer.variants', 'pm4py.objects.dfg.filtering', 'pm4py.objects.dfg.retrieval',
               'pm4py.objects.log', 'pm4py.objects.log.util', 'pm4py.objects.log.exporter',
               'pm4py.objects.log.exporter.xes', 'pm4py.objects.log.exporter.xes.util',
-              'pm4py.objects.log.exporter.xes.variants', 'pm4py.objects.log.importer', 'pm4py.objects.log.importer.xes',
-              'pm4py.objects.log.importer.xes.variants', 'pm4py.objects.bpmn', 'pm4py.objects.bpmn.util',
+              'pm4py.objects.log.exporter.xes.variants', 'pm4py.objects.log.exporter.columnar',
+              'pm4py.objects.log.exporter.columnar.variants', 'pm4py.objects.log.importer',
+              'pm4py.objects.log.importer.xes', 'pm4py.objects.log.importer.xes.variants',
+              'pm4py.objects.log.importer.columnar', 'pm4py.objects.log.importer.columnar.variants',
+              'pm4py.objects.bpmn', 'pm4py.objects.bpmn.util',
               'pm4py.objects.bpmn.layout', 'pm4py.objects.bpmn.layout.variants', 'pm4py.objects.bpmn.exporter',
               'pm4py.objects.bpmn.exporter.variants', 'pm4py.objects.bpmn.importer',
               'pm4py.objects.bpmn.importer.variants', 'pm4py.objects.trie', 'pm4py.objects.petri',
@@ -41,6 +41,48 @@ class AlgorithmTest(unittest.TestCase):
         from pm4py.algo.evaluation.precision import evaluator as precision_evaluator
         precision = precision_evaluator.apply(log, net, im, fm, variant=rp_fitness_evaluator.Variants.ALIGNMENT_BASED)
 
+    def test_precision_prefix_trie(self):
+        log = xes_importer.apply(os.path.join("input_data", "running-example.xes"))
+        from pm4py.algo.discovery.inductive import algorithm as inductive_miner
+        from pm4py.algo.evaluation.precision import evaluator as precision_evaluator
+        from pm4py.objects.log.log import EventLog
+        # the second model does not replay all the prefixes of the log
+        for net, im, fm in [inductive_miner.apply(log), inductive_miner.apply(EventLog(log[:2]))]:
+            expected = precision_evaluator.apply(log, net, im, fm,
+                                                 variant=precision_evaluator.Variants.ALIGN_ETCONFORMANCE)
+            precision = precision_evaluator.apply(log, net, im, fm,
+                                                  variant=precision_evaluator.Variants.ALIGN_ETCONFORMANCE_TRIE)
+            self.assertAlmostEqual(expected, precision)
+
+    def test_visible_transitions_closure_cache(self):
+        log = xes_importer.apply(os.path.join("input_data", "running-example.xes"))
+        from pm4py.algo.discovery.inductive import algorithm as inductive_miner
+        from pm4py.objects.petri import align_utils
+        from pm4py.objects.petri.petrinet import PetriNet
+        from pm4py.objects.petri.utils import add_arc_from_to
+        net, im, fm = inductive_miner.apply(log)
+        cache = align_utils.precompute_visible_transitions_eventually_enabled(net, im)
+        self.assertIn(im, cache)
+        expected = align_utils.get_visible_transitions_eventually_enabled_by_marking(net, im)
+        self.assertEqual(align_utils.get_visible_transitions_eventually_enabled_by_marking(net, im, use_cache=True),
+                         expected)
+        self.assertGreaterEqual(cache.get_statistics()["hits"], 1)
+        # least recently used markings are removed
+        cache = align_utils.get_visible_transitions_closure_cache(net, max_size=1)
+        self.assertEqual(cache.get_statistics()["size"], 1)
+        # changing the net empties the cache
+        trans = PetriNet.Transition("new_transition", None)
+        net.transitions.add(trans)
+        add_arc_from_to(list(im)[0], trans, net)
+        self.assertIsNot(align_utils.get_visible_transitions_closure_cache(net), cache)
+        # relabelling a transition empties the cache
+        cache = align_utils.get_visible_transitions_closure_cache(net)
+        cache.get(net, im)
+        list(expected)[0].label = None
+        self.assertIsNot(align_utils.get_visible_transitions_closure_cache(net), cache)
+        self.assertEqual(align_utils.get_visible_transitions_eventually_enabled_by_marking(net, im, use_cache=True),
+                         align_utils.get_visible_transitions_eventually_enabled_by_marking(net, im))
+
     def test_decomp_alignment(self):
         log = xes_importer.apply(os.path.join("input_data", "running-example.xes"))
         from pm4py.algo.discovery.alpha import algorithm as alpha_miner
@@ -65,6 +107,61 @@ class AlgorithmTest(unittest.TestCase):
         generalization = generalization_evaluation.apply(log, net, im, fm,
                                                          variant=generalization_evaluation.Variants.GENERALIZATION_TOKEN)
 
+    def test_tokenreplay_persistent_cache(self):
+        import sqlite3
+        import tempfile
+        from contextlib import closing
+        from unittest import mock
+        log = xes_importer.apply(os.path.join("input_data", "running-example.xes"))
+        from pm4py.algo.discovery.alpha import algorithm as alpha_miner
+        net, im, fm = alpha_miner.apply(log)
+        from pm4py.algo.conformance.tokenreplay import algorithm as token_replay
+        from pm4py.algo.conformance.tokenreplay import persistent_cache
+        from pm4py.algo.conformance.tokenreplay.variants.token_replay import Parameters
+        from pm4py.statistics.variants.log import get as variants_get
+        num_variants = len(variants_get.get_variants(log))
+        cache_files = []
+        for i in range(2):
+            cache_file = tempfile.NamedTemporaryFile(suffix=".sqlite", delete=False)
+            cache_file.close()
+            cache_files.append(cache_file.name)
+
+        def count_rows(path):
+            with closing(sqlite3.connect(path)) as connection:
+                return connection.execute("SELECT COUNT(*) FROM replay_cache").fetchone()[0]
+
+        # the results of the variants are persisted by the first replay
+        parameters = {Parameters.PERSISTENT_CACHE_PATH: cache_files[0]}
+        expected = token_replay.apply(log, net, im, fm, variant=token_replay.Variants.TOKEN_REPLAY)
+        first = token_replay.apply(log, net, im, fm, variant=token_replay.Variants.TOKEN_REPLAY, parameters=parameters)
+        self.assertEqual(count_rows(cache_files[0]), num_variants)
+        # the second replay (on a different, but identical, model object) is served from the cache
+        cache_get = persistent_cache.PersistentReplayCache.get
+        hits = []
+
+        def get(cache, variants):
+            results = cache_get(cache, variants)
+            hits.append(len(results))
+            return results
+
+        net2, im2, fm2 = alpha_miner.apply(log)
+        with mock.patch.object(persistent_cache.PersistentReplayCache, "get", get):
+            second = token_replay.apply(log, net2, im2, fm2, variant=token_replay.Variants.TOKEN_REPLAY,
+                                        parameters=parameters)
+        self.assertEqual(hits, [num_variants])
+        # the results of the replays exceeding the maximum execution time are not persisted
+        token_replay.apply(log, net, im, fm, variant=token_replay.Variants.TOKEN_REPLAY,
+                           parameters={Parameters.PERSISTENT_CACHE_PATH: cache_files[1],
+                                       Parameters.THREAD_MAX_EX_TIME: -1})
+        self.assertEqual(count_rows(cache_files[1]), 0)
+        for cache_file in cache_files:
+            os.remove(cache_file)
+        self.assertEqual([x["trace_fitness"] for x in expected], [x["trace_fitness"] for x in first])
+        self.assertEqual([x["trace_fitness"] for x in expected], [x["trace_fitness"] for x in second])
+        self.assertEqual([[t.name for t in x["activated_transitions"]] for x in expected],
+                         [[t.name for t in x["activated_transitions"]] for x in second])
+        self.assertTrue(all(t in net2.transitions for x in second for t in x["activated_transitions"]))
+
     def test_evaluation(self):
         log = xes_importer.apply(os.path.join("input_data", "running-example.xes"))
         from pm4py.algo.discovery.alpha import algorithm as alpha_miner
@@ -81,6 +178,27 @@ class AlgorithmTest(unittest.TestCase):
         from pm4py.algo.simulation.playout import simulator
         log2 = simulator.apply(net, im, fm)
 
+    def test_montecarlo_discrete_event(self):
+        log = xes_importer.apply(os.path.join("input_data", "running-example.xes"))
+        from pm4py.algo.discovery.inductive import algorithm as inductive_miner
+        net, im, fm = inductive_miner.apply(log)
+        from pm4py.algo.simulation.montecarlo import simulator as montecarlo_simulation
+        from pm4py.algo.simulation.montecarlo.parameters import Parameters
+        from pm4py.algo.simulation.montecarlo.outputs import Outputs
+        parameters = {Parameters.PARAM_NUM_SIMULATIONS: 50, Parameters.PARAM_SEED: 42,
+                      Parameters.PARAM_ENABLE_DIAGNOSTICS: False}
+        log1, res1 = montecarlo_simulation.apply(log, net, im, fm,
+                                                 variant=montecarlo_simulation.Variants.PETRI_DISCRETE_EVENT,
+                                                 parameters=parameters)
+        log2, res2 = montecarlo_simulation.apply(log, net, im, fm,
+                                                 variant=montecarlo_simulation.Variants.PETRI_DISCRETE_EVENT,
+                                                 parameters=parameters)
+        # the same seed gives the same simulation
+        self.assertEqual([[(e["concept:name"], e["time:timestamp"]) for e in t] for t in log1],
+                         [[(e["concept:name"], e["time:timestamp"]) for e in t] for t in log2])
+        self.assertEqual(res1[Outputs.OUTPUT_CASES_EX_TIME.value], res2[Outputs.OUTPUT_CASES_EX_TIME.value])
+        self.assertEqual(set(res1[Outputs.OUTPUT_PLACES_INTERVAL_TREES.value]), set(net.places))
+
     def test_tree_generation(self):
         from pm4py.algo.simulation.tree_generator import simulator as tree_simulator
         tree1 = tree_simulator.apply(variant=tree_simulator.Variants.BASIC)
@@ -111,6 +229,18 @@ class AlgorithmTest(unittest.TestCase):
         from pm4py.algo.discovery.inductive import algorithm as inductive_miner
         net, im, fm = inductive_miner.apply(log, variant=inductive_miner.Variants.IM)
 
+    def test_inductive_miner_clean_variants(self):
+        log = xes_importer.apply(os.path.join("input_data", "running-example.xes"))
+        from pm4py.algo.discovery.inductive.variants.im_clean import algorithm as im_clean
+        from pm4py.statistics.variants.log import get as variants_get
+        tree1 = im_clean.apply_tree(log)
+        tree2 = im_clean.apply_tree_variants(variants_get.get_variants(log))
+        self.assertEqual(str(tree1), str(tree2))
+        # the parallel recursion gives the same tree as the sequential one
+        tree3 = im_clean.apply_tree(log, parameters={im_clean.Parameters.CORES: 2,
+                                                     im_clean.Parameters.PARALLEL_MIN_VARIANTS: 1})
+        self.assertEqual(str(tree1), str(tree3))
+
     def test_performance_spectrum(self):
         log = xes_importer.apply(os.path.join("input_data", "running-example.xes"))
         from pm4py.statistics.performance_spectrum import algorithm as pspectrum
@@ -60,6 +60,111 @@ class AlignmentTest(unittest.TestCase):
         tree = pm4py.discover_process_tree_inductive(log, noise_threshold=0.2)
         al = pm4py.conformance_diagnostics_alignments(log, tree)
 
+    def test_alignment_multiprocessing(self):
+        log = xes_importer.apply(os.path.join(INPUT_DATA_DIR, "running-example.xes"))
+        net, marking, final_marking = inductive_miner.apply(log)
+        parameters = {align_alg.Parameters.SHOW_PROGRESS_BAR: False}
+        serial = align_alg.apply(log, net, marking, final_marking, parameters=parameters)
+        parameters[align_alg.Parameters.CORES] = 2
+        parameters[align_alg.Parameters.CHUNK_SIZE] = 1
+        parallel = align_alg.apply(log, net, marking, final_marking, parameters=parameters)
+        self.assertEqual([x["cost"] for x in serial], [x["cost"] for x in parallel])
+        self.assertEqual([x["fitness"] for x in serial], [x["fitness"] for x in parallel])
+        # the columnar event logs are sent to the processes as well
+        from pm4py.objects.conversion.log import converter
+        columnar_log = converter.apply(log, variant=converter.TO_COLUMNAR_EVENT_LOG)
+        parallel = align_alg.apply(columnar_log, net, marking, final_marking, parameters=parameters)
+        self.assertEqual([x["cost"] for x in serial], [x["cost"] for x in parallel])
+
+    def test_alignment_prefix_trie(self):
+        log = xes_importer.apply(os.path.join(INPUT_DATA_DIR, "running-example.xes"))
+        net, marking, final_marking = inductive_miner.apply(log)
+        parameters = {align_alg.Parameters.SHOW_PROGRESS_BAR: False}
+        expected = align_alg.apply(log, net, marking, final_marking, parameters=parameters)
+        aligned = align_alg.apply(log, net, marking, final_marking, parameters=parameters,
+                                  variant=align_alg.Variants.VERSION_DIJKSTRA_PREFIX_TRIE)
+        # the time budget is not written in the parameters of the caller
+        self.assertNotIn(align_alg.Parameters.PARAM_MAX_ALIGN_TIME, parameters)
+        self.assertEqual([x["cost"] for x in expected], [x["cost"] for x in aligned])
+        self.assertEqual([x["fitness"] for x in expected], [x["fitness"] for x in aligned])
+        for trace, align in zip(log, aligned):
+            self.assertEqual([x["concept:name"] for x in trace], [x[0] for x in align["alignment"] if x[0] != ">>"])
+
+    def test_alignment_heuristic_engine(self):
+        import numpy as np
+        from pm4py.objects.petri.heuristic_engine import StateEquationHeuristic
+        from pm4py.util.lp import solver as lp_solver
+        log = xes_importer.apply(os.path.join(INPUT_DATA_DIR, "reviewing.xes"))
+        net, marking, final_marking = inductive_miner.apply(log, variant=inductive_miner.Variants.IMf,
+                                                            parameters={"noise_threshold": 0.5})
+        parameters = {align_alg.Parameters.SHOW_PROGRESS_BAR: False}
+        expected = align_alg.apply(log, net, marking, final_marking, parameters=parameters,
+                                   variant=align_alg.Variants.VERSION_DIJKSTRA_PREFIX_TRIE)
+        aligned = align_alg.apply(log, net, marking, final_marking, parameters=parameters)
+        self.assertEqual([x["cost"] for x in expected], [x["cost"] for x in aligned])
+        self.assertTrue(all(x["lp_solved"] >= 1 and x["lp_time"] >= 0 for x in aligned))
+        # the problem kept by the engine gives the same optimum as a problem built from scratch
+        a_matrix = np.array([[-1, 0, 1], [1, -1, 0], [0, 1, -1]])
+        heuristic = StateEquationHeuristic(a_matrix, [0, 0, 1], [1, 2, 0])
+        for m_vec in [[1, 0, 0], [0, 1, 0], [0, 0, 1]]:
+            b_term = np.matrix([[f - m] for f, m in zip([0, 0, 1], m_vec)], dtype=np.float64)
+            sol = lp_solver.apply([1.0, 2.0, 0.0], -np.eye(3), np.matrix(np.zeros(3)).transpose(),
+                                  np.asmatrix(a_matrix).astype(np.float64), b_term)
+            self.assertAlmostEqual(heuristic.solve(m_vec)[0], lp_solver.get_prim_obj_from_sol(sol))
+        self.assertEqual(heuristic.get_statistics()["lp_solved"], 3)
+
+    def test_alignment_sync_product_template(self):
+        from pm4py.algo.conformance.alignments.variants import state_equation_a_star
+        from pm4py.objects.petri import align_utils, synchronous_product
+        from pm4py.objects.petri.utils import construct_trace_net
+        log = xes_importer.apply(os.path.join(INPUT_DATA_DIR, "running-example.xes"))
+        net, marking, final_marking = alpha_alg.apply(log)
+        parameters = {state_equation_a_star.Parameters.PARAM_ALIGNMENT_RESULT_IS_SYNC_PROD_AWARE: True}
+        for trace in log:
+            # the overlay on the template gives the same result as the synchronous product net
+            aligned = state_equation_a_star.apply(trace, net, marking, final_marking, parameters=parameters)
+            trace_net, trace_im, trace_fm = construct_trace_net(trace)
+            expected = state_equation_a_star.apply_trace_net(net, marking, final_marking, trace_net, trace_im,
+                                                             trace_fm)
+            self.assertEqual(aligned["cost"], expected["cost"])
+            self.assertEqual([x[1] for x in aligned["alignment"]], expected["alignment"])
+        model_costs = {t: align_utils.STD_MODEL_LOG_MOVE_COST if t.label is not None else align_utils.STD_TAU_COST
+                       for t in net.transitions}
+        sync_costs = {t: align_utils.STD_SYNC_COST for t in net.transitions if t.label is not None}
+        template = synchronous_product.construct_template(net, marking, final_marking, model_costs, sync_costs,
+                                                          align_utils.SKIP)
+        self.assertIs(template, synchronous_product.construct_template(net, marking, final_marking, model_costs,
+                                                                       sync_costs, align_utils.SKIP))
+        # relabelling a transition of the model invalidates the template
+        for t in net.transitions:
+            if t.label == "decide":
+                t.label = "zzz"
+        for trace in log:
+            aligned = state_equation_a_star.apply(trace, net, marking, final_marking)
+            trace_net, trace_im, trace_fm = construct_trace_net(trace)
+            expected = state_equation_a_star.apply_trace_net(net, marking, final_marking, trace_net, trace_im,
+                                                             trace_fm)
+            self.assertEqual(aligned["cost"], expected["cost"])
+        model_costs = {t: 1 for t in net.transitions}
+        self.assertIsNot(template, synchronous_product.construct_template(net, marking, final_marking, model_costs,
+                                                                          sync_costs, align_utils.SKIP))
+
+    def test_alignment_trace_cost_function(self):
+        from pm4py.algo.conformance.alignments.variants import state_equation_a_star
+        log = xes_importer.apply(os.path.join(INPUT_DATA_DIR, "running-example.xes"))
+        net, marking, final_marking = alpha_alg.apply(log)
+        # the same cost function (longer than the traces) is used for all the traces of the log
+        trace_cost_function = [7] * (max(len(trace) for trace in log) + 5)
+        parameters = {state_equation_a_star.Parameters.PARAM_TRACE_COST_FUNCTION: trace_cost_function}
+        aligned_traces = align_alg.apply_log(log, net, marking, final_marking, parameters=parameters)
+        for trace, aligned in zip(log, aligned_traces):
+            expected = state_equation_a_star.apply(trace, net, marking, final_marking, parameters={
+                state_equation_a_star.Parameters.PARAM_TRACE_COST_FUNCTION: [7] * len(trace)})
+            self.assertEqual(aligned["cost"], expected["cost"])
+        with self.assertRaises(Exception):
+            state_equation_a_star.apply(log[0], net, marking, final_marking, parameters={
+                state_equation_a_star.Parameters.PARAM_TRACE_COST_FUNCTION: [7]})
+
 
 if __name__ == "__main__":
     unittest.main()
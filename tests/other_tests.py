@@ -220,6 +220,333 @@ class OtherPartsTests(unittest.TestCase):
         df = pd.read_csv(os.path.join("input_data", "receipt.csv"))
         fea_df = dataframe_utils.automatic_feature_extraction_df(df)
 
+    def test_compiled_net_semantics(self):
+        from pm4py.objects.petri import compiled_net, semantics
+        log = xes_importer.apply(os.path.join("input_data", "running-example.xes"))
+        net, im, fm = inductive_miner.apply(log)
+        cnet = compiled_net.construct(net)
+        marking = im
+        encoded_marking = cnet.encode_marking(im)
+        for i in range(50):
+            enabled = semantics.enabled_transitions(net, marking)
+            encoded_enabled = cnet.enabled_transitions(encoded_marking)
+            self.assertEqual(enabled, {cnet.transitions[t] for t in encoded_enabled})
+            if not encoded_enabled:
+                break
+            t = encoded_enabled[i % len(encoded_enabled)]
+            marking = semantics.execute(cnet.transitions[t], net, marking)
+            encoded_marking = cnet.execute(t, encoded_marking)
+            self.assertEqual(marking, cnet.decode_marking(encoded_marking))
+
+    def test_columnar_event_log(self):
+        import pm4py
+        log = xes_importer.apply(os.path.join("input_data", "running-example.xes"))
+        columnar_log = converter.apply(log, variant=converter.TO_COLUMNAR_EVENT_LOG)
+        self.assertEqual(columnar_log, log)
+        self.assertEqual(variants_get.get_variants(columnar_log), variants_get.get_variants(log))
+        self.assertEqual(pm4py.discover_dfg(columnar_log), pm4py.discover_dfg(log))
+        columnar_log[0][0]["new_attribute"] = 1
+        self.assertEqual(columnar_log[0][0]["new_attribute"], 1)
+        self.assertFalse("new_attribute" in columnar_log[0][1])
+        # the changes to the list of events of a trace are kept by the log
+        from pm4py.objects.log.log import Event
+        self.assertFalse(columnar_log.is_materialized())
+        length = len(columnar_log[0])
+        columnar_log[0].append(Event({"concept:name": "appended"}))
+        columnar_log[0].insert(0, Event({"concept:name": "inserted"}))
+        self.assertTrue(columnar_log.is_materialized())
+        self.assertEqual(len(columnar_log[0]), length + 2)
+        self.assertEqual(columnar_log[0][0]["concept:name"], "inserted")
+        self.assertEqual(columnar_log[0][-1]["concept:name"], "appended")
+        self.assertEqual([trace for trace in columnar_log][0][-1]["concept:name"], "appended")
+        self.assertEqual(len(list(columnar_log)[0]), length + 2)
+        # the logs and the traces can be pickled (e.g. to be sent to a process pool), keeping the changed traces
+        import pickle
+        log2 = pickle.loads(pickle.dumps(columnar_log))
+        self.assertEqual(log2, columnar_log)
+        self.assertEqual(log2[0][-1]["concept:name"], "appended")
+        self.assertIs(log2[0], log2[0])
+        self.assertEqual(pickle.loads(pickle.dumps(columnar_log[1])), columnar_log[1])
+        df = pd.read_csv(os.path.join("input_data", "running-example.csv"))
+        df = dataframe_utils.convert_timestamp_columns_in_df(df)
+        self.assertEqual(converter.apply(df, variant=converter.TO_COLUMNAR_EVENT_LOG), converter.apply(df))
+
+    def test_columnar_binary_format(self):
+        import shutil
+        import tempfile
+        import pm4py
+        log = xes_importer.apply(os.path.join("input_data", "running-example.xes"))
+        path = tempfile.mkdtemp()
+        pm4py.write_columnar(log, path)
+        log2 = pm4py.read_columnar(path)
+        df = pm4py.read_columnar(path, return_dataframe=True)
+        shutil.rmtree(path)
+        self.assertEqual(log, log2)
+        self.assertEqual(len(df), sum(len(trace) for trace in log))
+        self.assertEqual(list(df["case:concept:name"].unique()), [trace.attributes["concept:name"] for trace in log])
+
+    def test_instrumentation(self):
+        from pm4py.util import instrumentation
+        from pm4py.algo.conformance.alignments import algorithm as alignments
+        log = xes_importer.apply(os.path.join("input_data", "running-example.xes"))
+        net, im, fm = inductive_miner.apply(log)
+        with instrumentation.instrument() as recorder:
+            aligned_traces = alignments.apply(log, net, im, fm,
+                                              parameters={alignments.Parameters.SHOW_PROGRESS_BAR: False})
+        self.assertFalse(instrumentation.is_enabled())
+        self.assertIn(alignments.Variants.VERSION_STATE_EQUATION_A_STAR.value.__name__ + ".apply",
+                      recorder.get_timers())
+        self.assertGreater(recorder.get_counters()["alignments.visited_states"], 0)
+        self.assertLessEqual(recorder.get_counters()["alignments.visited_states"],
+                             sum(x["visited_states"] for x in aligned_traces))
+        # while the instrumentation is enabled, the variants are proxies equal (but not identical) to the variants
+        from pm4py.util import exec_utils
+        from pm4py.algo.clustering.trace_attribute_driven import algorithm as clustering
+        variant = alignments.Variants.VERSION_STATE_EQUATION_A_STAR
+        self.assertIs(exec_utils.get_variant(variant), variant.value)
+        with instrumentation.instrument() as recorder:
+            self.assertIsNot(exec_utils.get_variant(variant), variant.value)
+            self.assertEqual(exec_utils.get_variant(variant), variant.value)
+            self.assertEqual(hash(exec_utils.get_variant(variant)), hash(variant.value))
+            # the variants that are functions are timed as well
+            function_variant = clustering.VARIANT_DMM_LEVEN
+            self.assertEqual(list(exec_utils.get_variant(function_variant)([], 0.5, 0.5)),
+                             list(function_variant([], 0.5, 0.5)))
+        self.assertIn(function_variant.__module__ + "." + function_variant.__name__, recorder.get_timers())
+
+    def test_ctmc_sparse(self):
+        from pm4py.objects.stochastic_petri import ctmc
+        log = xes_importer.apply(os.path.join("input_data", "running-example.xes"))
+        dfg_perf = dfg_discovery.apply(log, variant=dfg_discovery.Variants.PERFORMANCE)
+        parameters = {"start_activities": start_activities.get_start_activities(log),
+                      "end_activities": end_activities.get_end_activities(log)}
+        reach_graph, tang_reach_graph, stochastic_map, q_matrix = ctmc.get_tangible_reachability_and_q_matrix_from_dfg_performance(
+            dfg_perf, parameters=parameters)
+        sparse_q_matrix = ctmc.get_sparse_q_matrix_from_tangible_exponential(tang_reach_graph, stochastic_map)
+        self.assertAlmostEqual(abs(sparse_q_matrix.toarray() - q_matrix).max(), 0.0)
+        state = [x for x in tang_reach_graph.states if x.name == "source1"][0]
+        times = [172800.0, 3600.0]
+        dense_results = ctmc.transient_analysis_from_tangible_q_matrix_and_single_state(tang_reach_graph, q_matrix,
+                                                                                        state, times)
+        sparse_results = ctmc.transient_analysis_from_tangible_q_matrix_and_single_state(tang_reach_graph,
+                                                                                         sparse_q_matrix, state, times)
+        for dense_result, sparse_result in zip(dense_results, sparse_results):
+            for s in tang_reach_graph.states:
+                self.assertAlmostEqual(dense_result[s], sparse_result[s], places=6)
+        dense_steadystate = ctmc.perform_steadystate(q_matrix, tang_reach_graph)
+        sparse_steadystate = ctmc.perform_steadystate(sparse_q_matrix, tang_reach_graph)
+        self.assertAlmostEqual(abs(dense_steadystate - sparse_steadystate).max(), 0.0, places=6)
+
+    def test_activity_concurrent_variants(self):
+        from pm4py.objects.log.log import EventLog, Trace, Event
+        from pm4py.algo.discovery.inductive.variants.im_clean import variant_multiset
+        from pm4py.algo.discovery.inductive.variants.im_clean.fall_throughs import activity_concurrent
+        # 'x' is the only activity occurring in every trace
+        traces = [["a", "x", "b"], ["x", "c", "x"], ["b", "x", "a"], ["c", "a", "x"]]
+        log = EventLog([Trace([Event({"concept:name": a}) for a in t]) for t in traces])
+        activities, variants = variant_multiset.from_log(log, "concept:name")
+        alphabet = variant_multiset.get_alphabet(variants, activities)
+        for use_msd in [True, False]:
+            expected = activity_concurrent.detect(log, alphabet, "concept:name", use_msd)
+            self.assertEqual(expected, "x")
+            self.assertEqual(activity_concurrent.detect_variants(variants, alphabet, activities, use_msd), expected)
+        # 'x' and 'y' occur in every trace: the candidates are considered in the order of the alphabet
+        traces = [["a", "x", "y", "b"], ["y", "b", "x"], ["b", "x", "a", "y"], ["y", "b", "x"], ["x", "c", "y"]]
+        log = EventLog([Trace([Event({"concept:name": a}) for a in t]) for t in traces])
+        activities, variants = variant_multiset.from_log(log, "concept:name")
+        alphabet = variant_multiset.get_alphabet(variants, activities)
+        for use_msd in [True, False]:
+            expected = activity_concurrent.detect(log, alphabet, "concept:name", use_msd)
+            self.assertEqual(expected, "x")
+            self.assertEqual(activity_concurrent.detect_variants(variants, alphabet, activities, use_msd), expected)
+        # the loop cut found without 'd' depends on the order of the arcs of the DFG
+        traces = [["a", "d", "e", "c", "a", "a", "d"], ["a", "c", "a", "e", "e", "d"]]
+        log = EventLog([Trace([Event({"concept:name": a}) for a in t]) for t in traces])
+        activities, variants = variant_multiset.from_log(log, "concept:name")
+        alphabet = variant_multiset.get_alphabet(variants, activities)
+        self.assertEqual(activity_concurrent.detect(log, alphabet, "concept:name", False), "d")
+        self.assertEqual(activity_concurrent.detect_variants(variants, alphabet, activities, False), "d")
+        # every activity occurs once per trace: the same activity is returned by the activity-once-per-trace detection
+        from pm4py.algo.discovery.inductive.variants.im_clean.fall_throughs import activity_once_per_trace
+        traces = [["a", "b", "c", "d", "e"], ["e", "d", "c", "b", "a"], ["c", "a", "e", "b", "d"]]
+        log = EventLog([Trace([Event({"concept:name": a}) for a in t]) for t in traces])
+        activities, variants = variant_multiset.from_log(log, "concept:name")
+        alphabet = variant_multiset.get_alphabet(variants, activities)
+        self.assertEqual(activity_once_per_trace.detect_variants(variants, alphabet, activities),
+                         activity_once_per_trace.detect(log, alphabet, "concept:name"))
+
+    def test_live_event_stream_batches(self):
+        from pm4py.streaming.stream import live_event_stream
+        from pm4py.streaming.algo.discovery.dfg import algorithm as streaming_dfg
+        events = [{"case:concept:name": str(i % 10), "concept:name": "a%d" % (i // 10 % 3)} for i in range(3000)]
+        P = live_event_stream.Parameters
+        for policy in [live_event_stream.BackpressurePolicy.BLOCK, live_event_stream.BackpressurePolicy.DROP]:
+            stream = live_event_stream.LiveEventStream(parameters={
+                P.DELIVERY_MODE: live_event_stream.DeliveryMode.BATCH, P.MAX_QUEUE_SIZE: 50,
+                P.BACKPRESSURE_POLICY: policy, P.BATCH_SIZE: 20, P.LINGER_TIME: 0.001})
+            algo = streaming_dfg.apply()
+            stream.register(algo)
+            stream.start()
+            for event in events:
+                stream.append(event)
+            stream.stop()
+            dfg, activities, start_activities, end_activities = algo.get()
+            self.assertEqual(sum(activities.values()) + stream.dropped, len(events))
+            if policy == live_event_stream.BackpressurePolicy.BLOCK:
+                # the events are delivered in order
+                self.assertEqual(stream.dropped, 0)
+                self.assertEqual(dfg, {("a0", "a1"): 1000, ("a1", "a2"): 1000, ("a2", "a0"): 990})
+        # a queue smaller than the batch: the batch is delivered as soon as the queue is full, without lingering
+        import time
+        stream = live_event_stream.LiveEventStream(parameters={
+            P.DELIVERY_MODE: live_event_stream.DeliveryMode.BATCH, P.MAX_QUEUE_SIZE: 5, P.BATCH_SIZE: 100,
+            P.LINGER_TIME: 1.0})
+        algo = streaming_dfg.apply()
+        stream.register(algo)
+        stream.start()
+        start_time = time.time()
+        for event in events[:50]:
+            stream.append(event)
+        self.assertLess(time.time() - start_time, 1.0)
+        stream.stop()
+        self.assertEqual(sum(algo.get()[1].values()), 50)
+
+    def test_sharded_streaming_dfg(self):
+        import functools
+        from pm4py.streaming.algo import sharded
+        from pm4py.streaming.algo.discovery.dfg import algorithm as streaming_dfg
+        log = xes_importer.apply(os.path.join("input_data", "running-example.xes"))
+        events = [{"case:concept:name": t.attributes["concept:name"], "concept:name": e["concept:name"]} for t in log
+                  for e in t]
+        algo = streaming_dfg.apply()
+        sharded_algo = sharded.apply(streaming_dfg.apply, parameters={sharded.Parameters.NUM_SHARDS: 2,
+                                                                      sharded.Parameters.CHUNK_SIZE: 5})
+        for event in events:
+            algo.receive(event)
+        sharded_algo.receive_batch(events)
+        self.assertEqual(sharded_algo.get(), algo.get())
+        self.assertEqual(len(sharded_algo.call("get")), 2)
+        with self.assertRaises(Exception):
+            sharded_algo.call("not_a_method")
+        sharded_algo.close()
+        # the failure of the factory is reported, instead of blocking the sharded algorithm
+        failing_algo = sharded.apply(functools.partial(streaming_dfg.apply, variant=None),
+                                     parameters={sharded.Parameters.NUM_SHARDS: 2})
+        failing_algo.receive_batch(events)
+        self.assertIsNone(failing_algo.get())
+        with self.assertRaises(Exception):
+            failing_algo.call("get")
+        failing_algo.close()
+
+    def test_streaming_dfg_windowed_decayed(self):
+        from pm4py.streaming.algo.discovery.dfg import algorithm as streaming_dfg
+        events = [{"case:concept:name": str(i % 10), "concept:name": "a%d" % (i // 10 % 3)} for i in range(3000)]
+        windowed = streaming_dfg.apply(variant=streaming_dfg.Variants.WINDOWED,
+                                       parameters={streaming_dfg.Variants.WINDOWED.value.Parameters.WINDOW_SIZE: 100,
+                                                   streaming_dfg.Variants.WINDOWED.value.Parameters.NUM_BUCKETS: 10})
+        decayed = streaming_dfg.apply(variant=streaming_dfg.Variants.DECAYED,
+                                      parameters={streaming_dfg.Variants.DECAYED.value.Parameters.HALF_LIFE: 10})
+        windowed.receive_batch(events)
+        decayed.receive_batch(events)
+        dfg, activities, start_activities, end_activities = windowed.get()
+        # the window contains the last 100 events (the ten buckets are full)
+        self.assertEqual(sum(activities.values()), 100)
+        self.assertEqual(sum(dfg.values()), 100)
+        self.assertEqual(end_activities, {"a2": 10})
+        dfg, activities, start_activities, end_activities = decayed.get()
+        # the weight of an event halves every 10 events
+        expected = sum(0.5 ** ((len(events) - 1 - i) / 10) for i, e in enumerate(events) if e["concept:name"] == "a2")
+        self.assertAlmostEqual(activities["a2"], expected, places=6)
+
+    def test_streaming_checkpoint(self):
+        import tempfile
+        import shutil
+        from pm4py.streaming.algo import checkpoint
+        from pm4py.streaming.algo.discovery.dfg import algorithm as streaming_dfg
+        log = xes_importer.apply(os.path.join("input_data", "running-example.xes"))
+        events = [{"case:concept:name": t.attributes["concept:name"], "concept:name": e["concept:name"]} for t in log
+                  for e in t]
+        windowed_parameters = {streaming_dfg.Variants.WINDOWED.value.Parameters.WINDOW_SIZE: 10,
+                               streaming_dfg.Variants.WINDOWED.value.Parameters.NUM_BUCKETS: 5}
+        decayed_parameters = {streaming_dfg.Variants.DECAYED.value.Parameters.HALF_LIFE: 5}
+        for variant, variant_parameters in [(streaming_dfg.Variants.FREQUENCY, None),
+                                            (streaming_dfg.Variants.WINDOWED, windowed_parameters),
+                                            (streaming_dfg.Variants.DECAYED, decayed_parameters)]:
+            directory = tempfile.mkdtemp()
+            parameters = {checkpoint.Parameters.CHECKPOINT_DIR: directory, checkpoint.Parameters.CHECKPOINT_EVENTS: 7}
+            algo = checkpoint.apply(streaming_dfg.apply(variant=variant, parameters=variant_parameters),
+                                    parameters=parameters)
+            for event in events[:20]:
+                algo.receive(event)
+            expected = algo.get()
+            # a restarted process (the previous one is not closed) resumes from the snapshot and the write-ahead log
+            restarted = checkpoint.apply(streaming_dfg.apply(variant=variant, parameters=variant_parameters),
+                                         parameters=parameters)
+            self.assertEqual(restarted.get(), expected)
+            restarted.receive_batch(events[20:])
+            restarted.close()
+            reference = streaming_dfg.apply(variant=variant, parameters=variant_parameters)
+            reference.receive_batch(events)
+            self.assertGreater(len(reference.get()[0]), 0)
+            self.assertEqual(checkpoint.apply(streaming_dfg.apply(variant=variant, parameters=variant_parameters),
+                                              parameters=parameters).get(), reference.get())
+            shutil.rmtree(directory)
+        # the algorithms not exposing their state are rejected
+        from pm4py.streaming.util import event_stream_printer
+        with self.assertRaises(Exception):
+            checkpoint.apply(event_stream_printer.EventStreamPrinter(), parameters=parameters)
+
+    def test_streaming_tbr_case_eviction(self):
+        import time
+        from pm4py.algo.discovery.inductive import algorithm as inductive_miner
+        from pm4py.streaming.algo.conformance.tbr import algorithm as tbr_streaming
+        from pm4py.streaming.algo.conformance.tbr.variants.classic import Parameters
+        log = xes_importer.apply(os.path.join("input_data", "running-example.xes"))
+        net, im, fm = inductive_miner.apply(log)
+        evicted = []
+        conf = tbr_streaming.apply(net, im, fm, parameters={Parameters.MAX_OPEN_CASES: 2, Parameters.CASE_TTL: 0.5,
+                                                            Parameters.EVICTION_CALLBACK: lambda case, diagn: evicted.append((case, diagn["is_fit"]))})
+        for trace in log:
+            for event in trace:
+                conf.receive({"case:concept:name": trace.attributes["concept:name"], "concept:name": event["concept:name"]})
+        # only the two most recent cases are kept open
+        self.assertEqual([x[0] for x in evicted], [t.attributes["concept:name"] for t in log][:-2])
+        self.assertTrue(all(x[1] for x in evicted))
+        self.assertEqual(len(conf.get()), 2)
+        time.sleep(0.6)
+        conf.evict_expired()
+        self.assertEqual(len(evicted), len(log))
+        self.assertEqual(len(conf.get()), 0)
+
+    def test_business_hours(self):
+        import datetime
+        from pm4py.util import business_hours
+        st = datetime.datetime(2021, 1, 8, 16, 30)  # friday
+        et = datetime.datetime(2021, 1, 12, 8, 0)  # tuesday
+        self.assertEqual(business_hours.BusinessHours(st, et).getminutes(), 30 + 600 + 60)
+        self.assertEqual(business_hours.BusinessHours(st, et, holidays=["2021-01-11"]).getminutes(), 30 + 60)
+        seconds = business_hours.get_business_seconds([st, st], [et, st])
+        self.assertEqual(list(seconds), [(30 + 600 + 60) * 60, 0])
+
+    def test_lp_solver_scipy(self):
+        import numpy as np
+        from scipy import sparse
+        from pm4py.util.lp import solver
+        # min x0 + 2 x1 s.t. x0 + x1 >= 1.5, x0 = 1, x >= 0 (the constraints are provided as sparse matrices)
+        c = [1.0, 2.0, 0.0]
+        Aub = sparse.csr_matrix(np.vstack([[-1.0, -1.0, 0.0], -np.eye(3)]))
+        bub = np.array([-1.5, 0.0, 0.0, 0.0])
+        Aeq = sparse.csr_matrix([[1.0, 0.0, 0.0]])
+        sol = solver.apply(c, Aub, bub, Aeq, [1.0], variant=solver.SCIPY)
+        self.assertAlmostEqual(solver.get_prim_obj_from_sol(sol, variant=solver.SCIPY), 2.0)
+        sol = solver.apply(c, Aub, bub, Aeq, [1.0], variant=solver.SCIPY,
+                           parameters={solver.Parameters.REQUIRE_ILP: True})
+        self.assertAlmostEqual(solver.get_prim_obj_from_sol(sol, variant=solver.SCIPY), 3.0)
+        self.assertIsNone(solver.get_points_from_sol(None, variant=solver.SCIPY))
+        problem = solver.build_incremental(c, Aub, bub, Aeq, variant=solver.SCIPY)
+        self.assertAlmostEqual(solver.get_prim_obj_from_sol(problem.solve([2.0]), variant=solver.SCIPY), 2.0)
+        self.assertIsNone(problem.solve([-1.0]))
+
 
 if __name__ == "__main__":
     unittest.main()
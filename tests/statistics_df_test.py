@@ -43,6 +43,8 @@ class StatisticsDfTest(unittest.TestCase):
         case_statistics.get_variants_df_with_case_duration(df)
         case_statistics.get_variants_df_and_list(df)
         case_statistics.get_kde_caseduration(df)
+        case_statistics.get_cases_description(df, parameters={case_statistics.Parameters.BUSINESS_HOURS: True,
+                                                               case_statistics.Parameters.HOLIDAYS: ["2006-08-02"]})
 
     def test_variants(self):
         from pm4py.statistics.variants.pandas import get
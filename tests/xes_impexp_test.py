@@ -51,6 +51,20 @@ class XesImportExportTest(unittest.TestCase):
         log = xes_importer.apply(os.path.join(COMPRESSED_INPUT_DATA, "01_running-example.xes.gz"))
         del log
 
+    def test_importXESchunkedIterparse(self):
+        path = os.path.join(COMPRESSED_INPUT_DATA, "02_teleclaims.xes.gz")
+        log = xes_importer.apply(path, variant=xes_importer.Variants.ITERPARSE)
+        parameters = {xes_importer.Variants.CHUNKED_ITERPARSE.value.Parameters.CORES: 2,
+                      xes_importer.Variants.CHUNKED_ITERPARSE.value.Parameters.CHUNK_SIZE: 100000}
+        log_chunked = xes_importer.apply(path, variant=xes_importer.Variants.CHUNKED_ITERPARSE, parameters=parameters)
+        self.assertEqual(log, log_chunked)
+        # uncompressed file, split in more chunks than the ones parsed at the same time
+        path = os.path.join(INPUT_DATA_DIR, "running-example.xes")
+        log = xes_importer.apply(path, variant=xes_importer.Variants.ITERPARSE)
+        parameters[xes_importer.Variants.CHUNKED_ITERPARSE.value.Parameters.CHUNK_SIZE] = 1
+        log_chunked = xes_importer.apply(path, variant=xes_importer.Variants.CHUNKED_ITERPARSE, parameters=parameters)
+        self.assertEqual([[dict(e) for e in t] for t in log], [[dict(e) for e in t] for t in log_chunked])
+
 
 if __name__ == "__main__":
     unittest.main()